@@ -0,0 +1,49 @@
+import argparse
+import importlib
+import json
+
+from dataclass_sqlalchemy_mixins.base.index_advisor import advise_workload_indexes
+from dataclass_sqlalchemy_mixins.base.workload import load_workload
+
+
+def run(path, models_module, dialect="postgresql"):
+    module = importlib.import_module(models_module)
+    workload = list(load_workload(path))
+
+    models = {
+        workload_record.model: getattr(module, workload_record.model)
+        for workload_record in workload
+    }
+    return [
+        {
+            "table": suggestion.table,
+            "column": suggestion.column,
+            "issue": suggestion.issue.value,
+            "keys": suggestion.keys,
+            "ddl": suggestion.ddl,
+        }
+        for suggestion in advise_workload_indexes(
+            workload,
+            models=models,
+            dialect=dialect,
+        )
+    ]
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("path", help="File written by WorkloadRecorder")
+    parser.add_argument(
+        "--models",
+        default="benchmarks.models",
+        help="Module which recorded models are imported from",
+    )
+    parser.add_argument("--dialect", default="postgresql")
+    args = parser.parse_args()
+
+    print(
+        json.dumps(
+            run(path=args.path, models_module=args.models, dialect=args.dialect),
+            indent=2,
+        )
+    )
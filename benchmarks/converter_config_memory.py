@@ -0,0 +1,86 @@
+import argparse
+import gc
+import json
+import sys
+import tracemalloc
+from types import SimpleNamespace
+
+from benchmarks.dataclass_filters import (
+    FILTER_CLASSES,
+    TYPED_REQUEST_PARAMS,
+    make_dataclass,
+)
+from benchmarks.models import Item
+from benchmarks.pydantic_filters import REQUEST_PARAMS, ItemFilterModel
+from dataclass_sqlalchemy_mixins.base.mixins import (
+    CONVERTER_CONFIG_FIELDS,
+    SqlAlchemyFilterConverterMixin,
+)
+
+
+class ItemConverter(SqlAlchemyFilterConverterMixin):
+    class ConverterConfig:
+        model = Item
+
+
+class LegacyItemConverter(ItemConverter):
+    # Every instance copied ConverterConfig before it was resolved per class
+    def __init__(self):
+        super().__init__()
+        self.ConverterConfig = SimpleNamespace(
+            **{
+                field_name: getattr(self.__class__.ConverterConfig, field_name, None)
+                for field_name in CONVERTER_CONFIG_FIELDS
+            }
+        )
+
+
+class DictBase:
+    # Any base class without slots adds __dict__ to instances
+    pass
+
+
+def measure_bytes(factory, number):
+    gc.collect()
+    tracemalloc.start()
+    try:
+        instances = [factory() for _ in range(number)]
+        size = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+
+    # Memory of the list itself is not a part of instances
+    return (size - sys.getsizeof(instances)) / len(instances)
+
+
+def run(number=10000):
+    factories = {
+        "converter": ItemConverter,
+        "converter_legacy": LegacyItemConverter,
+        "pydantic": lambda: ItemFilterModel(**REQUEST_PARAMS),
+    }
+
+    for name, (filter_class, params) in FILTER_CLASSES.items():
+        if name != "pydantic":
+            factories[name] = lambda filter_class=filter_class, params=params: (
+                filter_class(**params)
+            )
+
+    if sys.version_info >= (3, 10):
+        legacy_dataclass = make_dataclass(slots=True, bases=(DictBase,))
+        factories["dataclass_slots_legacy"] = lambda: legacy_dataclass(
+            **TYPED_REQUEST_PARAMS
+        )
+
+    return {
+        f"{name}_bytes": measure_bytes(factory, number)
+        for name, factory in factories.items()
+    }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--number", type=int, default=10000)
+    args = parser.parse_args()
+
+    print(json.dumps(run(number=args.number), indent=2))
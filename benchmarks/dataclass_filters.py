@@ -0,0 +1,107 @@
+import argparse
+import dataclasses
+import json
+import sys
+import timeit
+import typing as tp
+
+from benchmarks.models import Item
+from benchmarks.pydantic_filters import (
+    LIST_AS_STRING_FIELDS,
+    REQUEST_PARAMS,
+    ItemFilterModel,
+)
+from dataclass_sqlalchemy_mixins.base.parsers import LIST_AS_STRING
+from dataclass_sqlalchemy_mixins.dataclass_mixins.sqlalchemy_base_dataclasses import (
+    SqlAlchemyFilterBaseDataclass,
+)
+
+
+# Dataclasses are not validated, so values which pydantic
+# converts from query params are passed already converted
+TYPED_REQUEST_PARAMS = {
+    **REQUEST_PARAMS,
+    "name__isnull": False,
+    "number": 1,
+    "number__not": 2,
+    "number__gt": 0,
+    "number__gte": 1,
+    "number__lt": 100,
+    "number__lte": 99,
+    "id__gt": 0,
+    "id__lt": 1000,
+    "group_id": 1,
+}
+
+
+class ItemFilterConverterConfig:
+    model = Item
+    extra = {
+        LIST_AS_STRING: {
+            "fields": LIST_AS_STRING_FIELDS,
+            "expected_types": {
+                "number__in": int,
+                "number__not_in": int,
+                "id__in": int,
+                "group_id__in": int,
+            },
+        }
+    }
+
+
+def make_dataclass(bases=(), **params):
+    # The same fields as in ItemFilterModel
+    return dataclasses.make_dataclass(
+        "ItemFilterDataclass",
+        [
+            (field_name, tp.Optional[tp.Any], dataclasses.field(default=None))
+            for field_name in REQUEST_PARAMS
+        ],
+        bases=(SqlAlchemyFilterBaseDataclass, *bases),
+        namespace={"ConverterConfig": ItemFilterConverterConfig},
+        **params,
+    )
+
+
+FILTER_CLASSES = {
+    "pydantic": (ItemFilterModel, REQUEST_PARAMS),
+    "dataclass": (make_dataclass(), TYPED_REQUEST_PARAMS),
+}
+
+if sys.version_info >= (3, 10):
+    FILTER_CLASSES["dataclass_slots"] = (
+        make_dataclass(slots=True),
+        TYPED_REQUEST_PARAMS,
+    )
+
+
+def measure_us(function, number):
+    return min(timeit.repeat(function, number=number, repeat=3)) / number * 10**6
+
+
+def run(number=10000):
+    results = {"fields_number": len(REQUEST_PARAMS)}
+
+    for name, (filter_class, params) in FILTER_CLASSES.items():
+        filter_instance = filter_class(**params)
+
+        results[name] = {
+            # Per request work: a filter instance is created from query params
+            "construct_us": measure_us(lambda: filter_class(**params), number),
+            "to_binary_expressions_us": measure_us(
+                filter_instance.to_binary_expressions, number
+            ),
+            "request_us": measure_us(
+                lambda: filter_class(**params).to_binary_expressions(), number
+            ),
+        }
+
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--number", type=int, default=10000)
+    args = parser.parse_args()
+
+    print(json.dumps(run(number=args.number), indent=2))
@@ -0,0 +1,108 @@
+import argparse
+import json
+import random
+import time
+
+from sqlalchemy import select
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.engine.default import DefaultDialect
+
+from benchmarks.models import Item
+from dataclass_sqlalchemy_mixins.base.converter import SqlAlchemyConverter
+from dataclass_sqlalchemy_mixins.base.in_lists import InOverflow, InStrategy
+
+
+VALUES_NUMBERS = (10, 1000, 50000)
+
+CONVERTERS = {
+    "expanding": SqlAlchemyConverter(model=Item),
+    "any_array": SqlAlchemyConverter(model=Item, in_strategy=InStrategy.ANY_ARRAY),
+    "expanding_chunk_1000": SqlAlchemyConverter(
+        model=Item,
+        in_max_size=1000,
+        in_overflow=InOverflow.CHUNK,
+    ),
+}
+
+
+def build_query(converter, values):
+    return converter.apply_filters(query=select(Item), filters={"id__in": values})
+
+
+def bench_compile(converter, values, repeat):
+    dialect = postgresql.dialect()
+    timings = []
+
+    for _ in range(repeat):
+        started = time.perf_counter()
+        build_query(converter, values).compile(
+            dialect=dialect,
+            compile_kwargs={"render_postcompile": True},
+        )
+        timings.append(time.perf_counter() - started)
+
+    return min(timings)
+
+
+def bench_statement_cache(converter, values_number, queries_number):
+    # Lists of different lengths up to values_number are compiled
+    # through the same compiled cache an Engine uses
+    dialect = postgresql.dialect()
+    compiled_cache = {}
+    cache_hits = 0
+    final_statements = set()
+
+    for _ in range(queries_number):
+        query = build_query(converter, list(range(random.randint(1, values_number))))
+
+        _, _, cache_stats = query._compile_w_cache(
+            dialect,
+            compiled_cache=compiled_cache,
+            column_keys=[],
+        )
+        cache_hits += cache_stats == DefaultDialect.CACHE_HIT
+
+        # Statement which is sent to a database after expanding parameters
+        final_statements.add(
+            str(
+                query.compile(
+                    dialect=dialect,
+                    compile_kwargs={"render_postcompile": True},
+                )
+            )
+        )
+
+    return cache_hits / queries_number, len(final_statements)
+
+
+def run(repeat=5, queries_number=50):
+    results = []
+
+    for strategy, converter in CONVERTERS.items():
+        for values_number in VALUES_NUMBERS:
+            values = list(range(values_number))
+            cache_hit_rate, final_statements = bench_statement_cache(
+                converter,
+                values_number,
+                queries_number,
+            )
+            results.append(
+                {
+                    "strategy": strategy,
+                    "values_number": values_number,
+                    "compile_seconds": bench_compile(converter, values, repeat),
+                    "cache_hit_rate": cache_hit_rate,
+                    "final_statements": final_statements,
+                }
+            )
+
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--queries", type=int, default=50)
+    args = parser.parse_args()
+
+    print(json.dumps(run(repeat=args.repeat, queries_number=args.queries), indent=2))
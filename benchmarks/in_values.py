@@ -0,0 +1,106 @@
+import argparse
+import json
+import random
+import time
+
+from sqlalchemy import create_engine, event, insert, select
+from sqlalchemy.exc import DBAPIError
+
+from benchmarks.models import BaseModel, Item
+from dataclass_sqlalchemy_mixins.base.converter import SqlAlchemyConverter
+from dataclass_sqlalchemy_mixins.base.in_lists import InStrategy
+
+
+VALUES_NUMBERS = (1000, 10000, 30000, 100000)
+
+CONVERTERS = {
+    "in": SqlAlchemyConverter(model=Item),
+    "values": SqlAlchemyConverter(model=Item, in_strategy=InStrategy.VALUES),
+}
+
+EXPLAIN_PREFIXES = {
+    "sqlite": "EXPLAIN QUERY PLAN ",
+    "postgresql": "EXPLAIN ",
+}
+
+
+def create_items(engine, rows_number):
+    BaseModel.metadata.drop_all(engine)
+    BaseModel.metadata.create_all(engine)
+
+    with engine.begin() as conn:
+        conn.execute(
+            insert(Item),
+            [{"id": i, "name": f"item_{i}", "number": i} for i in range(rows_number)],
+        )
+
+
+def bench_query(engine, converter, values):
+    query = converter.apply_filters(
+        query=select(Item.id),
+        filters={"id__in": values},
+    )
+    executed = {}
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, many):
+        executed["statement"] = statement
+        executed["parameters"] = parameters
+
+    event.listen(engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        with engine.connect() as conn:
+            started = time.perf_counter()
+            rows_number = len(conn.execute(query).all())
+            execute_seconds = time.perf_counter() - started
+
+            # Statement is only parsed and planned by a database
+            cursor = conn.connection.cursor()
+            started = time.perf_counter()
+            cursor.execute(
+                EXPLAIN_PREFIXES[engine.dialect.name] + executed["statement"],
+                executed["parameters"],
+            )
+            cursor.fetchall()
+            plan_seconds = time.perf_counter() - started
+            cursor.close()
+    finally:
+        event.remove(engine, "before_cursor_execute", before_cursor_execute)
+
+    return {
+        "sql_length": len(executed["statement"]),
+        "plan_seconds": plan_seconds,
+        "execute_seconds": execute_seconds,
+        "rows_number": rows_number,
+    }
+
+
+def run(url="sqlite://", rows_number=200000):
+    engine = create_engine(url)
+    create_items(engine, rows_number)
+
+    results = []
+
+    for values_number in VALUES_NUMBERS:
+        values = random.sample(range(max(rows_number, values_number)), values_number)
+
+        for strategy, converter in CONVERTERS.items():
+            result = {"strategy": strategy, "values_number": values_number}
+            try:
+                result.update(bench_query(engine, converter, values))
+            except DBAPIError as e:
+                # SQLite limits the number of parameters of a statement
+                result["error"] = str(e.orig)
+            results.append(result)
+
+    BaseModel.metadata.drop_all(engine)
+    engine.dispose()
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--url", default="sqlite://")
+    parser.add_argument("--rows", type=int, default=200000)
+    args = parser.parse_args()
+
+    print(json.dumps(run(url=args.url, rows_number=args.rows), indent=2))
@@ -0,0 +1,74 @@
+import sqlalchemy as sa
+from sqlalchemy.orm import declarative_base, relationship
+
+
+BaseModel = declarative_base()
+
+
+class Country(BaseModel):
+    __tablename__ = "country"
+
+    id = sa.Column(sa.Integer, primary_key=True)
+    name = sa.Column(sa.String)
+
+
+class Company(BaseModel):
+    __tablename__ = "company"
+
+    id = sa.Column(sa.Integer, primary_key=True)
+    name = sa.Column(sa.String)
+    country_id = sa.Column(sa.Integer, sa.ForeignKey(Country.id))
+
+    country = relationship(Country, backref="companies")
+
+
+class Owner(BaseModel):
+    __tablename__ = "owner"
+
+    id = sa.Column(sa.Integer, primary_key=True)
+    name = sa.Column(sa.String)
+    company_id = sa.Column(sa.Integer, sa.ForeignKey(Company.id))
+
+    company = relationship(Company, backref="owners")
+
+
+class Group(BaseModel):
+    __tablename__ = "group"
+
+    id = sa.Column(sa.Integer, primary_key=True)
+    name = sa.Column(sa.String)
+    owner_id = sa.Column(sa.Integer, sa.ForeignKey(Owner.id))
+
+    owner = relationship(Owner, backref="groups")
+
+
+class Item(BaseModel):
+    __tablename__ = "item"
+
+    id = sa.Column(sa.Integer, primary_key=True)
+    name = sa.Column(sa.String)
+    number = sa.Column(sa.Integer)
+    group_id = sa.Column(sa.Integer, sa.ForeignKey(Group.id))
+
+    group = relationship(Group, backref="items")
+
+
+CHAIN_LENGTH = 21
+
+
+def _create_chain_model(index):
+    # Chain{index}.next refers to Chain{index + 1}
+    attrs = {
+        "__tablename__": f"chain_{index}",
+        "id": sa.Column(sa.Integer, primary_key=True),
+        "name": sa.Column(sa.String),
+    }
+    if index + 1 < CHAIN_LENGTH:
+        attrs["next_id"] = sa.Column(sa.Integer, sa.ForeignKey(f"chain_{index + 1}.id"))
+        attrs["next"] = relationship(f"Chain{index + 1}")
+
+    return type(f"Chain{index}", (BaseModel,), attrs)
+
+
+# Models used to build queries with up to CHAIN_LENGTH - 1 joins
+CHAIN_MODELS = [_create_chain_model(index) for index in range(CHAIN_LENGTH)]
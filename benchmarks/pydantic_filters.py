@@ -0,0 +1,141 @@
+import argparse
+import json
+import timeit
+import typing as tp
+import warnings
+
+import pydantic
+from sqlalchemy import select
+
+from benchmarks.models import Item
+from dataclass_sqlalchemy_mixins.pydantic_mixins.sqlalchemy_base_models import (
+    BaseModelConverterExtraParams,
+    SqlAlchemyFilterBaseModel,
+)
+
+
+LIST_AS_STRING_FIELDS = (
+    "name__in",
+    "name__not_in",
+    "number__in",
+    "number__not_in",
+    "id__in",
+    "group_id__in",
+)
+
+
+class ItemFilterModel(SqlAlchemyFilterBaseModel):
+    name: tp.Optional[str] = None
+    name__not: tp.Optional[str] = None
+    name__like: tp.Optional[str] = None
+    name__ilike: tp.Optional[str] = None
+    name__in: tp.Optional[str] = None
+    name__not_in: tp.Optional[str] = None
+    name__isnull: tp.Optional[bool] = None
+    number: tp.Optional[int] = None
+    number__not: tp.Optional[int] = None
+    number__gt: tp.Optional[int] = None
+    number__gte: tp.Optional[int] = None
+    number__lt: tp.Optional[int] = None
+    number__lte: tp.Optional[int] = None
+    number__in: tp.Optional[str] = None
+    number__not_in: tp.Optional[str] = None
+    id__gt: tp.Optional[int] = None
+    id__lt: tp.Optional[int] = None
+    id__in: tp.Optional[str] = None
+    group_id: tp.Optional[int] = None
+    group_id__in: tp.Optional[str] = None
+
+    class ConverterConfig:
+        model = Item
+        extra = {
+            BaseModelConverterExtraParams.LIST_AS_STRING: {
+                "fields": LIST_AS_STRING_FIELDS,
+                "expected_types": {
+                    "number__in": int,
+                    "number__not_in": int,
+                    "id__in": int,
+                    "group_id__in": int,
+                },
+            }
+        }
+
+
+# Query parameters of a request which sets every filter
+REQUEST_PARAMS = {
+    "name": "item",
+    "name__not": "other",
+    "name__like": "item%",
+    "name__ilike": "ITEM%",
+    "name__in": "item_1, item_2, item_3",
+    "name__not_in": "item_4, item_5",
+    "name__isnull": "false",
+    "number": "1",
+    "number__not": "2",
+    "number__gt": "0",
+    "number__gte": "1",
+    "number__lt": "100",
+    "number__lte": "99",
+    "number__in": "1, 2, 3",
+    "number__not_in": "4, 5",
+    "id__gt": "0",
+    "id__lt": "1000",
+    "id__in": "1, 2, 3",
+    "group_id": "1",
+    "group_id__in": "1, 2",
+}
+
+
+def to_dict():
+    return ItemFilterModel(**REQUEST_PARAMS)._to_dict(exclude_none=True)
+
+
+def legacy_to_dict():
+    # Conversion used before the pydantic v2 native path:
+    # v1 style dict() and a walk over ConverterConfig.extra on every call
+    filter_model = ItemFilterModel(**REQUEST_PARAMS)
+    dict_values = filter_model.dict(exclude_none=True)
+
+    for key, value in filter_model.ConverterConfig.extra.items():
+        if key == BaseModelConverterExtraParams.LIST_AS_STRING:
+            fields = value.get("fields")
+            expected_types = value.get("expected_types")
+
+            for dict_key, dict_value in dict_values.items():
+                if dict_key in fields:
+                    expected_type = expected_types.get(dict_key, str)
+                    value = list(map(str.strip, dict_value.split(",")))
+                    dict_values[dict_key] = list(map(expected_type, value))
+    return dict_values
+
+
+def apply_filters():
+    return ItemFilterModel(**REQUEST_PARAMS).apply_filters(query=select(Item))
+
+
+def measure_us(function, number):
+    return min(timeit.repeat(function, number=number, repeat=3)) / number * 10**6
+
+
+def run(number=10000):
+    results = {
+        "pydantic_version": pydantic.VERSION,
+        "fields_number": len(REQUEST_PARAMS),
+        "to_dict_us": measure_us(to_dict, number),
+        "apply_filters_us": measure_us(apply_filters, number),
+    }
+
+    with warnings.catch_warnings():
+        # v1 style dict() goes through the deprecation shim of pydantic v2
+        warnings.simplefilter("ignore")
+        results["legacy_to_dict_us"] = measure_us(legacy_to_dict, number)
+
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--number", type=int, default=10000)
+    args = parser.parse_args()
+
+    print(json.dumps(run(number=args.number), indent=2))
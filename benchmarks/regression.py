@@ -0,0 +1,239 @@
+import argparse
+import json
+import pathlib
+import sys
+import timeit
+
+import sqlalchemy
+from sqlalchemy import select
+
+from benchmarks.models import Company, Country, Group, Item, Owner
+from dataclass_sqlalchemy_mixins.base import utils
+
+
+BASELINE_PATH = pathlib.Path(__file__).with_name("baseline.json")
+
+# Thresholds written by --update-baseline are measured values with margins
+# so a gate is not failed by a noise of a machine.
+# Absolute times depend on a machine more than ratios do
+RATIO_MARGIN = 1.5
+TIME_MARGIN = 3.0
+
+
+def flat_filters_raw():
+    return select(Item).where(
+        Item.name == "item_1",
+        Item.number >= 10,
+        Item.number < 1000,
+        Item.id.in_([1, 2, 3]),
+    )
+
+
+def flat_filters_library():
+    return utils.apply_filters(
+        query=select(Item),
+        filters={
+            "name": "item_1",
+            "number__gte": 10,
+            "number__lt": 1000,
+            "id__in": [1, 2, 3],
+        },
+        model=Item,
+    )
+
+
+def nested_filters_raw():
+    return (
+        select(Item)
+        .join(Item.group)
+        .join(Group.owner)
+        .join(Owner.company)
+        .join(Company.country)
+        .where(
+            Group.name == "group_1",
+            Owner.name.like("owner%"),
+            Country.name == "country_1",
+        )
+    )
+
+
+def nested_filters_library():
+    return utils.apply_filters(
+        query=select(Item),
+        filters={
+            "group__name": "group_1",
+            "group__owner__name__like": "owner%",
+            "group__owner__company__country__name": "country_1",
+        },
+        model=Item,
+    )
+
+
+def flat_order_by_raw():
+    return select(Item).order_by(Item.number.desc(), Item.name.asc())
+
+
+def flat_order_by_library():
+    return utils.apply_order_by(
+        query=select(Item),
+        order_by=["-number", "name"],
+        model=Item,
+    )
+
+
+def nested_order_by_raw():
+    return (
+        select(Item)
+        .join(Item.group)
+        .join(Group.owner)
+        .order_by(Owner.name.asc(), Group.name.desc())
+    )
+
+
+def nested_order_by_library():
+    return utils.apply_order_by(
+        query=select(Item),
+        order_by=["group__owner__name", "-group__name"],
+        model=Item,
+    )
+
+
+def query_spec_raw():
+    return (
+        select(Item)
+        .join(Item.group)
+        .join(Group.owner)
+        .where(Item.number >= 10, Owner.name == "owner_1")
+        .order_by(Group.name.asc())
+        .limit(10)
+        .offset(20)
+    )
+
+
+def query_spec_library():
+    return utils.apply_query_spec(
+        query=select(Item),
+        filters={"number__gte": 10, "group__owner__name": "owner_1"},
+        order_by=["group__name"],
+        limit=10,
+        offset=20,
+        model=Item,
+    )
+
+
+# Every scenario builds the same query by hand and using the library
+SCENARIOS = {
+    "flat_filters": (flat_filters_raw, flat_filters_library),
+    "nested_filters": (nested_filters_raw, nested_filters_library),
+    "flat_order_by": (flat_order_by_raw, flat_order_by_library),
+    "nested_order_by": (nested_order_by_raw, nested_order_by_library),
+    "query_spec": (query_spec_raw, query_spec_library),
+}
+
+
+def measure_us(function, number, repeat=5):
+    return min(timeit.repeat(function, number=number, repeat=repeat)) / number * 10**6
+
+
+def run(number=2000):
+    results = {}
+
+    for name, (build_raw, build_library) in SCENARIOS.items():
+        raw_us = measure_us(build_raw, number)
+        library_us = measure_us(build_library, number)
+
+        results[name] = {
+            "raw_us": raw_us,
+            "library_us": library_us,
+            "ratio": library_us / raw_us,
+            # Both queries are expected to render the same SQL
+            "same_sql": str(build_raw()) == str(build_library()),
+        }
+
+    return results
+
+
+def check_sql(results):
+    # Ratios are meaningless when the library builds another query
+    return [
+        f"{name}: raw and library queries render different SQL"
+        for name, result in results.items()
+        if not result["same_sql"]
+    ]
+
+
+def check(results, baseline):
+    failures = check_sql(results)
+
+    for name, result in results.items():
+        thresholds = baseline.get(name)
+        if thresholds is None:
+            failures.append(f"{name}: no thresholds in a baseline")
+            continue
+
+        if result["ratio"] > thresholds["max_ratio"]:
+            failures.append(
+                f"{name}: ratio {result['ratio']:.2f} "
+                f"is greater than {thresholds['max_ratio']:.2f}"
+            )
+        if result["library_us"] > thresholds["max_library_us"]:
+            failures.append(
+                f"{name}: library time {result['library_us']:.1f}us "
+                f"is greater than {thresholds['max_library_us']:.1f}us"
+            )
+
+    return failures
+
+
+def get_baseline_key():
+    # Overhead of the library differs between sqlalchemy versions
+    # so thresholds are stored for every major version
+    return ".".join(sqlalchemy.__version__.split(".")[:2])
+
+
+def get_baseline(results):
+    return {
+        name: {
+            "max_ratio": round(result["ratio"] * RATIO_MARGIN, 2),
+            "max_library_us": round(result["library_us"] * TIME_MARGIN, 1),
+        }
+        for name, result in results.items()
+    }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--number", type=int, default=2000)
+    parser.add_argument("--baseline", type=pathlib.Path, default=BASELINE_PATH)
+    parser.add_argument(
+        "--update-baseline",
+        action="store_true",
+        help="Write thresholds measured on this machine instead of checking them",
+    )
+    args = parser.parse_args()
+
+    results = run(number=args.number)
+    baseline_key = get_baseline_key()
+
+    baselines = {}
+    if args.baseline.exists():
+        with open(args.baseline) as file:
+            baselines = json.load(file)
+
+    if args.update_baseline:
+        failures = check_sql(results)
+
+        if not failures:
+            baselines[baseline_key] = get_baseline(results)
+
+            with open(args.baseline, "w") as file:
+                file.write(json.dumps(baselines, indent=2, sort_keys=True) + "\n")
+    elif baseline_key not in baselines:
+        failures = [f"No baseline for sqlalchemy {baseline_key}"]
+    else:
+        failures = check(results, baselines[baseline_key])
+
+    print(json.dumps({"results": results, "failures": failures}, indent=2))
+
+    if failures:
+        sys.exit(1)
@@ -0,0 +1,245 @@
+import argparse
+import collections
+import datetime
+import decimal
+import importlib
+import json
+import random
+import time
+import uuid
+
+from sqlalchemy import create_engine, insert, select
+from sqlalchemy.orm import Session
+
+from dataclass_sqlalchemy_mixins.base import utils
+from dataclass_sqlalchemy_mixins.base.converter import get_converter
+from dataclass_sqlalchemy_mixins.base.mixins import SQLALCHEMY_OP_MATCHER
+from dataclass_sqlalchemy_mixins.base.tracing import get_percentile
+from dataclass_sqlalchemy_mixins.base.workload import WorkloadKind, load_workload
+
+
+DATETIME_START = datetime.datetime(2020, 1, 1)
+
+# Values are generated in a range depending on a number of rows
+# so filters match some of generated rows
+VALUE_GENERATORS = {
+    int: lambda rng, rows: rng.randint(1, rows),
+    float: lambda rng, rows: rng.random() * rows,
+    decimal.Decimal: lambda rng, rows: decimal.Decimal(rng.randint(1, rows)),
+    str: lambda rng, rows: f"value_{rng.randint(1, rows)}",
+    bool: lambda rng, rows: rng.random() < 0.5,
+    datetime.datetime: lambda rng, rows: (
+        DATETIME_START + datetime.timedelta(minutes=rng.randint(1, rows))
+    ),
+    datetime.date: lambda rng, rows: (
+        DATETIME_START.date() + datetime.timedelta(days=rng.randint(1, rows))
+    ),
+    uuid.UUID: lambda rng, rows: uuid.UUID(int=rng.getrandbits(128)),
+}
+
+
+def generate_value(column_type, rng, rows):
+    enums = getattr(column_type, "enums", None)
+    if enums:
+        return rng.choice(enums)
+
+    try:
+        python_type = column_type.python_type
+    except NotImplementedError:
+        python_type = str
+
+    generator = VALUE_GENERATORS.get(python_type, VALUE_GENERATORS[str])
+    return generator(rng, rows)
+
+
+def generate_filter_value(column, filter_shape, rng, rows):
+    if filter_shape.op in ("in", "not_in"):
+        return [
+            generate_value(column.type, rng, rows)
+            for _ in range(filter_shape.size or 1)
+        ]
+    if filter_shape.op == "isnull":
+        return rng.random() < 0.5
+    if filter_shape.op in ("is", "is_not"):
+        return None
+    if filter_shape.op in ("like", "ilike"):
+        return f"value_{rng.randint(1, 9)}%"
+    return generate_value(column.type, rng, rows)
+
+
+def get_filter_column(model, filter_shape):
+    path = filter_shape.key.split("__")
+    if path[-1] in SQLALCHEMY_OP_MATCHER:
+        path = path[:-1]
+
+    _, column = get_converter(model).get_foreign_key_path(
+        models_path_to_look=path,
+        model=model,
+    )
+    return column
+
+
+def is_memory_database(engine):
+    # In-memory SQLite databases are empty, so nothing is dropped there
+    return engine.url.get_backend_name() == "sqlite" and engine.url.database in (
+        None,
+        "",
+        ":memory:",
+    )
+
+
+def create_rows(engine, metadata, rows, rng):
+    metadata.drop_all(engine)
+    metadata.create_all(engine)
+
+    with engine.begin() as conn:
+        for table in metadata.sorted_tables:
+            table_rows = []
+
+            for row_id in range(1, rows + 1):
+                row = {}
+                for column in table.columns:
+                    if column.primary_key and column.type.python_type is int:
+                        row[column.name] = row_id
+                    elif column.foreign_keys:
+                        # Tables of foreign keys have the same ids
+                        row[column.name] = rng.randint(1, rows)
+                    else:
+                        row[column.name] = generate_value(column.type, rng, rows)
+                table_rows.append(row)
+
+            conn.execute(insert(table), table_rows)
+
+
+def build_query(workload_record, model, rng, rows, limit):
+    if workload_record.kind == WorkloadKind.FILTERS:
+        filters = {
+            filter_shape.key: generate_filter_value(
+                get_filter_column(model, filter_shape),
+                filter_shape,
+                rng,
+                rows,
+            )
+            for filter_shape in workload_record.shape
+        }
+        return utils.apply_query_spec(
+            query=select(model),
+            filters=filters,
+            limit=limit,
+            model=model,
+        )
+
+    return utils.apply_query_spec(
+        query=select(model),
+        order_by=list(workload_record.shape),
+        limit=limit,
+        model=model,
+    )
+
+
+def get_percentiles_ms(durations):
+    durations = sorted(durations)
+    return {
+        f"p{percentile}_ms": get_percentile(durations, percentile) * 10**3
+        for percentile in (50, 95, 99)
+    }
+
+
+def run(
+    path,
+    models_module,
+    url="sqlite://",
+    rows=10000,
+    limit=100,
+    seed=0,
+    create_tables=False,
+):
+    module = importlib.import_module(models_module)
+    rng = random.Random(seed)
+    engine = create_engine(url)
+
+    # Shapes are replayed in the order they were recorded
+    # and reported together with latencies they had when recorded
+    shapes = collections.defaultdict(
+        lambda: {"recorded": [], "build": [], "execute": []}
+    )
+    metadata = None
+
+    with Session(engine) as session:
+        for workload_record in load_workload(path):
+            model = getattr(module, workload_record.model)
+
+            if metadata is None:
+                metadata = model.metadata
+                if create_tables or is_memory_database(engine):
+                    create_rows(engine, metadata, rows, rng)
+
+            started = time.perf_counter()
+            query = build_query(workload_record, model, rng, rows or 1, limit)
+            built = time.perf_counter()
+            session.execute(query).all()
+            finished = time.perf_counter()
+
+            durations = shapes[
+                (workload_record.kind, workload_record.model, workload_record.shape)
+            ]
+            durations["recorded"].append(workload_record.duration)
+            durations["build"].append(built - started)
+            durations["execute"].append(finished - built)
+
+    report = [
+        {
+            "kind": kind.value,
+            "model": model_name,
+            "shape": shape,
+            "count": len(durations["execute"]),
+            "recorded": get_percentiles_ms(durations["recorded"]),
+            "build": get_percentiles_ms(durations["build"]),
+            "execute": get_percentiles_ms(durations["execute"]),
+            "execute_total_ms": sum(durations["execute"]) * 10**3,
+        }
+        for (kind, model_name, shape), durations in shapes.items()
+    ]
+    # The most expensive shapes are reported first
+    return sorted(report, key=lambda shape: shape["execute_total_ms"], reverse=True)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("path", help="File written by WorkloadRecorder")
+    parser.add_argument(
+        "--models",
+        default="benchmarks.models",
+        help="Module which recorded models are imported from",
+    )
+    parser.add_argument("--url", default="sqlite://")
+    parser.add_argument(
+        "--rows",
+        type=int,
+        default=10000,
+        help="Number of generated rows of every table and range of filter values",
+    )
+    parser.add_argument(
+        "--create-tables",
+        action="store_true",
+        help="Drop and create tables of the models filled with generated rows "
+        "instead of using existing rows, always done for in-memory SQLite",
+    )
+    parser.add_argument("--limit", type=int, default=100)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    print(
+        json.dumps(
+            run(
+                path=args.path,
+                models_module=args.models,
+                url=args.url,
+                rows=args.rows,
+                limit=args.limit,
+                seed=args.seed,
+                create_tables=args.create_tables,
+            ),
+            indent=2,
+        )
+    )
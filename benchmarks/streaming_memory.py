@@ -0,0 +1,84 @@
+import argparse
+import gc
+import json
+import tracemalloc
+
+from sqlalchemy import create_engine, insert, select
+from sqlalchemy.orm import Session
+
+from benchmarks.models import BaseModel, Item
+from dataclass_sqlalchemy_mixins.base import utils
+
+
+ROWS_NUMBERS = (10000, 50000, 100000, 200000)
+
+
+def fetch_all(session):
+    query = utils.apply_filters(
+        query=select(Item),
+        filters={"number__gte": 0},
+        model=Item,
+    )
+    for _ in session.execute(query).scalars().all():
+        pass
+
+
+def stream(session, yield_per):
+    for _ in utils.stream(
+        session=session,
+        query=select(Item),
+        filters={"number__gte": 0},
+        model=Item,
+        yield_per=yield_per,
+    ):
+        pass
+
+
+def measure_peak(engine, function, **kwargs):
+    gc.collect()
+    tracemalloc.start()
+    try:
+        with Session(engine) as session:
+            function(session, **kwargs)
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def run(url="sqlite://", yield_per=utils.DEFAULT_YIELD_PER):
+    engine = create_engine(url)
+    results = []
+
+    for rows_number in ROWS_NUMBERS:
+        BaseModel.metadata.drop_all(engine)
+        BaseModel.metadata.create_all(engine)
+
+        with engine.begin() as conn:
+            conn.execute(
+                insert(Item),
+                [
+                    {"id": i, "name": f"item_{i}", "number": i}
+                    for i in range(rows_number)
+                ],
+            )
+
+        results.append(
+            {
+                "rows_number": rows_number,
+                "all_peak_bytes": measure_peak(engine, fetch_all),
+                "stream_peak_bytes": measure_peak(engine, stream, yield_per=yield_per),
+            }
+        )
+
+    BaseModel.metadata.drop_all(engine)
+    engine.dispose()
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--url", default="sqlite://")
+    parser.add_argument("--yield-per", type=int, default=utils.DEFAULT_YIELD_PER)
+    args = parser.parse_args()
+
+    print(json.dumps(run(url=args.url, yield_per=args.yield_per), indent=2))
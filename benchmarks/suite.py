@@ -0,0 +1,293 @@
+import argparse
+import datetime
+import json
+import platform
+import random
+import time
+import timeit
+from importlib import metadata
+
+import pydantic
+import sqlalchemy
+from sqlalchemy import create_engine, insert, select
+from sqlalchemy.orm import Session
+
+from benchmarks.models import (
+    CHAIN_MODELS,
+    BaseModel,
+    Company,
+    Country,
+    Group,
+    Item,
+    Owner,
+)
+from benchmarks.pydantic_filters import REQUEST_PARAMS, ItemFilterModel
+from dataclass_sqlalchemy_mixins.base import utils
+from dataclass_sqlalchemy_mixins.base.converter import get_converter
+from dataclass_sqlalchemy_mixins.base.mixins import SqlAlchemyFilterConverterMixin
+
+
+PACKAGE_NAME = "dataclass-sqlalchemy-mixins"
+
+ROWS_NUMBERS = (10000, 1000000)
+JOINS_NUMBERS = (0, 1, 5, 10, 20)
+
+FLAT_FILTERS = {
+    "name": "item_1",
+    "number__gte": 10,
+    "number__lt": 1000,
+    "id__in": [1, 2, 3],
+}
+NESTED_FILTERS = {
+    "group__name": "group_1",
+    "group__owner__name__like": "owner%",
+    "group__owner__company__name__in": ["company_1", "company_2"],
+    "group__owner__company__country__name": "country_1",
+}
+
+FLAT_ORDER_BY = ["-number", "name", "id"]
+NESTED_ORDER_BY = ["group__owner__company__country__name", "-group__name", "id"]
+
+# Query executed on tables with ROWS_NUMBERS items
+END_TO_END_QUERY_SPEC = {
+    "filters": {
+        "number__gte": 100,
+        "group__owner__company__country__name": "country_1",
+    },
+    "order_by": ["-number"],
+    "limit": 100,
+}
+
+OWNERS_NUMBER = 100
+GROUPS_NUMBER = 1000
+INSERT_CHUNK_SIZE = 100000
+
+
+def measure_us(function, number, repeat=3):
+    return min(timeit.repeat(function, number=number, repeat=repeat)) / number * 10**6
+
+
+def get_package_version():
+    try:
+        return metadata.version(PACKAGE_NAME)
+    except metadata.PackageNotFoundError:
+        return None
+
+
+def bench_expressions(number):
+    converter = get_converter(Item)
+    results = {}
+
+    for name, filters in (("flat", FLAT_FILTERS), ("nested", NESTED_FILTERS)):
+
+        def build(filters=filters):
+            return converter.get_binary_expressions(filters=filters)
+
+        def build_cold(filters=filters):
+            # Filter plans are resolved again for every call
+            SqlAlchemyFilterConverterMixin.clear_filter_plan_cache()
+            return converter.get_binary_expressions(filters=filters)
+
+        def apply(filters=filters):
+            return converter.apply_filters(query=select(Item), filters=filters)
+
+        results[name] = {
+            "keys_number": len(filters),
+            "binary_expressions_us": measure_us(build, number),
+            "binary_expressions_cold_us": measure_us(build_cold, number),
+            "apply_filters_us": measure_us(apply, number),
+        }
+
+    return results
+
+
+def get_chain_query(joins_number):
+    query = select(CHAIN_MODELS[0])
+    for index in range(joins_number):
+        query = query.join(CHAIN_MODELS[index].next)
+    return query
+
+
+def bench_join_models(number):
+    converter = get_converter(CHAIN_MODELS[0])
+    results = {}
+
+    for joins_number in JOINS_NUMBERS:
+        query = get_chain_query(joins_number)
+        # The whole path is already joined except the last model
+        models = CHAIN_MODELS[1 : joins_number + 2]
+
+        results[str(joins_number)] = {
+            "models_number": len(models),
+            "join_models_us": measure_us(
+                lambda query=query, models=models: converter.join_models(
+                    query=query,
+                    models=models,
+                ),
+                number,
+            ),
+        }
+
+    return results
+
+
+def bench_pydantic(number):
+    return {
+        "fields_number": len(REQUEST_PARAMS),
+        "parse_us": measure_us(lambda: ItemFilterModel(**REQUEST_PARAMS), number),
+        "parse_apply_filters_us": measure_us(
+            lambda: ItemFilterModel(**REQUEST_PARAMS).apply_filters(query=select(Item)),
+            number,
+        ),
+    }
+
+
+def bench_order_by(number):
+    converter = get_converter(Item)
+    results = {}
+
+    for name, order_by in (("flat", FLAT_ORDER_BY), ("nested", NESTED_ORDER_BY)):
+        results[name] = {
+            "fields_number": len(order_by),
+            "unary_expressions_us": measure_us(
+                lambda order_by=order_by: converter.get_unary_expressions(
+                    order_by=order_by
+                ),
+                number,
+            ),
+            "apply_order_by_us": measure_us(
+                lambda order_by=order_by: converter.apply_order_by(
+                    query=select(Item),
+                    order_by=order_by,
+                ),
+                number,
+            ),
+        }
+
+    return results
+
+
+def create_rows(engine, rows_number):
+    BaseModel.metadata.drop_all(engine)
+    BaseModel.metadata.create_all(engine)
+
+    random.seed(rows_number)
+
+    with engine.begin() as conn:
+        conn.execute(
+            insert(Country),
+            [{"id": i, "name": f"country_{i}"} for i in range(10)],
+        )
+        conn.execute(
+            insert(Company),
+            [
+                {"id": i, "name": f"company_{i}", "country_id": i % 10}
+                for i in range(OWNERS_NUMBER)
+            ],
+        )
+        conn.execute(
+            insert(Owner),
+            [
+                {"id": i, "name": f"owner_{i}", "company_id": i}
+                for i in range(OWNERS_NUMBER)
+            ],
+        )
+        conn.execute(
+            insert(Group),
+            [
+                {"id": i, "name": f"group_{i}", "owner_id": i % OWNERS_NUMBER}
+                for i in range(GROUPS_NUMBER)
+            ],
+        )
+
+        for chunk_start in range(0, rows_number, INSERT_CHUNK_SIZE):
+            conn.execute(
+                insert(Item),
+                [
+                    {
+                        "id": i,
+                        "name": f"item_{i}",
+                        "number": random.randint(0, rows_number),
+                        "group_id": random.randrange(GROUPS_NUMBER),
+                    }
+                    for i in range(
+                        chunk_start, min(chunk_start + INSERT_CHUNK_SIZE, rows_number)
+                    )
+                ],
+            )
+
+
+def bench_end_to_end(rows_numbers, repeat):
+    results = {}
+
+    for rows_number in rows_numbers:
+        # Every size uses a new in-memory database
+        engine = create_engine("sqlite://")
+        create_rows(engine, rows_number)
+
+        build_seconds = []
+        execute_seconds = []
+
+        with Session(engine) as session:
+            for _ in range(repeat):
+                started = time.perf_counter()
+                query = utils.apply_query_spec(
+                    query=select(Item),
+                    model=Item,
+                    **END_TO_END_QUERY_SPEC,
+                )
+                built = time.perf_counter()
+                rows = session.execute(query).scalars().all()
+                finished = time.perf_counter()
+
+                build_seconds.append(built - started)
+                execute_seconds.append(finished - built)
+
+        engine.dispose()
+
+        results[str(rows_number)] = {
+            "rows_fetched": len(rows),
+            "build_us": min(build_seconds) * 10**6,
+            "execute_ms": min(execute_seconds) * 10**3,
+        }
+
+    return results
+
+
+def run(number=2000, rows_numbers=ROWS_NUMBERS, repeat=3):
+    return {
+        "meta": {
+            "created_at": datetime.datetime.now(datetime.timezone.utc).isoformat(),
+            "package_version": get_package_version(),
+            "python_version": platform.python_version(),
+            "sqlalchemy_version": sqlalchemy.__version__,
+            "pydantic_version": pydantic.VERSION,
+            "number": number,
+            "repeat": repeat,
+        },
+        "expressions": bench_expressions(number),
+        "join_models": bench_join_models(number),
+        "pydantic": bench_pydantic(number),
+        "order_by": bench_order_by(number),
+        "end_to_end": bench_end_to_end(rows_numbers, repeat),
+    }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--number", type=int, default=2000)
+    parser.add_argument("--rows", type=int, nargs="+", default=list(ROWS_NUMBERS))
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--output", help="File results are written to")
+    args = parser.parse_args()
+
+    results = json.dumps(
+        run(number=args.number, rows_numbers=args.rows, repeat=args.repeat),
+        indent=2,
+    )
+
+    if args.output:
+        with open(args.output, "w") as file:
+            file.write(results + "\n")
+    else:
+        print(results)
@@ -0,0 +1,134 @@
+import typing as tp
+
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import DeclarativeMeta
+
+from dataclass_sqlalchemy_mixins.base.converter import get_converter
+from dataclass_sqlalchemy_mixins.base.mixins import ToManyStrategy
+from dataclass_sqlalchemy_mixins.base.tracing import async_execute, async_stream
+from dataclass_sqlalchemy_mixins.base.utils import (
+    DEFAULT_YIELD_PER,
+    get_stream_query,
+    is_single_entity,
+)
+
+
+async def fetch_count(
+    session: AsyncSession,
+    query=None,
+    filters: tp.Optional[tp.Dict[str, tp.Any]] = None,
+    model: tp.Type[DeclarativeMeta] = None,
+) -> int:
+    converter = get_converter(model)
+
+    if query is None:
+        count_query = converter.get_count_query(filters=filters)
+    else:
+        # Joins and conditions of a caller statement are kept,
+        # filters are applied the same way as by get_count_query
+        query = converter._apply_count_filters(
+            query=query.order_by(None),
+            filters=filters,
+            model=model,
+        )
+        count_query = select(func.count()).select_from(query.subquery())
+
+    return (
+        await async_execute(session=session, query=count_query, model=model)
+    ).scalar_one()
+
+
+async def fetch_first(
+    session: AsyncSession,
+    query,
+    filters: tp.Optional[tp.Dict[str, tp.Any]] = None,
+    order_by: tp.Optional[tp.Union[str, tp.List[str]]] = None,
+    model: tp.Type[DeclarativeMeta] = None,
+    to_many_strategy: tp.Optional[ToManyStrategy] = None,
+):
+    query = get_converter(model).apply_query_spec(
+        query=query,
+        filters=filters,
+        order_by=order_by,
+        limit=1,
+        to_many_strategy=to_many_strategy,
+    )
+    result = await async_execute(session=session, query=query, model=model)
+
+    if is_single_entity(query):
+        return result.scalars().first()
+    return result.first()
+
+
+async def fetch_all(
+    session: AsyncSession,
+    query,
+    filters: tp.Optional[tp.Dict[str, tp.Any]] = None,
+    order_by: tp.Optional[tp.Union[str, tp.List[str]]] = None,
+    limit: tp.Optional[int] = None,
+    offset: tp.Optional[int] = None,
+    model: tp.Type[DeclarativeMeta] = None,
+    to_many_strategy: tp.Optional[ToManyStrategy] = None,
+) -> tp.List[tp.Any]:
+    query = get_converter(model).apply_query_spec(
+        query=query,
+        filters=filters,
+        order_by=order_by,
+        limit=limit,
+        offset=offset,
+        to_many_strategy=to_many_strategy,
+    )
+    result = await async_execute(session=session, query=query, model=model)
+
+    if is_single_entity(query):
+        return list(result.scalars().all())
+    return list(result.all())
+
+
+async def stream_query(
+    session: AsyncSession,
+    query,
+    yield_per: int = DEFAULT_YIELD_PER,
+    model: tp.Type[DeclarativeMeta] = None,
+) -> tp.AsyncIterator[tp.Any]:
+    query = get_stream_query(query=query, yield_per=yield_per)
+
+    result = await async_stream(session=session, query=query, model=model)
+
+    if is_single_entity(query):
+        result = result.scalars()
+
+    try:
+        async for row in result:
+            yield row
+    finally:
+        # Cursor is released when a caller stops iterating early
+        await result.close()
+
+
+def stream(
+    session: AsyncSession,
+    query,
+    filters: tp.Optional[tp.Dict[str, tp.Any]] = None,
+    order_by: tp.Optional[tp.Union[str, tp.List[str]]] = None,
+    limit: tp.Optional[int] = None,
+    offset: tp.Optional[int] = None,
+    model: tp.Type[DeclarativeMeta] = None,
+    to_many_strategy: tp.Optional[ToManyStrategy] = None,
+    yield_per: int = DEFAULT_YIELD_PER,
+) -> tp.AsyncIterator[tp.Any]:
+    query = get_converter(model).apply_query_spec(
+        query=query,
+        filters=filters,
+        order_by=order_by,
+        limit=limit,
+        offset=offset,
+        to_many_strategy=to_many_strategy,
+    )
+    return stream_query(
+        session=session,
+        query=query,
+        yield_per=yield_per,
+        model=model,
+    )
@@ -0,0 +1,88 @@
+import threading
+import typing as tp
+from collections import OrderedDict
+
+
+_MISSING = object()
+
+
+class LRUCacheInfo(tp.NamedTuple):
+    hits: int
+    misses: int
+    evictions: int
+    maxsize: int
+    currsize: int
+
+
+class LRUCache:
+    # A small thread safe LRU mapping used to keep
+    # resolved converter data shared between instances
+    def __init__(self, maxsize: int = 1024):
+        if maxsize <= 0:
+            raise ValueError("LRUCache maxsize should be greater than 0")
+
+        self.maxsize = maxsize
+
+        self._data: tp.OrderedDict[tp.Hashable, tp.Any] = OrderedDict()
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self):
+        return len(self._data)
+
+    def __contains__(self, key):
+        return key in self._data
+
+    def get(self, key: tp.Hashable, default: tp.Any = None) -> tp.Any:
+        with self._lock:
+            value = self._data.get(key, _MISSING)
+
+            if value is _MISSING:
+                self.misses += 1
+                return default
+
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, key: tp.Hashable, value: tp.Any):
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+                self.evictions += 1
+
+    def pop(self, key: tp.Hashable, default: tp.Any = None) -> tp.Any:
+        with self._lock:
+            return self._data.pop(key, default)
+
+    def items(self) -> tp.List[tp.Tuple[tp.Hashable, tp.Any]]:
+        # Items are copied so the cache can be changed while they are iterated
+        with self._lock:
+            return list(self._data.items())
+
+    def info(self) -> LRUCacheInfo:
+        with self._lock:
+            return LRUCacheInfo(
+                hits=self.hits,
+                misses=self.misses,
+                evictions=self.evictions,
+                maxsize=self.maxsize,
+                currsize=len(self._data),
+            )
+
+    def clear(self, reset_stats: bool = True):
+        with self._lock:
+            self._data.clear()
+
+            if not reset_stats:
+                return
+
+            self.hits = 0
+            self.misses = 0
+            self.evictions = 0
@@ -0,0 +1,97 @@
+import typing as tp
+
+from sqlalchemy.orm import DeclarativeMeta
+
+from dataclass_sqlalchemy_mixins.base.cache import LRUCache
+from dataclass_sqlalchemy_mixins.base.in_lists import InOverflow, InStrategy
+from dataclass_sqlalchemy_mixins.base.mixins import (
+    FrozenConverterConfig,
+    SqlAlchemyQueryConverterMixin,
+    ToManyStrategy,
+    resolve_converter_config,
+)
+
+
+class SqlAlchemyConverter(SqlAlchemyQueryConverterMixin):
+    # Converter bound to a model which state never changes after creation
+    # so a single instance can be shared between threads and asyncio tasks
+    __slots__ = ("ConverterConfig",)
+
+    def __init__(
+        self,
+        model: tp.Type[DeclarativeMeta],
+        extra: tp.Dict[tp.Any, tp.Dict] = None,
+        to_many_strategy: ToManyStrategy = ToManyStrategy.JOIN,
+        in_strategy: InStrategy = InStrategy.EXPANDING,
+        in_max_size: tp.Optional[int] = None,
+        in_overflow: InOverflow = InOverflow.ERROR,
+        in_values_threshold: tp.Optional[int] = None,
+        count_estimate_threshold: tp.Optional[int] = None,
+    ):
+        if model is None:
+            raise ValueError("SqlAlchemyConverter param 'model' can't be None")
+
+        object.__setattr__(
+            self,
+            "ConverterConfig",
+            resolve_converter_config(
+                FrozenConverterConfig(
+                    model=model,
+                    extra=extra,
+                    to_many_strategy=to_many_strategy,
+                    in_strategy=in_strategy,
+                    in_max_size=in_max_size,
+                    in_overflow=in_overflow,
+                    in_values_threshold=in_values_threshold,
+                    count_estimate_threshold=count_estimate_threshold,
+                )
+            ),
+        )
+
+    def __setattr__(self, key, value):
+        raise AttributeError(f"{self.__class__.__name__} is immutable")
+
+    def __delattr__(self, key):
+        raise AttributeError(f"{self.__class__.__name__} is immutable")
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}(model={self.model.__name__})"
+
+    @property
+    def model(self) -> tp.Type[DeclarativeMeta]:
+        return self.ConverterConfig.model
+
+    def apply_filters(
+        self,
+        query,
+        filters: tp.Dict[str, tp.Any],
+        to_many_strategy: tp.Optional[ToManyStrategy] = None,
+    ):
+        return self.apply_query_spec(
+            query=query,
+            filters=filters,
+            to_many_strategy=to_many_strategy,
+        )
+
+    def apply_order_by(
+        self,
+        query,
+        order_by: tp.Union[str, tp.List[str]],
+    ):
+        return self.apply_query_spec(query=query, order_by=order_by)
+
+
+# Converters reference their models, so the cache is bounded
+# instead of keeping every model class ever converted
+CONVERTER_CACHE_SIZE = 1024
+
+_converters = LRUCache(maxsize=CONVERTER_CACHE_SIZE)
+
+
+def get_converter(model: tp.Type[DeclarativeMeta]) -> SqlAlchemyConverter:
+    converter = _converters.get(model)
+
+    if converter is None:
+        converter = SqlAlchemyConverter(model=model)
+        _converters.set(model, converter)
+    return converter
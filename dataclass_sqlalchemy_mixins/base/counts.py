@@ -0,0 +1,111 @@
+import re
+import typing as tp
+from itertools import takewhile
+
+from sqlalchemy import bindparam, text
+from sqlalchemy.orm import DeclarativeMeta
+
+from dataclass_sqlalchemy_mixins.base.explain import explain, get_dialect_name
+
+
+class CountResult(tp.NamedTuple):
+    count: int
+    # Count is a planner estimate and not an exact number of rows
+    is_approximate: bool = False
+
+
+CountEstimator = tp.Callable[
+    [tp.Any, tp.Any, tp.Type[DeclarativeMeta]],
+    tp.Optional[int],
+]
+
+# Functions returning an estimated number of rows of a query
+# or None when a database can't estimate it
+COUNT_ESTIMATORS: tp.Dict[str, CountEstimator] = {}
+
+
+def register_count_estimator(
+    dialect_name: str,
+) -> tp.Callable[[CountEstimator], CountEstimator]:
+    def decorator(estimator: CountEstimator) -> CountEstimator:
+        COUNT_ESTIMATORS[dialect_name] = estimator
+        return estimator
+
+    return decorator
+
+
+def estimate_count(
+    session,
+    query,
+    model: tp.Type[DeclarativeMeta],
+) -> tp.Optional[int]:
+    estimator = COUNT_ESTIMATORS.get(get_dialect_name(session))
+
+    if estimator is None:
+        return None
+    return estimator(session, query, model)
+
+
+@register_count_estimator("postgresql")
+def _estimate_postgresql_count(session, query, model):
+    return int(explain(session, query)["Plan"]["Plan Rows"])
+
+
+SQLITE_PLAN_MATCHER = re.compile(
+    r"^(?:SCAN|SEARCH) (?P<table>\S+)"
+    r"(?: AS \S+)?"
+    r"(?: USING (?:COVERING )?INDEX (?P<index>\S+)(?: \((?P<columns>.*)\))?)?"
+)
+
+SQLITE_PRIMARY_KEY_SEARCH = "USING INTEGER PRIMARY KEY (rowid=?)"
+
+
+@register_count_estimator("sqlite")
+def _estimate_sqlite_count(session, query, model):
+    # Statistics are collected by ANALYZE into sqlite_stat1:
+    # "<rows of table> <rows per value of 1st column> <rows per 1st and 2nd> ..."
+    table_name = model.__table__.name
+
+    if not session.execute(
+        text("SELECT 1 FROM sqlite_master WHERE name = 'sqlite_stat1'")
+    ).first():
+        return None
+
+    stats = {
+        # Stat can be followed by flags like "unordered"
+        index_name: [int(value) for value in takewhile(str.isdigit, stat.split())]
+        for index_name, stat in session.execute(
+            text("SELECT idx, stat FROM sqlite_stat1 WHERE tbl = :table").bindparams(
+                bindparam("table", table_name)
+            )
+        ).all()
+    }
+    if not stats:
+        return None
+
+    # A query without filters returns every row of a table
+    if query.whereclause is None:
+        return next(iter(stats.values()))[0]
+
+    for _, _, _, detail in explain(session, query):
+        if detail.endswith(SQLITE_PRIMARY_KEY_SEARCH) and (
+            detail.split()[1] == table_name
+        ):
+            return 1
+
+        plan_match = SQLITE_PLAN_MATCHER.match(detail)
+        if plan_match is None or plan_match["table"] != table_name:
+            continue
+
+        index_stat = stats.get(plan_match["index"])
+        if index_stat is None or not plan_match["columns"]:
+            return None
+
+        # Number of index columns compared by equality,
+        # ranges and scans can't be estimated from sqlite_stat1
+        equal_columns = len(re.findall(r"\w+=\?", plan_match["columns"]))
+        if 0 < equal_columns < len(index_stat):
+            return index_stat[equal_columns]
+        return None
+
+    return None
@@ -0,0 +1,118 @@
+import re
+import typing as tp
+
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.base import Executable
+from sqlalchemy.sql.elements import ClauseElement
+
+
+class Explain(Executable, ClauseElement):
+    # Statement is compiled inside EXPLAIN
+    # so parameters are bound the same way as for execution
+    inherit_cache = False
+
+    def __init__(self, statement):
+        self.statement = statement
+
+
+@compiles(Explain)
+def _compile_explain(element, compiler, **kw):
+    return f"EXPLAIN {compiler.process(element.statement, **kw)}"
+
+
+@compiles(Explain, "postgresql")
+def _compile_explain_postgresql(element, compiler, **kw):
+    return f"EXPLAIN (FORMAT JSON) {compiler.process(element.statement, **kw)}"
+
+
+@compiles(Explain, "sqlite")
+def _compile_explain_sqlite(element, compiler, **kw):
+    return f"EXPLAIN QUERY PLAN {compiler.process(element.statement, **kw)}"
+
+
+def get_dialect_name(session) -> str:
+    # Both sessions and connections can be used
+    bind = session.get_bind() if hasattr(session, "get_bind") else session
+    return bind.dialect.name
+
+
+def explain(session, query) -> tp.Any:
+    # PostgreSQL returns a plan as json: {"Plan": {...}}
+    # SQLite returns rows of "EXPLAIN QUERY PLAN": (id, parent, notused, detail)
+    rows = session.execute(Explain(query)).all()
+
+    if get_dialect_name(session) == "postgresql":
+        return rows[0][0][0]
+    return [tuple(row) for row in rows]
+
+
+class QueryPlan(tp.NamedTuple):
+    # Output of explain
+    plan: tp.Any
+    used_indexes: tp.FrozenSet[str]
+    # Tables or their aliases read without an index
+    full_scans: tp.FrozenSet[str]
+
+
+SQLITE_TABLE_MATCHER = re.compile(r"^(SCAN|SEARCH) (?:TABLE )?(\S+)(?: AS (\S+))?(.*)$")
+SQLITE_INDEX_MATCHER = re.compile(r"USING (?:COVERING )?INDEX (\S+)")
+
+
+def _walk_postgresql_plan(plan: tp.Dict[str, tp.Any]) -> tp.Iterator[tp.Dict]:
+    yield plan
+    for subplan in plan.get("Plans", ()):
+        yield from _walk_postgresql_plan(subplan)
+
+
+def _get_postgresql_query_plan(plan: tp.Dict[str, tp.Any]) -> QueryPlan:
+    nodes = list(_walk_postgresql_plan(plan["Plan"]))
+
+    return QueryPlan(
+        plan=plan,
+        used_indexes=frozenset(
+            node["Index Name"] for node in nodes if "Index Name" in node
+        ),
+        full_scans=frozenset(
+            node.get("Alias", node["Relation Name"])
+            for node in nodes
+            if node["Node Type"] == "Seq Scan"
+        ),
+    )
+
+
+def _get_sqlite_query_plan(plan: tp.List[tp.Tuple]) -> QueryPlan:
+    used_indexes = set()
+    full_scans = set()
+
+    for *_, detail in plan:
+        index_match = SQLITE_INDEX_MATCHER.search(detail)
+        if index_match:
+            used_indexes.add(index_match.group(1))
+
+        table_match = SQLITE_TABLE_MATCHER.match(detail)
+        # Subqueries and constant rows are not tables
+        if table_match is None or table_match.group(2).startswith(("(", "CONSTANT")):
+            continue
+
+        operation, table, alias, rest = table_match.groups()
+        if operation == "SCAN" and "USING" not in rest:
+            full_scans.add(alias or table)
+
+    return QueryPlan(
+        plan=plan,
+        used_indexes=frozenset(used_indexes),
+        full_scans=frozenset(full_scans),
+    )
+
+
+def get_query_plan(session, query) -> QueryPlan:
+    plan = explain(session, query)
+
+    if get_dialect_name(session) == "postgresql":
+        return _get_postgresql_query_plan(plan)
+    return _get_sqlite_query_plan(plan)
+
+
+def get_used_indexes(session, query) -> tp.Set[str]:
+    # Names of indexes a database is going to use for a query
+    return set(get_query_plan(session, query).used_indexes)
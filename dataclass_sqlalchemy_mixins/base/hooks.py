@@ -0,0 +1,45 @@
+import contextlib
+import contextvars
+import threading
+import typing as tp
+
+
+class HookRegistry:
+    # Hooks are stored in tuples which are replaced and never changed
+    # so they are read without locks
+    def __init__(self, name: str):
+        self._hooks: tp.Tuple[tp.Callable, ...] = ()
+        self._lock = threading.Lock()
+        self._context_hooks = contextvars.ContextVar(
+            f"dataclass_sqlalchemy_mixins_{name}",
+            default=(),
+        )
+
+    def add(self, hook: tp.Callable):
+        # Hook is called in all threads and tasks
+        with self._lock:
+            self._hooks = (*self._hooks, hook)
+
+    def remove(self, hook: tp.Callable):
+        with self._lock:
+            self._hooks = tuple(
+                added_hook for added_hook in self._hooks if added_hook != hook
+            )
+
+    @contextlib.contextmanager
+    def context(self, *hooks: tp.Callable):
+        # Hooks are called in the current thread or task only
+        token = self._context_hooks.set(self._context_hooks.get() + hooks)
+        try:
+            yield
+        finally:
+            self._context_hooks.reset(token)
+
+    def get(self) -> tp.Tuple[tp.Callable, ...]:
+        # Empty tuple is returned when there are no hooks,
+        # so callers do extra work only when it is not empty
+        context_hooks = self._context_hooks.get()
+
+        if context_hooks:
+            return self._hooks + context_hooks
+        return self._hooks
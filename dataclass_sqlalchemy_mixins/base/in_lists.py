@@ -0,0 +1,215 @@
+import enum
+import json
+import typing as tp
+
+from sqlalchemy import Boolean, String, all_, and_, any_, bindparam, or_
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.exc import CompileError
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.orm import InstrumentedAttribute
+from sqlalchemy.sql.elements import ColumnElement
+from sqlalchemy.sql.type_api import TypeDecorator
+from sqlalchemy.sql.visitors import InternalTraversal
+
+
+IN_SQL_OP = "in_"
+NOT_IN_SQL_OP = "not_in"
+
+
+class InStrategy(str, enum.Enum):
+    # A single expanding bind parameter which is rendered
+    # as "IN (...)" only when a statement is executed,
+    # so a compiled statement is cached for lists of any length
+    EXPANDING = "expanding"
+    # "= ANY(:param)" and "!= ALL(:param)" with one array bind parameter
+    # on PostgreSQL, so SQL sent to a database is the same for lists
+    # of any length, other databases use an expanding "IN"
+    ANY_ARRAY = "any_array"
+    # Values are passed as one parameter which a database
+    # turns into a table joined with "IN (SELECT ...)":
+    # unnest() on PostgreSQL and json_each() on SQLite
+    VALUES = "values"
+
+
+class InOverflow(str, enum.Enum):
+    ERROR = "error"  # ValueError is raised
+    CHUNK = "chunk"  # List is split into several IN expressions
+
+
+class ValuesListType(TypeDecorator):
+    # List of values passed as one parameter:
+    # an array on PostgreSQL and a json array on other databases
+    impl = String
+    cache_ok = True
+
+    def __init__(self, item_type):
+        super().__init__()
+        self.item_type = item_type
+
+    def process_bind_param(self, value, dialect):
+        processor = self.item_type.dialect_impl(dialect).bind_processor(dialect)
+        if processor is not None:
+            value = [processor(item) for item in value]
+        else:
+            value = list(value)
+
+        if dialect.name == "postgresql":
+            return value
+        return json.dumps(value, default=str)
+
+
+class InValues(ColumnElement):
+    type = Boolean()
+    inherit_cache = True
+    # Rendered as it is in WHERE without "= 1" on databases without booleans
+    _is_implicitly_boolean = True
+
+    _traverse_internals = [
+        ("column", InternalTraversal.dp_clauseelement),
+        ("values", InternalTraversal.dp_clauseelement),
+        ("negate_in", InternalTraversal.dp_boolean),
+    ]
+
+    def __init__(self, column, values, negate_in=False):
+        self.column = column.expression
+        self.values = bindparam(None, values, type_=ValuesListType(column.type))
+        self.negate_in = negate_in
+
+    def _in_operator(self):
+        return "NOT IN" if self.negate_in else "IN"
+
+
+@compiles(InValues)
+def _compile_in_values(element, compiler, **kw):
+    # String representation of a statement without a dialect
+    if compiler.dialect.name != "default":
+        raise CompileError(
+            f"InStrategy.VALUES is not supported by {compiler.dialect.name} dialect"
+        )
+    return _compile_in_values_sqlite(element, compiler, **kw)
+
+
+@compiles(InValues, "sqlite")
+def _compile_in_values_sqlite(element, compiler, **kw):
+    return (
+        f"{compiler.process(element.column, **kw)} {element._in_operator()} "
+        f"(SELECT value FROM json_each({compiler.process(element.values, **kw)}))"
+    )
+
+
+@compiles(InValues, "postgresql")
+def _compile_in_values_postgresql(element, compiler, **kw):
+    item_type = compiler.dialect.type_compiler.process(element.column.type)
+    return (
+        f"{compiler.process(element.column, **kw)} {element._in_operator()} "
+        f"(SELECT unnest(CAST({compiler.process(element.values, **kw)} "
+        f"AS {item_type}[])))"
+    )
+
+
+class InArray(ColumnElement):
+    type = Boolean()
+    inherit_cache = True
+    _is_implicitly_boolean = True
+
+    _traverse_internals = [
+        ("column", InternalTraversal.dp_clauseelement),
+        ("values", InternalTraversal.dp_clauseelement),
+        ("array_values", InternalTraversal.dp_clauseelement),
+        ("negate_in", InternalTraversal.dp_boolean),
+    ]
+
+    def __init__(self, column, values, negate_in=False):
+        values = list(values)
+
+        self.column = column.expression
+        # Only one of the parameters is rendered depending on a dialect
+        self.values = bindparam(None, values, type_=column.type, expanding=True)
+        self.array_values = bindparam(None, values, type_=ARRAY(column.type))
+        self.negate_in = negate_in
+
+
+@compiles(InArray)
+def _compile_in_array(element, compiler, **kw):
+    if element.negate_in:
+        return compiler.process(element.column.not_in(element.values), **kw)
+    return compiler.process(element.column.in_(element.values), **kw)
+
+
+@compiles(InArray, "postgresql")
+def _compile_in_array_postgresql(element, compiler, **kw):
+    if element.negate_in:
+        return compiler.process(element.column != all_(element.array_values), **kw)
+    return compiler.process(element.column == any_(element.array_values), **kw)
+
+
+def get_in_operator(
+    db_field: InstrumentedAttribute,
+    sql_op: str,
+    in_strategy: InStrategy = InStrategy.EXPANDING,
+) -> tp.Callable[[tp.Any], tp.Any]:
+    if in_strategy == InStrategy.VALUES:
+
+        def operator(value):
+            return InValues(db_field, value, negate_in=sql_op == NOT_IN_SQL_OP)
+
+        return operator
+
+    if in_strategy == InStrategy.ANY_ARRAY:
+
+        def operator(value):
+            return InArray(db_field, value, negate_in=sql_op == NOT_IN_SQL_OP)
+
+        return operator
+
+    # Sqlalchemy uses an expanding bind parameter for in_() by default
+    return getattr(db_field, sql_op)
+
+
+def limit_in_operator(
+    operator: tp.Callable[[tp.Any], tp.Any],
+    sql_op: str,
+    in_max_size: int,
+    in_overflow: InOverflow = InOverflow.ERROR,
+) -> tp.Callable[[tp.Any], tp.Any]:
+    # NOT IN of chunks should match none of them
+    # while IN should match any of them
+    join_chunks = or_ if sql_op == IN_SQL_OP else and_
+
+    def limited_operator(value):
+        if not isinstance(value, (list, tuple)):
+            value = list(value)
+
+        if len(value) <= in_max_size:
+            return operator(value)
+
+        if in_overflow == InOverflow.ERROR:
+            raise ValueError(
+                f"Number of values ({len(value)}) "
+                f"is greater than in_max_size ({in_max_size})"
+            )
+
+        return join_chunks(
+            *[
+                operator(value[i : i + in_max_size])
+                for i in range(0, len(value), in_max_size)
+            ]
+        )
+
+    return limited_operator
+
+
+def switch_in_operator(
+    operator: tp.Callable[[tp.Any], tp.Any],
+    values_operator: tp.Callable[[tp.Any], tp.Any],
+    in_values_threshold: int,
+) -> tp.Callable[[tp.Any], tp.Any]:
+    def switched_operator(value):
+        if not isinstance(value, (list, tuple)):
+            value = list(value)
+
+        if len(value) > in_values_threshold:
+            return values_operator(value)
+        return operator(value)
+
+    return switched_operator
@@ -0,0 +1,361 @@
+import dataclasses
+import enum
+import typing as tp
+
+from sqlalchemy import Column, Index, MetaData, inspect
+from sqlalchemy.engine import Dialect, make_url
+from sqlalchemy.orm import DeclarativeMeta
+from sqlalchemy.schema import CreateIndex, UniqueConstraint
+
+from dataclass_sqlalchemy_mixins.base.converter import get_converter
+from dataclass_sqlalchemy_mixins.base.mixins import (
+    QUERY_SPEC_FIELDS,
+    SQLALCHEMY_OP_MATCHER,
+    FilterPlanOptions,
+)
+from dataclass_sqlalchemy_mixins.base.workload import WorkloadKind, WorkloadRecord
+
+
+class IndexIssue(str, enum.Enum):
+    MISSING = "missing"  # Filtered or ordered column has no index
+    UNUSABLE = "unusable"  # Column index can't be used by an operator
+    UNINDEXED_JOIN = "unindexed_join"  # Joined foreign key column has no index
+
+
+class IndexSuggestion(tp.NamedTuple):
+    table: str
+    column: str
+    issue: IndexIssue
+    # Filter keys and order fields using a column
+    keys: tp.Tuple[str, ...]
+    # None when no index can be used by an operator on a dialect
+    ddl: tp.Optional[str]
+
+
+# Operators an index is not used for, like "not" and "not_in", are skipped
+BTREE_OPS = ("eq", "in", "gt", "lt", "gte", "lte", "is", "isnull")
+PATTERN_OPS = ("like", "ilike")
+ORDER_USAGE = "order"
+JOIN_USAGE = "join"
+
+# Dialects which need special indexes for pattern operators,
+# other dialects are expected to use regular indexes for them
+PATTERN_INDEX_DIALECTS = ("postgresql", "sqlite")
+POSTGRESQL_TRIGRAM_OPS = "gin_trgm_ops"
+POSTGRESQL_PATTERN_OPS = ("text_pattern_ops", "varchar_pattern_ops")
+
+
+def get_dialect(dialect: tp.Union[str, Dialect]) -> Dialect:
+    if isinstance(dialect, str):
+        return make_url(f"{dialect}://").get_dialect()()
+    return dialect
+
+
+def _get_column(attribute) -> tp.Optional[Column]:
+    # Hybrid properties and column expressions can't be indexed by the advisor
+    columns = getattr(getattr(attribute, "property", None), "columns", None)
+    if not columns or not isinstance(columns[0], Column):
+        return None
+    return columns[0]
+
+
+def _get_join_columns(model, name: str) -> tp.List[Column]:
+    relationship = inspect(model).relationships[name]
+
+    # Columns of both sides and of a secondary table are checked,
+    # only foreign keys are reported since primary keys are always indexed
+    return [
+        column
+        for pair in relationship.local_remote_pairs
+        for column in pair
+        if column.foreign_keys
+    ]
+
+
+def _get_key_usages(
+    model: tp.Type[DeclarativeMeta],
+    key: str,
+    is_order: bool = False,
+) -> tp.List[tp.Tuple[Column, str]]:
+    converter = get_converter(model)
+
+    if is_order:
+        path = key.lstrip("-").split("__")
+        usage = ORDER_USAGE
+
+        models, db_field, _ = converter._get_order_field(field=key, model=model)
+        joins_number = len(path) - 1
+    else:
+        path = key.split("__")
+        usage = "eq"
+        if len(path) > 1 and path[-1] in SQLALCHEMY_OP_MATCHER:
+            usage = path.pop()
+
+        if usage not in BTREE_OPS + PATTERN_OPS:
+            return []
+
+        # Plans are resolved by the converter with and without dropped joins,
+        # so only joins the converter makes are checked
+        filter_plan = converter._get_filter_plan(field=key, model=model)
+        joined_filter_plan = converter._get_filter_plan(
+            field=key,
+            model=model,
+            options=FilterPlanOptions(eliminate_foreign_key_joins=False),
+        )
+
+        models = joined_filter_plan.models
+        db_field = filter_plan.db_field
+        joins_number = len(path) - 1
+        if db_field is not joined_filter_plan.db_field:
+            joins_number -= 1
+
+    # Relationships of a path are joined starting from the model
+    join_models = (model, *models)
+    usages = [
+        (column, JOIN_USAGE)
+        for join_model, name in zip(join_models, path[:joins_number])
+        for column in _get_join_columns(join_model, name)
+    ]
+
+    column = _get_column(db_field)
+    if column is not None:
+        usages.append((column, usage))
+    return usages
+
+
+def _get_leading_columns(table) -> tp.Set[Column]:
+    # Multicolumn indexes are used only for their first columns
+    leading_columns = set()
+
+    primary_key_columns = list(table.primary_key.columns)
+    if primary_key_columns:
+        leading_columns.add(primary_key_columns[0])
+
+    for index in table.indexes:
+        expressions = list(index.expressions)
+        if expressions and isinstance(expressions[0], Column):
+            leading_columns.add(expressions[0])
+
+    for constraint in table.constraints:
+        if isinstance(constraint, UniqueConstraint) and constraint.columns:
+            leading_columns.add(list(constraint.columns)[0])
+
+    for column in table.columns:
+        if column.index or column.unique:
+            leading_columns.add(column)
+
+    return leading_columns
+
+
+def _has_pattern_index(column: Column, op: str, dialect: Dialect) -> bool:
+    for index in column.table.indexes:
+        expressions = list(index.expressions)
+        if not expressions:
+            continue
+
+        if dialect.name == "postgresql":
+            options = index.dialect_options["postgresql"]
+            column_ops = (options["ops"] or {}).get(column.name, "")
+
+            if (
+                any(index_column is column for index_column in index.columns)
+                and column_ops == POSTGRESQL_TRIGRAM_OPS
+                and options["using"] in ("gin", "gist")
+            ):
+                return True
+            if (
+                op == "like"
+                and expressions[0] is column
+                and column_ops in POSTGRESQL_PATTERN_OPS
+            ):
+                return True
+
+        # SQLite uses indexes for LIKE only if they are case-insensitive
+        elif dialect.name == "sqlite" and op == "like":
+            leading = expressions[0]
+
+            if getattr(leading, "left", None) is column:
+                # Index of an expression "column COLLATE NOCASE"
+                collation = getattr(leading.right, "collation", None)
+            elif leading is column:
+                collation = getattr(column.type, "collation", None)
+            else:
+                continue
+
+            if (collation or "").upper() == "NOCASE":
+                return True
+
+    return False
+
+
+def _get_index_ddl(
+    column: Column,
+    usage: str,
+    dialect: Dialect,
+) -> tp.Optional[str]:
+    # SQLite ILIKE is compiled to lower(column) LIKE lower(value)
+    # which can't use any index
+    if dialect.name == "sqlite" and usage == "ilike":
+        return None
+
+    # Index is created for a copy of a table so the model is not changed
+    table = column.table.to_metadata(MetaData())
+    table_column = table.c[column.name]
+    name = f"ix_{column.table.name}_{column.name}"
+
+    if usage in PATTERN_OPS and dialect.name == "postgresql":
+        # Requires "CREATE EXTENSION pg_trgm"
+        index = Index(
+            f"{name}_trgm",
+            table_column,
+            postgresql_using="gin",
+            postgresql_ops={column.name: POSTGRESQL_TRIGRAM_OPS},
+        )
+    elif usage == "like" and dialect.name == "sqlite":
+        index = Index(f"{name}_nocase", table_column.collate("NOCASE"))
+    else:
+        index = Index(name, table_column)
+
+    return str(CreateIndex(index).compile(dialect=dialect)).strip()
+
+
+def _get_issue(
+    column: Column,
+    usage: str,
+    dialect: Dialect,
+) -> tp.Optional[IndexIssue]:
+    is_indexed = column in _get_leading_columns(column.table)
+
+    if usage in PATTERN_OPS and dialect.name in PATTERN_INDEX_DIALECTS:
+        if _has_pattern_index(column, usage, dialect):
+            return None
+        return IndexIssue.UNUSABLE if is_indexed else IndexIssue.MISSING
+
+    if is_indexed:
+        return None
+    if usage == JOIN_USAGE:
+        return IndexIssue.UNINDEXED_JOIN
+    return IndexIssue.MISSING
+
+
+def _advise(
+    usages: tp.Iterable[tp.Tuple[Column, str, str]],
+    dialect: tp.Union[str, Dialect],
+) -> tp.List[IndexSuggestion]:
+    dialect = get_dialect(dialect)
+    issues = list(IndexIssue)
+
+    # Usages of a column needing the same index are reported together
+    suggestions: tp.Dict[tp.Tuple, tp.Dict[str, tp.Any]] = {}
+
+    for column, usage, key in usages:
+        issue = _get_issue(column, usage, dialect)
+        if issue is None:
+            continue
+
+        ddl = _get_index_ddl(column, usage, dialect)
+        suggestion_key = (column.table.name, column.name, ddl or issue)
+
+        suggestion = suggestions.get(suggestion_key)
+        if suggestion is None:
+            suggestion = {"issue": issue, "keys": [], "ddl": ddl}
+            suggestions[suggestion_key] = suggestion
+        elif issues.index(issue) < issues.index(suggestion["issue"]):
+            suggestion["issue"] = issue
+
+        if key not in suggestion["keys"]:
+            suggestion["keys"].append(key)
+
+    return sorted(
+        (
+            IndexSuggestion(
+                table=table_name,
+                column=column_name,
+                issue=suggestion["issue"],
+                keys=tuple(suggestion["keys"]),
+                ddl=suggestion["ddl"],
+            )
+            for (table_name, column_name, _), suggestion in suggestions.items()
+        ),
+        key=lambda suggestion: (
+            suggestion.table,
+            suggestion.column,
+            suggestion.ddl or "",
+        ),
+    )
+
+
+def _get_usages(
+    model: tp.Type[DeclarativeMeta],
+    filters: tp.Iterable[str] = (),
+    order_by: tp.Iterable[str] = (),
+) -> tp.Iterator[tp.Tuple[Column, str, str]]:
+    for key in filters:
+        for column, usage in _get_key_usages(model, key):
+            yield column, usage, key
+
+    for field in order_by:
+        for column, usage in _get_key_usages(model, field, is_order=True):
+            yield column, usage, field
+
+
+def advise_indexes(
+    model: tp.Type[DeclarativeMeta],
+    filters: tp.Iterable[str] = (),
+    order_by: tp.Iterable[str] = (),
+    dialect: tp.Union[str, Dialect] = "postgresql",
+) -> tp.List[IndexSuggestion]:
+    # Filter keys and order fields are the same as the converter accepts
+    return _advise(
+        _get_usages(model=model, filters=filters, order_by=order_by),
+        dialect=dialect,
+    )
+
+
+def get_filter_model_keys(filter_model: type) -> tp.Tuple[str, ...]:
+    if dataclasses.is_dataclass(filter_model):
+        field_names = [field.name for field in dataclasses.fields(filter_model)]
+    else:
+        # pydantic v2 and v1
+        field_names = list(
+            filter_model.model_fields
+            if hasattr(filter_model, "model_fields")
+            else filter_model.__fields__
+        )
+
+    return tuple(
+        field_name for field_name in field_names if field_name not in QUERY_SPEC_FIELDS
+    )
+
+
+def advise_filter_model_indexes(
+    filter_model: type,
+    order_by: tp.Iterable[str] = (),
+    dialect: tp.Union[str, Dialect] = "postgresql",
+) -> tp.List[IndexSuggestion]:
+    # Every field of a filter model is checked against ConverterConfig.model
+    return advise_indexes(
+        model=filter_model._get_class_converter_config().model,
+        filters=get_filter_model_keys(filter_model),
+        order_by=order_by,
+        dialect=dialect,
+    )
+
+
+def advise_workload_indexes(
+    workload: tp.Iterable[WorkloadRecord],
+    models: tp.Mapping[str, tp.Type[DeclarativeMeta]],
+    dialect: tp.Union[str, Dialect] = "postgresql",
+) -> tp.List[IndexSuggestion]:
+    # Models of records are looked up by their names
+    def get_usages():
+        for workload_record in workload:
+            model = models[workload_record.model]
+
+            if workload_record.kind == WorkloadKind.FILTERS:
+                filters = [filter_shape.key for filter_shape in workload_record.shape]
+                yield from _get_usages(model=model, filters=filters)
+            else:
+                yield from _get_usages(model=model, order_by=workload_record.shape)
+
+    return _advise(get_usages(), dialect=dialect)
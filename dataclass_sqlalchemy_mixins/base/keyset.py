@@ -0,0 +1,72 @@
+import base64
+import binascii
+import datetime
+import decimal
+import enum
+import json
+import typing as tp
+import uuid
+
+
+# Values which are not supported by json
+# are stored in a cursor together with their type
+CURSOR_VALUE_DECODERS: tp.Dict[str, tp.Callable[[str], tp.Any]] = {
+    "datetime": datetime.datetime.fromisoformat,
+    "date": datetime.date.fromisoformat,
+    "time": datetime.time.fromisoformat,
+    "decimal": decimal.Decimal,
+    "uuid": uuid.UUID,
+}
+
+
+def _encode_value(value: tp.Any) -> tp.Any:
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+
+    if isinstance(value, enum.Enum):
+        # Sqlalchemy Enum type accepts names of enum members
+        return value.name
+
+    # datetime should be checked before date
+    # because datetime is a subclass of date
+    for type_name, value_type in (
+        ("datetime", datetime.datetime),
+        ("date", datetime.date),
+        ("time", datetime.time),
+    ):
+        if isinstance(value, value_type):
+            return {"t": type_name, "v": value.isoformat()}
+
+    if isinstance(value, decimal.Decimal):
+        return {"t": "decimal", "v": str(value)}
+
+    if isinstance(value, uuid.UUID):
+        return {"t": "uuid", "v": str(value)}
+
+    raise ValueError(f"Value of type '{type(value).__name__}' can't be used in cursor")
+
+
+def _decode_value(value: tp.Any) -> tp.Any:
+    if isinstance(value, dict):
+        return CURSOR_VALUE_DECODERS[value["t"]](value["v"])
+    return value
+
+
+def encode_cursor(values: tp.Sequence[tp.Any]) -> str:
+    cursor = json.dumps(
+        [_encode_value(value) for value in values],
+        separators=(",", ":"),
+    )
+    return base64.urlsafe_b64encode(cursor.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tp.List[tp.Any]:
+    try:
+        # Padding is removed when a cursor is encoded
+        cursor = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        values = json.loads(cursor)
+        if not isinstance(values, list):
+            raise ValueError
+        return [_decode_value(value) for value in values]
+    except (binascii.Error, KeyError, TypeError, ValueError) as e:
+        raise ValueError("Cursor is not valid") from e
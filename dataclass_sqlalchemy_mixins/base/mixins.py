@@ -1,9 +1,43 @@
+import enum
+import time
 import typing as tp
 
-from sqlalchemy import inspect
-from sqlalchemy.orm import DeclarativeMeta, InstrumentedAttribute, Query
+from sqlalchemy import and_, event, func, inspect, literal, or_, select, tuple_
+from sqlalchemy.orm import DeclarativeMeta, InstrumentedAttribute, Mapper, Query
 from sqlalchemy.orm.util import _ORMJoin
+from sqlalchemy.sql import FromClause
 
+from dataclass_sqlalchemy_mixins.base.cache import LRUCache, LRUCacheInfo
+from dataclass_sqlalchemy_mixins.base.counts import CountResult, estimate_count
+from dataclass_sqlalchemy_mixins.base.in_lists import (
+    IN_SQL_OP,
+    NOT_IN_SQL_OP,
+    InOverflow,
+    InStrategy,
+    get_in_operator,
+    limit_in_operator,
+    switch_in_operator,
+)
+from dataclass_sqlalchemy_mixins.base.keyset import decode_cursor, encode_cursor
+from dataclass_sqlalchemy_mixins.base.relationships import get_relationship
+from dataclass_sqlalchemy_mixins.base.tracing import (
+    Phase,
+    emit,
+    execute,
+    get_shape,
+    get_tracers,
+)
+from dataclass_sqlalchemy_mixins.base.workload import (
+    WorkloadKind,
+    get_filters_shape,
+    get_recorders,
+    record,
+)
+
+
+# Tables joined by the library are stored in a statement attribute
+# so joins can be checked without looking into sqlalchemy internals
+JOINED_TABLES_ATTR = "_dataclass_sqlalchemy_mixins_joined_tables"
 
 SQLALCHEMY_OP_MATCHER = {
     "eq": "__eq__",
@@ -22,46 +56,197 @@ SQLALCHEMY_OP_MATCHER = {
 }
 
 
+# Fields of query models which are not used as filters
+QUERY_SPEC_FIELDS = (
+    "order_by",
+    "limit",
+    "offset",
+)
+
+# Label of a column added by add_total_count
+TOTAL_COUNT_LABEL = "total_count"
+
+
+# Strategy used for filters which paths go through to-many relationships
+class ToManyStrategy(str, enum.Enum):
+    JOIN = "join"  # Inner join of every model in a path
+    EXISTS = "exists"  # Correlated EXISTS subquery without joins
+
+
+# Attributes which can be set in ConverterConfig
+CONVERTER_CONFIG_FIELDS = (
+    "model",
+    "extra",
+    "to_many_strategy",
+    "in_strategy",
+    "in_max_size",
+    "in_overflow",
+    "in_values_threshold",
+    "count_estimate_threshold",
+)
+
+
+class FrozenConverterConfig(tp.NamedTuple):
+    model: tp.Type[DeclarativeMeta] = None
+    extra: tp.Dict[tp.Any, tp.Dict] = None
+    to_many_strategy: ToManyStrategy = ToManyStrategy.JOIN
+    in_strategy: InStrategy = InStrategy.EXPANDING
+    in_max_size: tp.Optional[int] = None
+    in_overflow: InOverflow = InOverflow.ERROR
+    in_values_threshold: tp.Optional[int] = None
+    count_estimate_threshold: tp.Optional[int] = None
+
+
+def resolve_converter_config(converter_config) -> FrozenConverterConfig:
+    # ConverterConfig classes might not set every attribute,
+    # missing and None values are replaced with defaults
+    in_max_size = getattr(converter_config, "in_max_size", None)
+    in_values_threshold = getattr(converter_config, "in_values_threshold", None)
+
+    if in_max_size and in_values_threshold and in_values_threshold > in_max_size:
+        raise ValueError(
+            f"ConverterConfig in_values_threshold ({in_values_threshold}) "
+            f"is greater than in_max_size ({in_max_size})"
+        )
+
+    return FrozenConverterConfig(
+        model=getattr(converter_config, "model", None),
+        extra=getattr(converter_config, "extra", None),
+        to_many_strategy=ToManyStrategy(
+            getattr(converter_config, "to_many_strategy", None) or ToManyStrategy.JOIN
+        ),
+        in_strategy=InStrategy(
+            getattr(converter_config, "in_strategy", None) or InStrategy.EXPANDING
+        ),
+        in_max_size=in_max_size,
+        in_overflow=InOverflow(
+            getattr(converter_config, "in_overflow", None) or InOverflow.ERROR
+        ),
+        in_values_threshold=in_values_threshold,
+        count_estimate_threshold=getattr(
+            converter_config, "count_estimate_threshold", None
+        ),
+    )
+
+
+class ResolvedConverterConfig(tp.NamedTuple):
+    # ConverterConfig and a copy of its attributes which a config was resolved from
+    converter_config: tp.Any
+    attributes: tp.Dict[str, tp.Any]
+    config: FrozenConverterConfig
+
+
+class JoinedTables(tp.NamedTuple):
+    # Number of statement joins the tables were collected from
+    setup_joins_count: int
+    tables: tp.FrozenSet[FromClause]
+
+
 class SqlAlchemyBaseConverterMixin:
+    # Mixins have no instance state,
+    # so subclasses can be used with slots
+    __slots__ = ()
+
     class ConverterConfig:
         model: tp.Type[DeclarativeMeta] = None
         extra: tp.Dict[tp.Any, tp.Dict] = None
+        to_many_strategy: ToManyStrategy = ToManyStrategy.JOIN
+        in_strategy: InStrategy = InStrategy.EXPANDING
+        # Max number of values for in/not_in filters
+        in_max_size: tp.Optional[int] = None
+        in_overflow: InOverflow = InOverflow.ERROR
+        # Lists longer than the threshold use InStrategy.VALUES
+        in_values_threshold: tp.Optional[int] = None
+        # Estimated counts greater than the threshold are returned by get_count
+        count_estimate_threshold: tp.Optional[int] = None
+
+    _resolved_converter_config: tp.ClassVar[tp.Optional[ResolvedConverterConfig]] = None
 
-    def __init__(self, *args, **kwargs):
+    def __init__(
+        self,
+        *args,
+        model: tp.Optional[tp.Type[DeclarativeMeta]] = None,
+        **kwargs,
+    ):
         super().__init__(*args, **kwargs)
-        # Create instance-specific ConverterConfig to avoid shared state between instances
-        from types import SimpleNamespace
 
-        self.ConverterConfig = SimpleNamespace(
-            model=getattr(self.__class__.ConverterConfig, "model", None),
-            extra=getattr(self.__class__.ConverterConfig, "extra", None),
-        )
+        if model is not None:
+            # Instances share a config of a class
+            # unless they are created for another model
+            if not hasattr(self, "__dict__"):
+                raise TypeError(
+                    f"{self.__class__.__name__} uses slots, "
+                    "so model can't be set for an instance. "
+                    "Either pass the model parameter to methods "
+                    "or use SqlAlchemyConverter."
+                )
+            self.ConverterConfig = self._get_class_converter_config()._replace(
+                model=model
+            )
+
+    @classmethod
+    def _get_class_converter_config(cls) -> FrozenConverterConfig:
+        # ConverterConfig is resolved again only when
+        # it is replaced or any of its own attributes is set
+        converter_config = cls.ConverterConfig
+        resolved_converter_config = cls.__dict__.get("_resolved_converter_config")
+
+        if (
+            resolved_converter_config is None
+            or resolved_converter_config.converter_config is not converter_config
+            or resolved_converter_config.attributes != vars(converter_config)
+        ):
+            resolved_converter_config = ResolvedConverterConfig(
+                converter_config=converter_config,
+                attributes=dict(vars(converter_config)),
+                config=resolve_converter_config(converter_config),
+            )
+            cls._resolved_converter_config = resolved_converter_config
+
+        return resolved_converter_config.config
+
+    def _get_converter_config(self) -> FrozenConverterConfig:
+        converter_config = self.ConverterConfig
+
+        if isinstance(converter_config, FrozenConverterConfig):
+            return converter_config
+        return self._get_class_converter_config()
+
+    def _get_model(
+        self,
+        model: tp.Optional[tp.Type[DeclarativeMeta]] = None,
+    ) -> tp.Type[DeclarativeMeta]:
+        # A passed model is used only for the current call
+        # so instances can be shared without leaking models between calls
+        model = model or self._get_converter_config().model
+
+        if model is None:
+            raise ValueError(
+                "ConverterConfig.model value can't be None. "
+                "Either pass the model parameter or set the ConverterConfig.model."
+            )
+        return model
 
     def get_foreign_key_path(
         self,
         models_path_to_look: tp.List[str],
         to_return_column=True,
+        model: tp.Optional[tp.Type[DeclarativeMeta]] = None,
     ) -> tp.Tuple[tp.List[DeclarativeMeta], tp.Union[None, InstrumentedAttribute]]:
-        model = self.ConverterConfig.model
+        model = model or self._get_converter_config().model
 
         # There might more than one relationship
         # so we need to save a path to the target model
         models = []
 
         for path in models_path_to_look:
+            relationship = get_relationship(model, path)
 
-            model_attrs = inspect(model)
-
-            model_relationships = getattr(model_attrs, "relationships", None)
-
-            if model_relationships:
-                related_model = getattr(inspect(model).relationships, path, None)
-
-                if related_model:
-                    # Updating original model to continue search
-                    model = related_model.entity.class_
-                    models.append(model)
-                    continue
+            if relationship:
+                # Updating original model to continue search
+                model = relationship.target
+                models.append(model)
+                continue
 
             # If related model is None
             # we might come to field required filtering
@@ -72,7 +257,47 @@ class SqlAlchemyBaseConverterMixin:
 
         return models, None
 
-    def join_models(self, query, models: tp.List[DeclarativeMeta]):
+    @staticmethod
+    def _get_join_target_table(join_target) -> tp.Optional[FromClause]:
+        # Joins might be made using a model, a relationship attribute or a table
+        join_property = getattr(join_target, "property", None)
+        if join_property is not None and hasattr(join_property, "mapper"):
+            return join_property.mapper.local_table
+
+        if isinstance(join_target, FromClause):
+            return join_target
+
+        join_target_attrs = inspect(join_target, raiseerr=False)
+        if getattr(join_target_attrs, "is_mapper", False):
+            return join_target_attrs.local_table
+        return None
+
+    @staticmethod
+    def _get_setup_joins(query) -> tp.Sequence[tp.Any]:
+        join_methods = [
+            "_legacy_setup_joins",  # sqlalchemy == 1.4
+            "_setup_joins",  # sqlalchemy >= 1.4
+        ]
+        for join_method in join_methods:
+            setup_joins = getattr(query, join_method, None)
+            if setup_joins:
+                # Different sqlalchemy versions might have several join methods
+                # but only one of them will return correct joined models list
+                return setup_joins
+        return ()
+
+    def _get_setup_joins_tables(self, setup_joins) -> tp.Set[FromClause]:
+        joined_tables = set()
+
+        for join in setup_joins:
+            joined_table = self._get_join_target_table(join[0])
+            if joined_table is not None:
+                joined_tables.add(joined_table)
+        return joined_tables
+
+    def _find_joined_tables(self, query) -> tp.Set[FromClause]:
+        # Statements which were not joined by the library yet
+        # are checked once using sqlalchemy internals
         def find_tables(query_from):
             found_tables = []
 
@@ -84,52 +309,253 @@ class SqlAlchemyBaseConverterMixin:
                 return found_tables + find_tables(left)
             return found_tables
 
-        query = query
-
-        joined_models = []
-        join_methods = [
-            "_join_entities",  # sqlalchemy <= 1.3
-            "_legacy_setup_joins",  # sqlalchemy == 1.4
-            "_setup_joins",  # sqlalchemy == 2.0
-        ]
-        for join_method in join_methods:
-            if hasattr(query, join_method):
-                joined_models = [
-                    join[0].entity_namespace for join in getattr(query, join_method)
-                ]
-                # Different sqlalchemy versions might have several join methods
-                # but only one of them will return correct joined models list
-                if joined_models:
-                    break
+        joined_tables = self._get_setup_joins_tables(self._get_setup_joins(query))
 
         # Sometimes on all joined models can not be found using join methods
         # so trying to find it one more time if we haven't found them eariler
-        joined_tables = []
-        if not joined_models and not isinstance(query, Query):
-            query_froms = query.froms
+        if not joined_tables and not isinstance(query, Query):
+            get_final_froms = getattr(query, "get_final_froms", None)
+            query_froms = get_final_froms() if get_final_froms else query.froms
+
             for query_from in query_froms:
-                joined_tables.extend(find_tables(query_from))
+                joined_tables.update(find_tables(query_from))
+
+        return joined_tables
+
+    def get_joined_tables(self, query) -> tp.FrozenSet[FromClause]:
+        joined_tables = getattr(query, JOINED_TABLES_ATTR, None)
+
+        if joined_tables is None:
+            return frozenset(self._find_joined_tables(query))
+
+        # The registry is copied to every statement generated from the joined one
+        # so joins added by a caller afterwards are looked up separately
+        setup_joins = self._get_setup_joins(query)
+        if len(setup_joins) == joined_tables.setup_joins_count:
+            return joined_tables.tables
+
+        return joined_tables.tables | self._get_setup_joins_tables(
+            setup_joins[joined_tables.setup_joins_count :]
+        )
+
+    def join_models(
+        self,
+        query,
+        models: tp.List[DeclarativeMeta],
+        model: tp.Optional[tp.Type[DeclarativeMeta]] = None,
+    ):
+        base_model = model or self._get_converter_config().model
+
+        tracers = get_tracers()
+        if tracers:
+            started = time.perf_counter()
+
+        joined_tables = set(self.get_joined_tables(query))
+        if base_model is not None:
+            joined_tables.add(base_model.__table__)
+
+        joined_models = []
 
         for model in models:
-            if model != self.ConverterConfig.model and model not in joined_models:
-                if joined_tables and model.__table__ in joined_tables:
-                    continue
-                query = query.join(model)
+            table = model.__table__
+
+            if table in joined_tables:
+                continue
+
+            query = query.join(model)
+            joined_tables.add(table)
+            joined_models.append(model)
+
+        if joined_models:
+            # Registry of joined tables is copied
+            # by sqlalchemy together with a statement
+            # when new statements are generated from it
+            setattr(
+                query,
+                JOINED_TABLES_ATTR,
+                JoinedTables(
+                    setup_joins_count=len(self._get_setup_joins(query)),
+                    tables=frozenset(joined_tables),
+                ),
+            )
+
+        if tracers:
+            emit(
+                tracers,
+                Phase.JOIN,
+                started,
+                model=base_model,
+                models=[model.__name__ for model in models],
+                joined_models=[model.__name__ for model in joined_models],
+            )
+
+        return query
+
+    @staticmethod
+    def add_total_count(query, label: str = TOTAL_COUNT_LABEL):
+        # Window function is evaluated before LIMIT and OFFSET
+        # so every row of a page contains the number of all filtered rows
+        return query.add_columns(func.count().over().label(label))
+
+    def apply_models_expressions(
+        self,
+        query,
+        models_binary_expressions: tp.List[tp.Dict[str, tp.Any]] = None,
+        models_unary_expressions: tp.List[tp.Dict[str, tp.Any]] = None,
+        limit: tp.Optional[int] = None,
+        offset: tp.Optional[int] = None,
+        model: tp.Optional[tp.Type[DeclarativeMeta]] = None,
+    ):
+        model = self._get_model(model)
+
+        models_binary_expressions = models_binary_expressions or []
+        models_unary_expressions = models_unary_expressions or []
+
+        # Models required by filters and orderings are collected together
+        # so every model is joined only once keeping the order of a path
+        models_to_join = {}
+        binary_expressions = []
+        unary_expressions = []
+
+        for binary_expression in models_binary_expressions:
+            models_to_join.update(dict.fromkeys(binary_expression["models"]))
+            binary_expressions.append(binary_expression["binary_expression"])
+
+        for unary_expression in models_unary_expressions:
+            models_to_join.update(dict.fromkeys(unary_expression["models"]))
+            unary_expressions.append(unary_expression["unary_expression"])
+
+        # Checking if there are other models required to be joined
+        models_to_join.pop(model, None)
+        if models_to_join:
+            query = self.join_models(
+                query=query,
+                models=list(models_to_join),
+                model=model,
+            )
+
+        if binary_expressions:
+            query = query.filter(*binary_expressions)
+
+        if unary_expressions:
+            query = query.order_by(*unary_expressions)
+
+        if limit is not None:
+            query = query.limit(limit)
+
+        if offset is not None:
+            query = query.offset(offset)
 
         return query
 
 
+class FilterPlanOptions(tp.NamedTuple):
+    to_many_strategy: ToManyStrategy = ToManyStrategy.JOIN
+    in_strategy: InStrategy = InStrategy.EXPANDING
+    in_max_size: tp.Optional[int] = None
+    in_overflow: InOverflow = InOverflow.ERROR
+    in_values_threshold: tp.Optional[int] = None
+    eliminate_foreign_key_joins: bool = True
+
+
+class FilterPlan(tp.NamedTuple):
+    models: tp.Tuple[DeclarativeMeta, ...]
+    db_field: InstrumentedAttribute
+    operator: tp.Callable[[tp.Any], tp.Any]
+    # any()/has() of relationships in a path from the last one to the first one
+    exists_operators: tp.Tuple[tp.Callable[[tp.Any], tp.Any], ...] = ()
+
+
 class SqlAlchemyFilterConverterMixin(SqlAlchemyBaseConverterMixin):
+    __slots__ = ()
+
     DEFAULT_SQLALCHEMY_SQL_OP = SQLALCHEMY_OP_MATCHER.get("eq")
 
-    def _get_filter_binary_expression(
+    # Filters by a related model primary key use a local foreign key
+    # instead of joining the related model
+    ELIMINATE_FOREIGN_KEY_JOINS = True
+
+    FILTER_PLAN_CACHE_SIZE = 1024
+
+    # Filter plans depend only on a model and a filter key
+    # so they are shared between all converter instances
+    _filter_plan_cache = LRUCache(maxsize=FILTER_PLAN_CACHE_SIZE)
+
+    @classmethod
+    def get_filter_plan_cache_info(cls) -> LRUCacheInfo:
+        return cls._filter_plan_cache.info()
+
+    @classmethod
+    def clear_filter_plan_cache(cls):
+        cls._filter_plan_cache.clear()
+
+    def _get_filter_plan_options(
         self,
+        to_many_strategy: tp.Optional[ToManyStrategy] = None,
+    ) -> FilterPlanOptions:
+        converter_config = self._get_converter_config()
+
+        return FilterPlanOptions(
+            to_many_strategy=ToManyStrategy(
+                to_many_strategy or converter_config.to_many_strategy
+            ),
+            in_strategy=converter_config.in_strategy,
+            in_max_size=converter_config.in_max_size,
+            in_overflow=converter_config.in_overflow,
+            in_values_threshold=converter_config.in_values_threshold,
+        )
+
+    @staticmethod
+    def _get_exists_operators(
+        model: tp.Type[DeclarativeMeta],
+        models_path: tp.List[str],
+    ) -> tp.Tuple[tp.Callable[[tp.Any], tp.Any], ...]:
+        exists_operators = []
+        is_to_many = False
+
+        for path in models_path:
+            relationship = get_relationship(model, path)
+            if relationship is None:
+                break
+
+            relationship_attr = getattr(model, relationship.name)
+            is_to_many = is_to_many or relationship.uselist
+
+            exists_operators.append(
+                relationship_attr.any if relationship.uselist else relationship_attr.has
+            )
+            model = relationship.target
+
+        # Paths without to-many relationships don't multiply rows
+        # so joins are used for them
+        if not is_to_many:
+            return ()
+        return tuple(reversed(exists_operators))
+
+    @staticmethod
+    def _get_foreign_key_db_field(
+        model: tp.Type[DeclarativeMeta],
+        models: tp.List[DeclarativeMeta],
+        models_path: tp.List[str],
         field: str,
-        value: tp.Any,
-    ):
+    ) -> tp.Optional[InstrumentedAttribute]:
+        parent_model = models[-2] if len(models) > 1 else model
+
+        relationship = get_relationship(parent_model, models_path[-1])
+        if relationship is None:
+            return None
+        return relationship.local_columns.get(field)
+
+    def _get_filter_plan(
+        self,
+        field: str,
+        model: tp.Type[DeclarativeMeta],
+        options: FilterPlanOptions = FilterPlanOptions(),
+    ) -> FilterPlan:
         db_field = None
         sql_op = None
         models = []
+        exists_operators = ()
 
         if "__" in field:
             # There might be several relationship
@@ -142,49 +568,181 @@ class SqlAlchemyFilterConverterMixin(SqlAlchemyBaseConverterMixin):
 
             sql_op = SQLALCHEMY_OP_MATCHER.get(last_param)
 
-            if sql_op == "isnull":
-                sql_op = (
-                    SQLALCHEMY_OP_MATCHER.get("is")
-                    if value
-                    else SQLALCHEMY_OP_MATCHER.get("is_not")
-                )
-                value = None
-
             if sql_op:
                 filter_params = filter_params[:-1]
 
             if len(filter_params) > 1:
                 models, db_field = self.get_foreign_key_path(
                     models_path_to_look=filter_params,
+                    model=model,
                 )
                 if db_field is None:
                     raise ValueError
+
+                # Joins can't be dropped for "IS NULL" filters
+                # since rows without related models would be returned
+                is_null_op = sql_op in (
+                    SQLALCHEMY_OP_MATCHER.get("is"),
+                    SQLALCHEMY_OP_MATCHER.get("isnull"),
+                )
+                if (
+                    self.ELIMINATE_FOREIGN_KEY_JOINS
+                    and options.eliminate_foreign_key_joins
+                    and not is_null_op
+                ):
+                    foreign_key_db_field = self._get_foreign_key_db_field(
+                        model=model,
+                        models=models,
+                        models_path=filter_params[: len(models)],
+                        field=filter_params[len(models)],
+                    )
+                    if foreign_key_db_field is not None:
+                        models = models[:-1]
+                        db_field = foreign_key_db_field
+
+                if options.to_many_strategy == ToManyStrategy.EXISTS:
+                    exists_operators = self._get_exists_operators(
+                        model=model,
+                        models_path=filter_params[: len(models)],
+                    )
+                    if exists_operators:
+                        models = []
             else:
                 field = filter_params[0]
 
         if db_field is None:
-            db_field = getattr(self.ConverterConfig.model, field)
+            db_field = getattr(model, field)
 
         if sql_op is None:
             sql_op = self.DEFAULT_SQLALCHEMY_SQL_OP
 
         models = models or [
-            self.ConverterConfig.model,
+            model,
         ]
 
-        return models, getattr(db_field, sql_op)(value)
+        if sql_op == "isnull":
+            is_null = getattr(db_field, SQLALCHEMY_OP_MATCHER.get("is"))
+            is_not_null = getattr(db_field, SQLALCHEMY_OP_MATCHER.get("is_not"))
 
-    def get_models_binary_expressions(
-        self, filters: tp.Dict[str, tp.Any], model: DeclarativeMeta = None
+            def operator(value):
+                return is_null(None) if value else is_not_null(None)
+
+        elif sql_op in (IN_SQL_OP, NOT_IN_SQL_OP):
+            operator = get_in_operator(
+                db_field=db_field,
+                sql_op=sql_op,
+                in_strategy=options.in_strategy,
+            )
+
+            if options.in_values_threshold:
+                operator = switch_in_operator(
+                    operator=operator,
+                    values_operator=get_in_operator(
+                        db_field=db_field,
+                        sql_op=sql_op,
+                        in_strategy=InStrategy.VALUES,
+                    ),
+                    in_values_threshold=options.in_values_threshold,
+                )
+
+            # The limit is checked before a strategy is chosen
+            # so it applies to lists passed as VALUES as well
+            if options.in_max_size:
+                operator = limit_in_operator(
+                    operator=operator,
+                    sql_op=sql_op,
+                    in_max_size=options.in_max_size,
+                    in_overflow=options.in_overflow,
+                )
+
+        else:
+            operator = getattr(db_field, sql_op)
+
+        return FilterPlan(
+            models=tuple(models),
+            db_field=db_field,
+            operator=operator,
+            exists_operators=exists_operators,
+        )
+
+    def _get_filter_binary_expression(
+        self,
+        field: str,
+        value: tp.Any,
+        model: tp.Optional[tp.Type[DeclarativeMeta]] = None,
+        options: tp.Optional[FilterPlanOptions] = None,
+        shape: tp.Optional[tp.Tuple[str, ...]] = None,
     ):
-        if model:
-            self.ConverterConfig.model = model
+        model = model or self._get_converter_config().model
 
-        if self.ConverterConfig.model is None:
-            raise ValueError(
-                "ConverterConfig.model value can't be None. "
-                "Either pass the model parameter or set the ConverterConfig.model."
+        if options is None:
+            options = self._get_filter_plan_options()
+
+        # Comparisons with None are compiled into "IS NULL"
+        # so joins are kept for them as well
+        if value is None and options.eliminate_foreign_key_joins:
+            options = options._replace(eliminate_foreign_key_joins=False)
+
+        tracers = get_tracers()
+        if tracers:
+            started = time.perf_counter()
+
+        # Subclasses might resolve the same field into another plan
+        cache_key = (
+            type(self),
+            model,
+            field,
+            self.DEFAULT_SQLALCHEMY_SQL_OP,
+            self.ELIMINATE_FOREIGN_KEY_JOINS,
+            options,
+        )
+
+        filter_plan = self._filter_plan_cache.get(cache_key)
+        cache_hit = filter_plan is not None
+
+        if filter_plan is None:
+            filter_plan = self._get_filter_plan(
+                field=field,
+                model=model,
+                options=options,
+            )
+            self._filter_plan_cache.set(cache_key, filter_plan)
+
+        if tracers:
+            emit(
+                tracers,
+                Phase.RESOLVE,
+                started,
+                model=model,
+                key=field,
+                shape=shape,
+                cache_hit=cache_hit,
             )
+            started = time.perf_counter()
+
+        filter_binary_expression = filter_plan.operator(value)
+
+        for exists_operator in filter_plan.exists_operators:
+            filter_binary_expression = exists_operator(filter_binary_expression)
+
+        if tracers:
+            emit(tracers, Phase.BUILD, started, model=model, key=field, shape=shape)
+
+        return list(filter_plan.models), filter_binary_expression
+
+    def get_models_binary_expressions(
+        self,
+        filters: tp.Dict[str, tp.Any],
+        model: DeclarativeMeta = None,
+        to_many_strategy: tp.Optional[ToManyStrategy] = None,
+    ):
+        model = self._get_model(model)
+        options = self._get_filter_plan_options(to_many_strategy=to_many_strategy)
+        shape = get_shape(filters) if get_tracers() else None
+
+        recorders = get_recorders()
+        if recorders:
+            started = time.perf_counter()
 
         model_filters = []
 
@@ -192,6 +750,9 @@ class SqlAlchemyFilterConverterMixin(SqlAlchemyBaseConverterMixin):
             models, filter_binary_expression = self._get_filter_binary_expression(
                 field=field,
                 value=value,
+                model=model,
+                options=options,
+                shape=shape,
             )
             model_filters.append(
                 {
@@ -199,27 +760,116 @@ class SqlAlchemyFilterConverterMixin(SqlAlchemyBaseConverterMixin):
                     "binary_expression": filter_binary_expression,
                 }
             )
+
+        if recorders:
+            record(
+                recorders,
+                WorkloadKind.FILTERS,
+                model=model,
+                shape=get_filters_shape(filters, ops=SQLALCHEMY_OP_MATCHER),
+                started=started,
+            )
         return model_filters
 
     def get_binary_expressions(
         self,
         filters: tp.Dict[str, tp.Any],
         model: DeclarativeMeta = None,
+        to_many_strategy: tp.Optional[ToManyStrategy] = None,
     ):
         return [
             binary_expression["binary_expression"]
             for binary_expression in self.get_models_binary_expressions(
                 filters=filters,
                 model=model,
+                to_many_strategy=to_many_strategy,
             )
         ]
 
+    def _apply_count_filters(
+        self,
+        query,
+        filters: tp.Optional[tp.Dict[str, tp.Any]],
+        model: tp.Type[DeclarativeMeta],
+    ):
+        models_binary_expressions = None
+        if filters:
+            # Joins of to-many relationships would multiply counted rows
+            models_binary_expressions = self.get_models_binary_expressions(
+                filters=filters,
+                model=model,
+                to_many_strategy=ToManyStrategy.EXISTS,
+            )
 
-class SqlAlchemyOrderConverterMixin(SqlAlchemyBaseConverterMixin):
-    def _get_order_unary_expression(
+        return self.apply_models_expressions(
+            query=query,
+            models_binary_expressions=models_binary_expressions,
+            model=model,
+        )
+
+    def _get_count_query(
         self,
-        field,
+        filters: tp.Optional[tp.Dict[str, tp.Any]],
+        model: tp.Type[DeclarativeMeta],
     ):
+        return self._apply_count_filters(
+            query=select(func.count()).select_from(model),
+            filters=filters,
+            model=model,
+        )
+
+    def get_count_query(
+        self,
+        filters: tp.Optional[tp.Dict[str, tp.Any]] = None,
+        model: tp.Optional[tp.Type[DeclarativeMeta]] = None,
+    ):
+        return self._get_count_query(filters=filters, model=self._get_model(model))
+
+    def get_count(
+        self,
+        session,
+        filters: tp.Optional[tp.Dict[str, tp.Any]] = None,
+        model: tp.Optional[tp.Type[DeclarativeMeta]] = None,
+        estimate_threshold: tp.Optional[int] = None,
+    ) -> CountResult:
+        model = self._get_model(model)
+
+        estimate_threshold = (
+            estimate_threshold or self._get_converter_config().count_estimate_threshold
+        )
+
+        if estimate_threshold:
+            # Planner estimates number of rows of a query
+            # and not of "SELECT count(*)" which returns one row
+            estimated_count = estimate_count(
+                session=session,
+                query=self._apply_count_filters(
+                    query=select(*inspect(model).primary_key),
+                    filters=filters,
+                    model=model,
+                ),
+                model=model,
+            )
+
+            if estimated_count is not None and estimated_count > estimate_threshold:
+                return CountResult(count=estimated_count, is_approximate=True)
+
+        count_query = self._get_count_query(filters=filters, model=model)
+
+        return CountResult(
+            count=execute(session=session, query=count_query, model=model).scalar_one()
+        )
+
+
+class SqlAlchemyOrderConverterMixin(SqlAlchemyBaseConverterMixin):
+    __slots__ = ()
+
+    def _get_order_field(
+        self,
+        field: str,
+        model: tp.Type[DeclarativeMeta],
+    ) -> tp.Tuple[tp.List[DeclarativeMeta], InstrumentedAttribute, str]:
+
         db_field = None
 
         sql_order_by_direction = "asc"
@@ -239,6 +889,7 @@ class SqlAlchemyOrderConverterMixin(SqlAlchemyBaseConverterMixin):
             if len(order_params) > 1:
                 models, db_field = self.get_foreign_key_path(
                     models_path_to_look=order_params,
+                    model=model,
                 )
                 if db_field is None:
                     raise ValueError
@@ -246,27 +897,49 @@ class SqlAlchemyOrderConverterMixin(SqlAlchemyBaseConverterMixin):
                 field = order_params[0]
 
         if db_field is None:
-            db_field = getattr(self.ConverterConfig.model, field)
+            db_field = getattr(model, field)
 
         models = models or [
-            self.ConverterConfig.model,
+            model,
         ]
 
-        return models, getattr(db_field, sql_order_by_direction)()
+        return models, db_field, sql_order_by_direction
+
+    def _get_order_unary_expression(
+        self,
+        field,
+        model: tp.Optional[tp.Type[DeclarativeMeta]] = None,
+        shape: tp.Optional[tp.Tuple[str, ...]] = None,
+    ):
+        model = model or self._get_converter_config().model
+
+        tracers = get_tracers()
+        if tracers:
+            started = time.perf_counter()
+
+        models, db_field, sql_order_by_direction = self._get_order_field(
+            field=field,
+            model=model,
+        )
+
+        if not tracers:
+            return models, getattr(db_field, sql_order_by_direction)()
+
+        emit(tracers, Phase.RESOLVE, started, model=model, key=field, shape=shape)
+        started = time.perf_counter()
+
+        unary_expression = getattr(db_field, sql_order_by_direction)()
+
+        emit(tracers, Phase.BUILD, started, model=model, key=field, shape=shape)
+
+        return models, unary_expression
 
     def get_models_unary_expressions(
         self,
         order_by: tp.Union[tp.Any, tp.List],
         model: DeclarativeMeta = None,
     ):
-        if model:
-            self.ConverterConfig.model = model
-
-        if self.ConverterConfig.model is None:
-            raise ValueError(
-                "ConverterConfig.model value can't be None. "
-                "Either pass the model parameter or set the ConverterConfig.model."
-            )
+        model = self._get_model(model)
 
         model_order_by = []
 
@@ -275,11 +948,20 @@ class SqlAlchemyOrderConverterMixin(SqlAlchemyBaseConverterMixin):
                 order_by,
             ]
 
+        # Order of fields is a part of a shape
+        shape = tuple(map(str, order_by)) if get_tracers() else None
+
+        recorders = get_recorders()
+        if recorders:
+            started = time.perf_counter()
+
         for field in order_by:
             field = str(field)
 
             models, filter_binary_expression = self._get_order_unary_expression(
                 field=field,
+                model=model,
+                shape=shape,
             )
             model_order_by.append(
                 {
@@ -287,6 +969,15 @@ class SqlAlchemyOrderConverterMixin(SqlAlchemyBaseConverterMixin):
                     "unary_expression": filter_binary_expression,
                 }
             )
+
+        if recorders:
+            record(
+                recorders,
+                WorkloadKind.ORDER_BY,
+                model=model,
+                shape=tuple(map(str, order_by)),
+                started=started,
+            )
         return model_order_by
 
     def get_unary_expressions(
@@ -299,3 +990,231 @@ class SqlAlchemyOrderConverterMixin(SqlAlchemyBaseConverterMixin):
                 model=model,
             )
         ]
+
+    def _get_keyset_order_by(
+        self,
+        order_by: tp.Union[str, tp.List[str]],
+        model: tp.Type[DeclarativeMeta],
+    ) -> tp.List[str]:
+        if order_by is None:
+            order_by = []
+
+        if isinstance(order_by, str):
+            order_by = [
+                order_by,
+            ]
+
+        order_by = [str(field) for field in order_by]
+
+        # Primary key is added to the ordering as a tiebreaker
+        # so rows with equal values are never skipped between pages
+        ordered_fields = {field.lstrip("-") for field in order_by}
+        tiebreaker_direction = "-" if order_by and order_by[-1].startswith("-") else ""
+
+        model_attrs = inspect(model)
+        for primary_key_column in model_attrs.primary_key:
+            primary_key_field = model_attrs.get_property_by_column(
+                primary_key_column
+            ).key
+
+            if primary_key_field not in ordered_fields:
+                order_by.append(f"{tiebreaker_direction}{primary_key_field}")
+
+        return order_by
+
+    @staticmethod
+    def _get_keyset_binary_expression(
+        db_fields: tp.List[InstrumentedAttribute],
+        directions: tp.List[str],
+        values: tp.List[tp.Any],
+    ):
+        values = [
+            literal(value, type_=db_field.type)
+            for db_field, value in zip(db_fields, values)
+        ]
+
+        if len(set(directions)) == 1:
+            # Row values comparison can use a composite index directly
+            sql_op = "__gt__" if directions[0] == "asc" else "__lt__"
+            return getattr(tuple_(*db_fields), sql_op)(tuple_(*values))
+
+        # Mixed directions require an expanded comparison:
+        # (a > x) OR (a = x AND b < y) OR (a = x AND b = y AND c > z)
+        binary_expressions = []
+        for i, (db_field, direction, value) in enumerate(
+            zip(db_fields, directions, values)
+        ):
+            sql_op = "__gt__" if direction == "asc" else "__lt__"
+            binary_expressions.append(
+                and_(
+                    *[
+                        previous_db_field == previous_value
+                        for previous_db_field, previous_value in zip(
+                            db_fields[:i], values[:i]
+                        )
+                    ],
+                    getattr(db_field, sql_op)(value),
+                )
+            )
+        return or_(*binary_expressions)
+
+    def get_models_keyset_expressions(
+        self,
+        order_by: tp.Union[str, tp.List[str]],
+        cursor: tp.Optional[str] = None,
+        model: tp.Optional[tp.Type[DeclarativeMeta]] = None,
+    ) -> tp.Tuple[tp.List[tp.Dict[str, tp.Any]], tp.List[tp.Dict[str, tp.Any]]]:
+        model = self._get_model(model)
+
+        order_by = self._get_keyset_order_by(order_by=order_by, model=model)
+
+        models_unary_expressions = self.get_models_unary_expressions(
+            order_by=order_by,
+            model=model,
+        )
+
+        if cursor is None:
+            return [], models_unary_expressions
+
+        values = decode_cursor(cursor)
+        if len(values) != len(order_by):
+            raise ValueError("Cursor doesn't match order_by")
+
+        models = []
+        db_fields = []
+        directions = []
+        for field in order_by:
+            field_models, db_field, direction = self._get_order_field(
+                field=field,
+                model=model,
+            )
+            models += field_models
+            db_fields.append(db_field)
+            directions.append(direction)
+
+        models_binary_expressions = [
+            {
+                "models": models,
+                "binary_expression": self._get_keyset_binary_expression(
+                    db_fields=db_fields,
+                    directions=directions,
+                    values=values,
+                ),
+            }
+        ]
+        return models_binary_expressions, models_unary_expressions
+
+    def apply_keyset_pagination(
+        self,
+        query,
+        order_by: tp.Union[str, tp.List[str]],
+        cursor: tp.Optional[str] = None,
+        limit: tp.Optional[int] = None,
+        model: tp.Optional[tp.Type[DeclarativeMeta]] = None,
+    ):
+        (
+            models_binary_expressions,
+            models_unary_expressions,
+        ) = self.get_models_keyset_expressions(
+            order_by=order_by,
+            cursor=cursor,
+            model=model,
+        )
+
+        return self.apply_models_expressions(
+            query=query,
+            models_binary_expressions=models_binary_expressions,
+            models_unary_expressions=models_unary_expressions,
+            limit=limit,
+            model=model,
+        )
+
+    def get_next_cursor(
+        self,
+        row: tp.Any,
+        order_by: tp.Union[str, tp.List[str]],
+        model: tp.Optional[tp.Type[DeclarativeMeta]] = None,
+    ) -> str:
+        model = self._get_model(model)
+
+        # Rows returned by select(model) contain an entity as the first element,
+        # rows of selected columns are read by their keys or attributes
+        row_mapping = None
+        if not isinstance(row, model):
+            if isinstance(row[0], model):
+                row = row[0]
+            else:
+                row_mapping = row._mapping
+
+        values = []
+        for field in self._get_keyset_order_by(order_by=order_by, model=model):
+            key = field.lstrip("-")
+
+            if row_mapping is not None and key in row_mapping:
+                value = row_mapping[key]
+            else:
+                value = row
+                for path in key.split("__"):
+                    value = getattr(value, path)
+
+            if value is None:
+                raise ValueError(
+                    f"Keyset pagination can't be used for '{field}' with NULL values"
+                )
+            values.append(value)
+
+        return encode_cursor(values)
+
+
+class SqlAlchemyQueryConverterMixin(
+    SqlAlchemyFilterConverterMixin,
+    SqlAlchemyOrderConverterMixin,
+):
+    __slots__ = ()
+
+    def apply_query_spec(
+        self,
+        query,
+        filters: tp.Optional[tp.Dict[str, tp.Any]] = None,
+        order_by: tp.Optional[tp.Union[str, tp.List[str]]] = None,
+        limit: tp.Optional[int] = None,
+        offset: tp.Optional[int] = None,
+        model: tp.Optional[tp.Type[DeclarativeMeta]] = None,
+        to_many_strategy: tp.Optional[ToManyStrategy] = None,
+        with_total_count: bool = False,
+    ):
+        model = self._get_model(model)
+
+        if with_total_count:
+            query = self.add_total_count(query)
+
+        models_binary_expressions = None
+        if filters:
+            models_binary_expressions = self.get_models_binary_expressions(
+                filters=filters,
+                model=model,
+                to_many_strategy=to_many_strategy,
+            )
+
+        models_unary_expressions = None
+        if order_by:
+            models_unary_expressions = self.get_models_unary_expressions(
+                order_by=order_by,
+                model=model,
+            )
+
+        return self.apply_models_expressions(
+            query=query,
+            models_binary_expressions=models_binary_expressions,
+            models_unary_expressions=models_unary_expressions,
+            limit=limit,
+            offset=offset,
+            model=model,
+        )
+
+
+@event.listens_for(Mapper, "after_configured")
+def _clear_filter_plan_cache():
+    # Newly configured mappers might change relationships
+    # used by already resolved filter plans
+    SqlAlchemyFilterConverterMixin._filter_plan_cache.clear(reset_stats=False)
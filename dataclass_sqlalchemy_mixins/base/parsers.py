@@ -0,0 +1,137 @@
+import datetime
+import decimal
+import enum
+import typing as tp
+import uuid
+
+
+# Key of ConverterConfig.extra listing fields passed as strings with delimiter ','
+LIST_AS_STRING = "list_as_string"
+
+ValueParser = tp.Callable[[str], tp.Any]
+ListParser = tp.Callable[[str], tp.List[tp.Any]]
+
+
+def _get_enum_parser(enum_class: tp.Type[enum.Enum]) -> ValueParser:
+    # Enum members can be passed by values or by names
+    members = {
+        **{member.name: member for member in enum_class},
+        **{str(member.value): member for member in enum_class},
+    }
+
+    def parse_enum(value: str) -> enum.Enum:
+        try:
+            return members[value]
+        except KeyError:
+            raise ValueError(
+                f"'{value}' is not a valid {enum_class.__name__}"
+            ) from None
+
+    return parse_enum
+
+
+VALUE_PARSERS: tp.Dict[type, ValueParser] = {
+    str: str,
+    int: int,
+    float: float,
+    decimal.Decimal: decimal.Decimal,
+    uuid.UUID: uuid.UUID,
+    datetime.date: datetime.date.fromisoformat,
+    datetime.datetime: datetime.datetime.fromisoformat,
+    datetime.time: datetime.time.fromisoformat,
+}
+
+
+def get_value_parser(expected_type: tp.Any) -> ValueParser:
+    if isinstance(expected_type, type) and issubclass(expected_type, enum.Enum):
+        return _get_enum_parser(expected_type)
+
+    # Any other callable is used as it is
+    return VALUE_PARSERS.get(expected_type, expected_type)
+
+
+def get_list_parser(expected_type: tp.Any = str) -> ListParser:
+    value_parser = get_value_parser(expected_type)
+
+    if value_parser is str:
+
+        def parse_list(value: str) -> tp.List[tp.Any]:
+            return [item.strip() for item in value.split(",")]
+
+    else:
+
+        def parse_list(value: str) -> tp.List[tp.Any]:
+            return [value_parser(item.strip()) for item in value.split(",")]
+
+    return parse_list
+
+
+def get_list_as_string_parsers(
+    extra: tp.Optional[tp.Dict[tp.Any, tp.Dict]],
+) -> tp.Dict[str, ListParser]:
+    list_as_string = (extra or {}).get(LIST_AS_STRING)
+
+    if not list_as_string:
+        return {}
+
+    fields = list_as_string.get("fields") or ()
+    if isinstance(fields, str):
+        fields = (fields,)
+
+    expected_types = list_as_string.get("expected_types") or {}
+
+    return {
+        field_name: get_list_parser(expected_types.get(field_name, str))
+        for field_name in fields
+    }
+
+
+class ListAsStringParsers(tp.NamedTuple):
+    # ConverterConfig.extra which parsers were compiled from
+    extra: tp.Optional[tp.Dict[tp.Any, tp.Dict]]
+    parsers: tp.Dict[str, ListParser]
+
+
+class ListAsStringParsersMixin:
+    # LIST_AS_STRING parsers are compiled once per class
+    # and compiled again only when ConverterConfig.extra is replaced
+    __slots__ = ()
+
+    _list_as_string_parsers: tp.ClassVar[tp.Optional[ListAsStringParsers]] = None
+
+    @classmethod
+    def _compile_list_as_string_parsers(
+        cls,
+        extra: tp.Optional[tp.Dict[tp.Any, tp.Dict]],
+    ) -> tp.Dict[str, ListParser]:
+        return get_list_as_string_parsers(extra)
+
+    @classmethod
+    def _get_list_as_string_parsers(cls) -> tp.Dict[str, ListParser]:
+        converter_config = getattr(cls, "ConverterConfig", None)
+        extra = getattr(converter_config, "extra", None)
+
+        list_as_string_parsers = cls.__dict__.get("_list_as_string_parsers")
+
+        if list_as_string_parsers is None or list_as_string_parsers.extra is not extra:
+            list_as_string_parsers = ListAsStringParsers(
+                extra=extra,
+                parsers=cls._compile_list_as_string_parsers(extra),
+            )
+            cls._list_as_string_parsers = list_as_string_parsers
+
+        return list_as_string_parsers.parsers
+
+
+class OrderByAsStringParsersMixin(ListAsStringParsersMixin):
+    __slots__ = ()
+
+    @classmethod
+    def _compile_list_as_string_parsers(
+        cls,
+        extra: tp.Optional[tp.Dict[tp.Any, tp.Dict]],
+    ) -> tp.Dict[str, ListParser]:
+        # order_by is always a list of strings
+        if LIST_AS_STRING not in (extra or {}):
+            return {}
+        return {"order_by": get_list_parser(str)}
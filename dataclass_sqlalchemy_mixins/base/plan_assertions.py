@@ -0,0 +1,89 @@
+import json
+import typing as tp
+
+from sqlalchemy import select
+from sqlalchemy.sql.selectable import Join
+
+from dataclass_sqlalchemy_mixins.base.explain import QueryPlan, get_query_plan
+
+
+def build_query(*converter_models, query=None):
+    # Query is built the same way as by an application:
+    # query models apply a whole query spec, other models filters or orderings
+    if query is None:
+        query = select(converter_models[0]._get_model())
+
+    for converter_model in converter_models:
+        if hasattr(converter_model, "apply_query_spec"):
+            query = converter_model.apply_query_spec(query=query)
+        elif hasattr(converter_model, "apply_filters"):
+            query = converter_model.apply_filters(query=query)
+        else:
+            query = converter_model.apply_order_by(query=query)
+
+    return query
+
+
+def count_joins(query) -> int:
+    # Joins are counted in a statement rather than in a plan
+    # since databases might turn subqueries into joins and back
+    statement = getattr(query, "statement", query)
+
+    def count_from_joins(query_from) -> int:
+        if isinstance(query_from, Join):
+            return (
+                1
+                + count_from_joins(query_from.left)
+                + count_from_joins(query_from.right)
+            )
+        return 0
+
+    return sum(
+        count_from_joins(query_from) for query_from in statement.get_final_froms()
+    )
+
+
+def format_query_plan(query_plan: QueryPlan) -> str:
+    if isinstance(query_plan.plan, dict):
+        return json.dumps(query_plan.plan, indent=2)
+    return "\n".join(detail for *_, detail in query_plan.plan)
+
+
+def _get_table_name(table) -> str:
+    # Tables can be passed as names, tables or models
+    return getattr(table, "__tablename__", None) or getattr(table, "name", table)
+
+
+def assert_query_plan(
+    session,
+    *converter_models,
+    query=None,
+    uses_indexes: tp.Iterable[str] = (),
+    no_full_scans: tp.Iterable[tp.Any] = (),
+    max_joins: tp.Optional[int] = None,
+) -> QueryPlan:
+    if converter_models:
+        query = build_query(*converter_models, query=query)
+
+    query_plan = get_query_plan(session, query)
+    errors = []
+
+    for index_name in uses_indexes:
+        if index_name not in query_plan.used_indexes:
+            errors.append(f"Index {index_name} is not used")
+
+    for table in no_full_scans:
+        table_name = _get_table_name(table)
+        if table_name in query_plan.full_scans:
+            errors.append(f"Table {table_name} is fully scanned")
+
+    if max_joins is not None:
+        joins = count_joins(query)
+        if joins > max_joins:
+            errors.append(f"Query has {joins} joins, expected at most {max_joins}")
+
+    if errors:
+        raise AssertionError(
+            "\n".join(errors) + "\nQuery plan:\n" + format_query_plan(query_plan)
+        )
+    return query_plan
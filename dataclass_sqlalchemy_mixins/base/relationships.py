@@ -0,0 +1,133 @@
+import typing as tp
+import weakref
+
+from sqlalchemy import Column, event, inspect
+from sqlalchemy.orm import (
+    DeclarativeMeta,
+    InstrumentedAttribute,
+    Mapper,
+    RelationshipProperty,
+)
+from sqlalchemy.orm.exc import UnmappedColumnError
+from sqlalchemy.orm.interfaces import MANYTOONE
+from sqlalchemy.sql import operators
+from sqlalchemy.sql.elements import BinaryExpression, BooleanClauseList
+
+
+class RelationshipInfo(tp.NamedTuple):
+    name: str
+    target: tp.Type[DeclarativeMeta]
+    direction: tp.Any
+    uselist: bool
+    # Target model field name -> local foreign key attribute
+    # for many-to-one relationships joined only by foreign keys
+    local_columns: tp.Dict[str, InstrumentedAttribute] = {}
+
+
+# Relationship graph of mapped models
+# model -> {relationship name -> relationship info}
+_relationships_index: tp.MutableMapping[type, tp.Dict[str, RelationshipInfo]] = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _is_foreign_key_join(relationship: RelationshipProperty) -> bool:
+    primaryjoin = relationship.primaryjoin
+
+    if isinstance(primaryjoin, BooleanClauseList):
+        if primaryjoin.operator is not operators.and_:
+            return False
+        clauses = list(primaryjoin.clauses)
+    else:
+        clauses = [primaryjoin]
+
+    # Additional join conditions can't be dropped together with a join
+    return len(clauses) == len(relationship.local_remote_pairs) and all(
+        isinstance(clause, BinaryExpression)
+        and clause.operator is operators.eq
+        and isinstance(clause.left, Column)
+        and isinstance(clause.right, Column)
+        for clause in clauses
+    )
+
+
+def _get_local_columns(
+    relationship: RelationshipProperty,
+) -> tp.Dict[str, InstrumentedAttribute]:
+    if (
+        relationship.direction is not MANYTOONE
+        or relationship.secondary is not None
+        or not _is_foreign_key_join(relationship)
+    ):
+        return {}
+
+    local_columns = {}
+    for local_column, remote_column in relationship.local_remote_pairs:
+        try:
+            local_field = relationship.parent.get_property_by_column(local_column)
+            remote_field = relationship.mapper.get_property_by_column(remote_column)
+        except UnmappedColumnError:
+            continue
+
+        local_columns[remote_field.key] = getattr(
+            relationship.parent.class_, local_field.key
+        )
+    return local_columns
+
+
+def _build_relationships(mapper: Mapper) -> tp.Dict[str, RelationshipInfo]:
+    return {
+        relationship.key: RelationshipInfo(
+            name=relationship.key,
+            target=relationship.entity.class_,
+            direction=relationship.direction,
+            uselist=bool(relationship.uselist),
+            local_columns=_get_local_columns(relationship),
+        )
+        for relationship in mapper.relationships
+    }
+
+
+@event.listens_for(Mapper, "mapper_configured")
+def _index_configured_mapper(mapper: Mapper, class_: type):
+    _relationships_index[class_] = _build_relationships(mapper)
+
+
+@event.listens_for(Mapper, "after_configured")
+def _reindex_configured_mappers():
+    # Backrefs are added to a mapper when the other side is configured
+    # which might happen after the mapper itself was indexed
+    # so the whole index is refreshed once configuration is finished
+    for class_ in list(_relationships_index.keys()):
+        mapper = inspect(class_, raiseerr=False)
+
+        if mapper is None:
+            _relationships_index.pop(class_, None)
+            continue
+
+        _relationships_index[class_] = _build_relationships(mapper)
+
+
+def get_relationships(
+    model: tp.Type[DeclarativeMeta],
+) -> tp.Dict[str, RelationshipInfo]:
+    relationships = _relationships_index.get(model)
+
+    if relationships is None:
+        # Accessing relationships configures mappers if required
+        # which fills the index using the event above
+        relationships = _build_relationships(inspect(model))
+        _relationships_index[model] = relationships
+
+    return relationships
+
+
+def get_relationship(
+    model: tp.Type[DeclarativeMeta],
+    name: str,
+) -> tp.Optional[RelationshipInfo]:
+    return get_relationships(model).get(name)
+
+
+def clear_relationships_index():
+    _relationships_index.clear()
@@ -0,0 +1,639 @@
+import abc
+import datetime
+import decimal
+import enum
+import hashlib
+import itertools
+import json
+import os
+import pickle
+import sqlite3
+import threading
+import time
+import typing as tp
+import uuid
+
+from sqlalchemy import event
+from sqlalchemy.orm import DeclarativeMeta
+from sqlalchemy.orm.loading import merge_frozen_result
+
+from dataclass_sqlalchemy_mixins.base.cache import LRUCache, LRUCacheInfo
+from dataclass_sqlalchemy_mixins.base.converter import get_converter
+from dataclass_sqlalchemy_mixins.base.mixins import (
+    SQLALCHEMY_OP_MATCHER,
+    ToManyStrategy,
+)
+from dataclass_sqlalchemy_mixins.base.tracing import async_execute, execute
+from dataclass_sqlalchemy_mixins.base.utils import is_single_entity
+
+
+class ResultCacheKey(tp.NamedTuple):
+    model: str
+    # Hash of a canonical query spec
+    digest: str
+
+
+class ResultCacheEntry(tp.NamedTuple):
+    value: tp.Any
+    # Unix time, None for entries without a ttl
+    expires_at: tp.Optional[float] = None
+    # Names of related models results depend on,
+    # entries are invalidated together with them
+    models: tp.Tuple[str, ...] = ()
+
+
+class ResultCacheInfo(tp.NamedTuple):
+    hits: int
+    misses: int
+    # Entries found after their ttl, they are counted as misses too
+    expirations: int
+    invalidations: int
+    evictions: int
+    maxsize: int
+    currsize: int
+
+
+# Operators which results don't depend on an order of values
+UNORDERED_OPS = ("in", "not_in")
+
+
+def _normalize_value(value: tp.Any) -> tp.Any:
+    # Values are tagged when their json representation
+    # is the same as a representation of a value of another type
+    if isinstance(value, enum.Enum):
+        return _normalize_value(value.value)
+    if isinstance(value, (list, tuple)):
+        return [_normalize_value(item) for item in value]
+    if isinstance(value, (set, frozenset)):
+        return {"$set": _sort_values(value)}
+    if isinstance(value, (datetime.date, datetime.time)):
+        return {f"${type(value).__name__}": value.isoformat()}
+    if isinstance(value, datetime.timedelta):
+        return {"$timedelta": value.total_seconds()}
+    if isinstance(value, (decimal.Decimal, uuid.UUID)):
+        return {f"${type(value).__name__}": str(value)}
+    if isinstance(value, bytes):
+        return {"$bytes": value.hex()}
+    return value
+
+
+def _dump(value: tp.Any) -> str:
+    # Unknown values are represented by repr
+    # so they might never be found in a cache but never collide
+    return json.dumps(value, sort_keys=True, separators=(",", ":"), default=repr)
+
+
+def _sort_values(values: tp.Iterable[tp.Any]) -> tp.List[tp.Any]:
+    return sorted((_normalize_value(value) for value in values), key=_dump)
+
+
+def _normalize_filters(filters: tp.Dict[str, tp.Any]) -> tp.List[tp.Any]:
+    normalized_filters = []
+
+    for key, value in filters.items():
+        key_params = key.rsplit("__", 1)
+        op = None
+        if len(key_params) > 1 and key_params[-1] in SQLALCHEMY_OP_MATCHER:
+            op = key_params[-1]
+
+        # "field" and "field__eq" are the same filter
+        if op == "eq":
+            key = key_params[0]
+
+        if op in UNORDERED_OPS and isinstance(value, (list, tuple, set, frozenset)):
+            normalized_value = _sort_values(value)
+        else:
+            normalized_value = _normalize_value(value)
+
+        normalized_filters.append([key, normalized_value])
+
+    return sorted(
+        normalized_filters, key=lambda normalized_filter: normalized_filter[0]
+    )
+
+
+def get_model_name(model: tp.Type[DeclarativeMeta]) -> str:
+    return f"{model.__module__}.{model.__qualname__}"
+
+
+def get_result_cache_key(
+    model: tp.Type[DeclarativeMeta],
+    filters: tp.Optional[tp.Dict[str, tp.Any]] = None,
+    order_by: tp.Optional[tp.Union[str, tp.List[str]]] = None,
+    limit: tp.Optional[int] = None,
+    offset: tp.Optional[int] = None,
+    **params,
+) -> ResultCacheKey:
+    # Filters are compared regardless of their order,
+    # order fields are kept in their order since it changes results
+    if isinstance(order_by, str):
+        order_by = [order_by]
+
+    canonical_spec = {
+        "filters": _normalize_filters(filters or {}),
+        "order_by": list(order_by or []),
+        "limit": limit,
+        "offset": offset,
+        "params": {key: _normalize_value(value) for key, value in params.items()},
+    }
+
+    return ResultCacheKey(
+        model=get_model_name(model),
+        digest=hashlib.sha256(_dump(canonical_spec).encode()).hexdigest(),
+    )
+
+
+def get_related_models(
+    model: tp.Type[DeclarativeMeta],
+    filters: tp.Optional[tp.Dict[str, tp.Any]] = None,
+    order_by: tp.Optional[tp.Union[str, tp.List[str]]] = None,
+) -> tp.Tuple[tp.Type[DeclarativeMeta], ...]:
+    # Every model of a relationship path is tracked whether it is joined,
+    # checked by EXISTS or replaced with a foreign key column
+    if isinstance(order_by, str):
+        order_by = [order_by]
+
+    converter = get_converter(model)
+    related_models = {}
+
+    for key in itertools.chain(
+        filters or (), (field.lstrip("-") for field in order_by or ())
+    ):
+        models, _ = converter.get_foreign_key_path(
+            models_path_to_look=key.split("__"),
+            to_return_column=False,
+            model=model,
+        )
+        related_models.update(dict.fromkeys(models))
+
+    related_models.pop(model, None)
+    return tuple(related_models)
+
+
+def get_query_key(query) -> str:
+    # Queries results are fetched for are a part of a key
+    # together with values of their parameters
+    compiled = query.compile()
+    return _dump(
+        [
+            str(compiled),
+            sorted(
+                [name, _normalize_value(value)]
+                for name, value in compiled.params.items()
+            ),
+        ]
+    )
+
+
+class ResultCacheBackend(abc.ABC):
+    # Storage of entries, ttl is checked by ResultCache
+    maxsize: int
+
+    @abc.abstractmethod
+    def get(self, key: ResultCacheKey) -> tp.Optional[ResultCacheEntry]:
+        pass
+
+    @abc.abstractmethod
+    def set(self, key: ResultCacheKey, entry: ResultCacheEntry):
+        pass
+
+    @abc.abstractmethod
+    def delete(self, key: ResultCacheKey):
+        pass
+
+    @abc.abstractmethod
+    def invalidate(self, model_name: str) -> int:
+        # Entries of a model and entries depending on it are deleted,
+        # returns a number of deleted entries
+        pass
+
+    @abc.abstractmethod
+    def clear(self):
+        pass
+
+    @abc.abstractmethod
+    def info(self) -> LRUCacheInfo:
+        pass
+
+
+class MemoryResultCacheBackend(ResultCacheBackend):
+    # Entries are kept in the current process only
+    def __init__(self, maxsize: int = 1024):
+        self.maxsize = maxsize
+        self._cache = LRUCache(maxsize=maxsize)
+
+    def get(self, key: ResultCacheKey) -> tp.Optional[ResultCacheEntry]:
+        return self._cache.get(key)
+
+    def set(self, key: ResultCacheKey, entry: ResultCacheEntry):
+        self._cache.set(key, entry)
+
+    def delete(self, key: ResultCacheKey):
+        self._cache.pop(key)
+
+    def invalidate(self, model_name: str) -> int:
+        invalidated = 0
+
+        for key, entry in self._cache.items():
+            if key.model != model_name and model_name not in entry.models:
+                continue
+            if self._cache.pop(key) is not None:
+                invalidated += 1
+        return invalidated
+
+    def clear(self):
+        self._cache.clear(reset_stats=False)
+
+    def info(self) -> LRUCacheInfo:
+        return self._cache.info()
+
+
+class SQLiteResultCacheBackend(ResultCacheBackend):
+    # Entries are pickled to a SQLite file which is shared
+    # between processes, for example workers of the same application
+    TIMEOUT = 10.0
+
+    # Order of access is kept by a counter shared between processes
+    NEXT_ACCESSED = "SELECT COALESCE(MAX(accessed), 0) + 1 FROM result_cache"
+
+    def __init__(self, path: str, maxsize: int = 1024):
+        if maxsize <= 0:
+            raise ValueError(
+                "SQLiteResultCacheBackend maxsize should be greater than 0"
+            )
+
+        self.path = path
+        self.maxsize = maxsize
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        self._local = threading.local()
+        self._lock = threading.Lock()
+
+        with self._get_connection() as connection:
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS result_cache ("
+                "model TEXT NOT NULL, "
+                "digest TEXT NOT NULL, "
+                "expires_at REAL, "
+                "accessed INTEGER NOT NULL, "
+                "models TEXT NOT NULL, "
+                "value BLOB NOT NULL, "
+                "PRIMARY KEY (model, digest))"
+            )
+            connection.execute(
+                "CREATE INDEX IF NOT EXISTS ix_result_cache_accessed "
+                "ON result_cache (accessed)"
+            )
+
+    def _get_connection(self) -> sqlite3.Connection:
+        # Connections can't be shared between threads and forked processes
+        connection = getattr(self._local, "connection", None)
+
+        if connection is None or self._local.pid != os.getpid():
+            connection = sqlite3.connect(self.path, timeout=self.TIMEOUT)
+            connection.execute("PRAGMA journal_mode=WAL")
+
+            self._local.connection = connection
+            self._local.pid = os.getpid()
+        return connection
+
+    def _count(self, counter: str):
+        with self._lock:
+            setattr(self, counter, getattr(self, counter) + 1)
+
+    def get(self, key: ResultCacheKey) -> tp.Optional[ResultCacheEntry]:
+        with self._get_connection() as connection:
+            row = connection.execute(
+                "SELECT value, expires_at, models FROM result_cache "
+                "WHERE model = ? AND digest = ?",
+                key,
+            ).fetchone()
+
+            if row is None:
+                self._count("misses")
+                return None
+
+            connection.execute(
+                f"UPDATE result_cache SET accessed = ({self.NEXT_ACCESSED}) "
+                "WHERE model = ? AND digest = ?",
+                key,
+            )
+
+        self._count("hits")
+        return ResultCacheEntry(
+            value=pickle.loads(row[0]),
+            expires_at=row[1],
+            models=tuple(json.loads(row[2])),
+        )
+
+    def set(self, key: ResultCacheKey, entry: ResultCacheEntry):
+        value = pickle.dumps(entry.value, protocol=pickle.HIGHEST_PROTOCOL)
+
+        with self._get_connection() as connection:
+            connection.execute(
+                "INSERT OR REPLACE INTO result_cache "
+                "(model, digest, expires_at, accessed, models, value) "
+                f"VALUES (?, ?, ?, ({self.NEXT_ACCESSED}), ?, ?)",
+                (*key, entry.expires_at, json.dumps(list(entry.models)), value),
+            )
+
+            # The least recently used entries are evicted
+            evicted = connection.execute(
+                "DELETE FROM result_cache WHERE rowid IN ("
+                "SELECT rowid FROM result_cache ORDER BY accessed DESC "
+                "LIMIT -1 OFFSET ?)",
+                (self.maxsize,),
+            ).rowcount
+
+        with self._lock:
+            self.evictions += evicted
+
+    def delete(self, key: ResultCacheKey):
+        with self._get_connection() as connection:
+            connection.execute(
+                "DELETE FROM result_cache WHERE model = ? AND digest = ?",
+                key,
+            )
+
+    def invalidate(self, model_name: str) -> int:
+        with self._get_connection() as connection:
+            return connection.execute(
+                # Quoted names are looked up in json lists of models
+                "DELETE FROM result_cache " "WHERE model = ? OR instr(models, ?) > 0",
+                (model_name, json.dumps(model_name)),
+            ).rowcount
+
+    def clear(self):
+        with self._get_connection() as connection:
+            connection.execute("DELETE FROM result_cache")
+
+    def info(self) -> LRUCacheInfo:
+        currsize = (
+            self._get_connection()
+            .execute("SELECT COUNT(*) FROM result_cache")
+            .fetchone()[0]
+        )
+
+        with self._lock:
+            return LRUCacheInfo(
+                hits=self.hits,
+                misses=self.misses,
+                evictions=self.evictions,
+                maxsize=self.maxsize,
+                currsize=currsize,
+            )
+
+    def close(self):
+        connection = getattr(self._local, "connection", None)
+
+        if connection is not None:
+            connection.close()
+            self._local.connection = None
+
+
+class ResultCache:
+    # Results of queries built from filters, orderings and pagination
+    # are cached by a canonical spec for ttl seconds
+    def __init__(
+        self,
+        backend: tp.Optional[ResultCacheBackend] = None,
+        ttl: tp.Optional[float] = 60.0,
+    ):
+        self.backend = backend or MemoryResultCacheBackend()
+        self.ttl = ttl
+
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.expirations = 0
+        self.invalidations = 0
+
+    def _count(self, counter: str, number: int = 1):
+        with self._lock:
+            setattr(self, counter, getattr(self, counter) + number)
+
+    def get(self, key: ResultCacheKey, default: tp.Any = None) -> tp.Any:
+        entry = self.backend.get(key)
+
+        if entry is not None and entry.expires_at is not None:
+            if entry.expires_at <= time.time():
+                self.backend.delete(key)
+                self._count("expirations")
+                entry = None
+
+        if entry is None:
+            self._count("misses")
+            return default
+
+        self._count("hits")
+        return entry.value
+
+    def set(
+        self,
+        key: ResultCacheKey,
+        value: tp.Any,
+        ttl: tp.Optional[float] = None,
+        models: tp.Iterable[tp.Type[DeclarativeMeta]] = (),
+    ):
+        ttl = self.ttl if ttl is None else ttl
+        expires_at = time.time() + ttl if ttl is not None else None
+
+        self.backend.set(
+            key,
+            ResultCacheEntry(
+                value=value,
+                expires_at=expires_at,
+                models=tuple(get_model_name(model) for model in models),
+            ),
+        )
+
+    def invalidate(self, model: tp.Type[DeclarativeMeta]):
+        self._count("invalidations", self.backend.invalidate(get_model_name(model)))
+
+    def clear(self):
+        self.backend.clear()
+
+    def info(self) -> ResultCacheInfo:
+        backend_info = self.backend.info()
+
+        with self._lock:
+            return ResultCacheInfo(
+                hits=self.hits,
+                misses=self.misses,
+                expirations=self.expirations,
+                invalidations=self.invalidations,
+                evictions=backend_info.evictions,
+                maxsize=backend_info.maxsize,
+                currsize=backend_info.currsize,
+            )
+
+    def get_key(
+        self,
+        query,
+        filters: tp.Optional[tp.Dict[str, tp.Any]] = None,
+        order_by: tp.Optional[tp.Union[str, tp.List[str]]] = None,
+        limit: tp.Optional[int] = None,
+        offset: tp.Optional[int] = None,
+        model: tp.Type[DeclarativeMeta] = None,
+        to_many_strategy: tp.Optional[ToManyStrategy] = None,
+    ) -> ResultCacheKey:
+        return get_result_cache_key(
+            model=get_converter(model)._get_model(),
+            filters=filters,
+            order_by=order_by,
+            limit=limit,
+            offset=offset,
+            query=get_query_key(query),
+            to_many_strategy=to_many_strategy,
+        )
+
+    def _apply_query_spec(
+        self,
+        query,
+        model: tp.Type[DeclarativeMeta] = None,
+        **query_spec,
+    ):
+        return get_converter(model).apply_query_spec(query=query, **query_spec)
+
+    @staticmethod
+    def _get_results(result, query) -> tp.List[tp.Any]:
+        if is_single_entity(query):
+            result = result.scalars()
+        return list(result.all())
+
+    @staticmethod
+    def _dump_result(frozen_result) -> bytes:
+        # Pickled results contain copies of instances
+        # which are not expired or changed by a session they were loaded by
+        return pickle.dumps(frozen_result, protocol=pickle.HIGHEST_PROTOCOL)
+
+    def _load_results(self, session, query, value: bytes) -> tp.List[tp.Any]:
+        # Instances are merged into a session of a caller without loading them
+        result = merge_frozen_result(session, query, pickle.loads(value), load=False)
+        return self._get_results(result(), query)
+
+    def _cache_results(self, key, query, result, ttl, models) -> tp.List[tp.Any]:
+        frozen_result = result.freeze()
+
+        self.set(key, self._dump_result(frozen_result), ttl=ttl, models=models)
+        return self._get_results(frozen_result(), query)
+
+    def fetch_all(
+        self,
+        session,
+        query,
+        filters: tp.Optional[tp.Dict[str, tp.Any]] = None,
+        order_by: tp.Optional[tp.Union[str, tp.List[str]]] = None,
+        limit: tp.Optional[int] = None,
+        offset: tp.Optional[int] = None,
+        model: tp.Type[DeclarativeMeta] = None,
+        to_many_strategy: tp.Optional[ToManyStrategy] = None,
+        ttl: tp.Optional[float] = None,
+    ) -> tp.List[tp.Any]:
+        query_spec = dict(
+            filters=filters,
+            order_by=order_by,
+            limit=limit,
+            offset=offset,
+            model=model,
+            to_many_strategy=to_many_strategy,
+        )
+        key = self.get_key(query=query, **query_spec)
+
+        value = self.get(key)
+        if value is not None:
+            return self._load_results(session=session, query=query, value=value)
+
+        result = execute(
+            session=session,
+            query=self._apply_query_spec(query=query, **query_spec),
+            model=model,
+        )
+        return self._cache_results(
+            key=key,
+            query=query,
+            result=result,
+            ttl=ttl,
+            models=get_related_models(
+                model=get_converter(model)._get_model(),
+                filters=filters,
+                order_by=order_by,
+            ),
+        )
+
+    async def async_fetch_all(
+        self,
+        session,
+        query,
+        filters: tp.Optional[tp.Dict[str, tp.Any]] = None,
+        order_by: tp.Optional[tp.Union[str, tp.List[str]]] = None,
+        limit: tp.Optional[int] = None,
+        offset: tp.Optional[int] = None,
+        model: tp.Type[DeclarativeMeta] = None,
+        to_many_strategy: tp.Optional[ToManyStrategy] = None,
+        ttl: tp.Optional[float] = None,
+    ) -> tp.List[tp.Any]:
+        query_spec = dict(
+            filters=filters,
+            order_by=order_by,
+            limit=limit,
+            offset=offset,
+            model=model,
+            to_many_strategy=to_many_strategy,
+        )
+        key = self.get_key(query=query, **query_spec)
+
+        value = self.get(key)
+        if value is not None:
+            return self._load_results(
+                session=session.sync_session,
+                query=query,
+                value=value,
+            )
+
+        result = await async_execute(
+            session=session,
+            query=self._apply_query_spec(query=query, **query_spec),
+            model=model,
+        )
+        return self._cache_results(
+            key=key,
+            query=query,
+            result=result,
+            ttl=ttl,
+            models=get_related_models(
+                model=get_converter(model)._get_model(),
+                filters=filters,
+                order_by=order_by,
+            ),
+        )
+
+    def invalidate_on_commit(self, target):
+        # Models of flushed instances are invalidated once a transaction is committed.
+        # Target is a session, a sessionmaker or a Session class.
+        # Bulk update() and delete() statements and joins of caller queries
+        # are not tracked, their results are refreshed after ttl
+        # Models are collected separately for every registration
+        # since several caches might be invalidated by the same session
+        info_key = ("_result_cache_models", id(self))
+
+        @event.listens_for(target, "after_flush")
+        def collect_models(session, flush_context):
+            models = session.info.setdefault(info_key, set())
+
+            for instance in itertools.chain(
+                session.new, session.dirty, session.deleted
+            ):
+                models.add(type(instance))
+
+        @event.listens_for(target, "after_commit")
+        def invalidate_models(session):
+            for model in session.info.pop(info_key, ()):
+                self.invalidate(model)
+
+        @event.listens_for(target, "after_rollback")
+        def discard_models(session):
+            session.info.pop(info_key, None)
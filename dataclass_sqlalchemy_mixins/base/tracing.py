@@ -0,0 +1,193 @@
+import collections
+import enum
+import math
+import threading
+import time
+import typing as tp
+
+from dataclass_sqlalchemy_mixins.base.hooks import HookRegistry
+
+
+class Phase(str, enum.Enum):
+    PARSE = "parse"  # Filter model is converted to a dict of filters
+    RESOLVE = "resolve"  # Key is resolved into models and a column
+    JOIN = "join"  # Models of keys are joined to a query
+    BUILD = "build"  # Sqlalchemy expression is built from a value
+    EXECUTE = "execute"  # Query is executed by a database
+
+
+class TraceEvent(tp.NamedTuple):
+    phase: Phase
+    # Seconds spent in a phase
+    duration: float
+    model: tp.Any = None
+    # Filter key or order field, None for phases of a whole query
+    key: tp.Optional[str] = None
+    # Keys of filters or order fields converted together with a key
+    shape: tp.Optional[tp.Tuple[str, ...]] = None
+    metadata: tp.Optional[tp.Dict[str, tp.Any]] = None
+
+
+Tracer = tp.Callable[[TraceEvent], None]
+
+_tracers = HookRegistry("tracers")
+
+
+def add_tracer(tracer: Tracer):
+    # Tracer receives events of all threads and tasks
+    _tracers.add(tracer)
+
+
+def remove_tracer(tracer: Tracer):
+    _tracers.remove(tracer)
+
+
+def tracing(*tracers: Tracer) -> tp.ContextManager[None]:
+    # Tracers receive events of the current thread or task only
+    return _tracers.context(*tracers)
+
+
+def get_tracers() -> tp.Tuple[Tracer, ...]:
+    # Empty tuple is returned when tracing is disabled,
+    # so callers measure time only when it is not empty
+    return _tracers.get()
+
+
+def get_shape(keys: tp.Iterable[str]) -> tp.Tuple[str, ...]:
+    return tuple(sorted(keys))
+
+
+def emit(
+    tracers: tp.Tuple[Tracer, ...],
+    phase: Phase,
+    started: float,
+    model: tp.Any = None,
+    key: tp.Optional[str] = None,
+    shape: tp.Optional[tp.Tuple[str, ...]] = None,
+    **metadata,
+):
+    event = TraceEvent(
+        phase=phase,
+        duration=time.perf_counter() - started,
+        model=model,
+        key=key,
+        shape=shape,
+        metadata=metadata or None,
+    )
+
+    for tracer in tracers:
+        tracer(event)
+
+
+def execute(session, query, model: tp.Any = None, **kwargs):
+    tracers = get_tracers()
+
+    if not tracers:
+        return session.execute(query, **kwargs)
+
+    started = time.perf_counter()
+    result = session.execute(query, **kwargs)
+    emit(tracers, Phase.EXECUTE, started, model=model)
+    return result
+
+
+async def async_execute(session, query, model: tp.Any = None, **kwargs):
+    tracers = get_tracers()
+
+    if not tracers:
+        return await session.execute(query, **kwargs)
+
+    started = time.perf_counter()
+    result = await session.execute(query, **kwargs)
+    emit(tracers, Phase.EXECUTE, started, model=model)
+    return result
+
+
+async def async_stream(session, query, model: tp.Any = None, **kwargs):
+    tracers = get_tracers()
+
+    if not tracers:
+        return await session.stream(query, **kwargs)
+
+    started = time.perf_counter()
+    result = await session.stream(query, **kwargs)
+    emit(tracers, Phase.EXECUTE, started, model=model)
+    return result
+
+
+class PhaseStats(tp.NamedTuple):
+    count: int
+    # Seconds
+    total: float
+    p50: float
+    p95: float
+    p99: float
+
+
+def get_percentile(sorted_durations: tp.List[float], percentile: float) -> float:
+    # Nearest-rank method
+    rank = math.ceil(percentile / 100 * len(sorted_durations))
+    return sorted_durations[max(rank, 1) - 1]
+
+
+class TraceCollector:
+    # Tracer aggregating durations in the current process
+    # by a model, a phase and either a key or a shape
+    BY_KEY = "key"
+    BY_SHAPE = "shape"
+
+    def __init__(self, max_samples: int = 10000):
+        # Only the latest samples of every group are used for percentiles
+        self.max_samples = max_samples
+        self._samples: tp.Dict[tp.Tuple, tp.Deque[float]] = {}
+        self._counts: tp.Dict[tp.Tuple, int] = collections.Counter()
+        self._totals: tp.Dict[tp.Tuple, float] = collections.Counter()
+        self._lock = threading.Lock()
+
+    def __call__(self, event: TraceEvent):
+        model_name = getattr(event.model, "__name__", event.model)
+
+        groups = [(self.BY_KEY, model_name, event.phase, event.key)]
+        if event.shape is not None:
+            groups.append((self.BY_SHAPE, model_name, event.phase, event.shape))
+
+        with self._lock:
+            for group in groups:
+                samples = self._samples.get(group)
+                if samples is None:
+                    samples = collections.deque(maxlen=self.max_samples)
+                    self._samples[group] = samples
+
+                samples.append(event.duration)
+                self._counts[group] += 1
+                self._totals[group] += event.duration
+
+    def get_stats(
+        self,
+        by: str = BY_KEY,
+    ) -> tp.Dict[tp.Tuple[tp.Any, Phase, tp.Any], PhaseStats]:
+        with self._lock:
+            samples = {
+                group: sorted(durations)
+                for group, durations in self._samples.items()
+                if group[0] == by
+            }
+            counts = dict(self._counts)
+            totals = dict(self._totals)
+
+        return {
+            group[1:]: PhaseStats(
+                count=counts[group],
+                total=totals[group],
+                p50=get_percentile(durations, 50),
+                p95=get_percentile(durations, 95),
+                p99=get_percentile(durations, 99),
+            )
+            for group, durations in samples.items()
+        }
+
+    def clear(self):
+        with self._lock:
+            self._samples.clear()
+            self._counts.clear()
+            self._totals.clear()
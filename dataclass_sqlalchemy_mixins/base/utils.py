@@ -1,19 +1,40 @@
 import typing as tp
 
-from sqlalchemy.orm import DeclarativeMeta
+from sqlalchemy.orm import DeclarativeMeta, Session
 
-from dataclass_sqlalchemy_mixins.base.mixins import (
-    SqlAlchemyFilterConverterMixin,
-    SqlAlchemyOrderConverterMixin,
+from dataclass_sqlalchemy_mixins.base.converter import (
+    SqlAlchemyConverter,
+    get_converter,
 )
+from dataclass_sqlalchemy_mixins.base.counts import CountResult
+from dataclass_sqlalchemy_mixins.base.mixins import TOTAL_COUNT_LABEL, ToManyStrategy
+from dataclass_sqlalchemy_mixins.base.tracing import execute
+
+
+# Number of rows fetched from a cursor at once when results are streamed
+DEFAULT_YIELD_PER = 1000
+
+
+def is_single_entity(query) -> bool:
+    # Models or values are returned instead of rows for select(Model)
+    # and select(Model.column) the same way as Session.scalars() does
+    return len(query.column_descriptions) == 1
+
+
+def get_stream_query(query, yield_per: int = DEFAULT_YIELD_PER):
+    # Server-side cursor is used by drivers which support it
+    # and only yield_per rows are buffered at once
+    return query.execution_options(stream_results=True, yield_per=yield_per)
 
 
 def get_binary_expressions(
     filters: tp.Dict[str, tp.Any],
     model: tp.Type[DeclarativeMeta] = None,
+    to_many_strategy: tp.Optional[ToManyStrategy] = None,
 ):
-    return SqlAlchemyFilterConverterMixin().get_binary_expressions(
-        filters=filters, model=model
+    return get_converter(model).get_binary_expressions(
+        filters=filters,
+        to_many_strategy=to_many_strategy,
     )
 
 
@@ -21,64 +42,141 @@ def get_unary_expressions(
     order_by: tp.Union[str, tp.List[str]],
     model: tp.Type[DeclarativeMeta] = None,
 ):
-    return SqlAlchemyOrderConverterMixin().get_unary_expressions(
-        order_by=order_by, model=model
-    )
+    return get_converter(model).get_unary_expressions(order_by=order_by)
 
 
 def apply_filters(
     query,
     filters: tp.Dict[str, tp.Any],
     model: tp.Type[DeclarativeMeta] = None,
+    to_many_strategy: tp.Optional[ToManyStrategy] = None,
 ):
-    converter = SqlAlchemyFilterConverterMixin()
+    return get_converter(model).apply_filters(
+        query=query,
+        filters=filters,
+        to_many_strategy=to_many_strategy,
+    )
 
-    filters_binary_expressions = converter.get_models_binary_expressions(
-        model=model,
+
+def apply_order_by(
+    query,
+    order_by: tp.Union[str, tp.List[str]],
+    model: tp.Type[DeclarativeMeta] = None,
+):
+    return get_converter(model).apply_order_by(query=query, order_by=order_by)
+
+
+def apply_query_spec(
+    query,
+    filters: tp.Optional[tp.Dict[str, tp.Any]] = None,
+    order_by: tp.Optional[tp.Union[str, tp.List[str]]] = None,
+    limit: tp.Optional[int] = None,
+    offset: tp.Optional[int] = None,
+    model: tp.Type[DeclarativeMeta] = None,
+    to_many_strategy: tp.Optional[ToManyStrategy] = None,
+    with_total_count: bool = False,
+):
+    return get_converter(model).apply_query_spec(
+        query=query,
         filters=filters,
+        order_by=order_by,
+        limit=limit,
+        offset=offset,
+        to_many_strategy=to_many_strategy,
+        with_total_count=with_total_count,
     )
 
-    models_to_join = []
-    binary_expressions = []
 
-    for binary_expression in filters_binary_expressions:
-        models_to_join += binary_expression["models"]
-        binary_expressions.append(binary_expression["binary_expression"])
+def get_count_query(
+    filters: tp.Optional[tp.Dict[str, tp.Any]] = None,
+    model: tp.Type[DeclarativeMeta] = None,
+):
+    return get_converter(model).get_count_query(filters=filters)
+
+
+def get_count(
+    session,
+    filters: tp.Optional[tp.Dict[str, tp.Any]] = None,
+    model: tp.Type[DeclarativeMeta] = None,
+    estimate_threshold: tp.Optional[int] = None,
+) -> CountResult:
+    return get_converter(model).get_count(
+        session=session,
+        filters=filters,
+        estimate_threshold=estimate_threshold,
+    )
 
-    # Checking if there are other models required to be joined
-    if models_to_join != [
-        model,
-    ]:
-        query = converter.join_models(query=query, models=models_to_join)
 
-    query = query.filter(*binary_expressions)
-    return query
+def add_total_count(query, label: str = TOTAL_COUNT_LABEL):
+    return SqlAlchemyConverter.add_total_count(query=query, label=label)
 
 
-def apply_order_by(
+def apply_keyset_pagination(
     query,
     order_by: tp.Union[str, tp.List[str]],
+    cursor: tp.Optional[str] = None,
+    limit: tp.Optional[int] = None,
     model: tp.Type[DeclarativeMeta] = None,
 ):
-    converter = SqlAlchemyOrderConverterMixin()
-
-    order_by_unary_expressions = converter.get_models_unary_expressions(
-        model=model,
+    return get_converter(model).apply_keyset_pagination(
+        query=query,
         order_by=order_by,
+        cursor=cursor,
+        limit=limit,
     )
 
-    models_to_join = []
-    unary_expressions = []
 
-    for binary_expression in order_by_unary_expressions:
-        models_to_join += binary_expression["models"]
-        unary_expressions.append(binary_expression["unary_expression"])
+def get_next_cursor(
+    row: tp.Any,
+    order_by: tp.Union[str, tp.List[str]],
+    model: tp.Type[DeclarativeMeta] = None,
+) -> str:
+    return get_converter(model).get_next_cursor(row=row, order_by=order_by)
+
 
-    # Checking if there are other models required to be joined
-    if models_to_join != [
-        model,
-    ]:
-        query = converter.join_models(query=query, models=models_to_join)
+def stream_query(
+    session: Session,
+    query,
+    yield_per: int = DEFAULT_YIELD_PER,
+    model: tp.Type[DeclarativeMeta] = None,
+) -> tp.Iterator[tp.Any]:
+    query = get_stream_query(query=query, yield_per=yield_per)
 
-    query = query.order_by(*unary_expressions)
-    return query
+    result = execute(session=session, query=query, model=model)
+
+    if is_single_entity(query):
+        result = result.scalars()
+
+    try:
+        yield from result
+    finally:
+        # Cursor is released when a caller stops iterating early
+        result.close()
+
+
+def stream(
+    session: Session,
+    query,
+    filters: tp.Optional[tp.Dict[str, tp.Any]] = None,
+    order_by: tp.Optional[tp.Union[str, tp.List[str]]] = None,
+    limit: tp.Optional[int] = None,
+    offset: tp.Optional[int] = None,
+    model: tp.Type[DeclarativeMeta] = None,
+    to_many_strategy: tp.Optional[ToManyStrategy] = None,
+    yield_per: int = DEFAULT_YIELD_PER,
+) -> tp.Iterator[tp.Any]:
+    query = apply_query_spec(
+        query=query,
+        filters=filters,
+        order_by=order_by,
+        limit=limit,
+        offset=offset,
+        model=model,
+        to_many_strategy=to_many_strategy,
+    )
+    return stream_query(
+        session=session,
+        query=query,
+        yield_per=yield_per,
+        model=model,
+    )
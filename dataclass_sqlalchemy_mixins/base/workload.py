@@ -0,0 +1,161 @@
+import enum
+import json
+import threading
+import time
+import typing as tp
+
+from dataclass_sqlalchemy_mixins.base.hooks import HookRegistry
+
+
+class WorkloadKind(str, enum.Enum):
+    FILTERS = "filters"
+    ORDER_BY = "order_by"
+
+
+class FilterShape(tp.NamedTuple):
+    key: str
+    op: str
+    # Number of values of lists, None for other values
+    size: tp.Optional[int] = None
+
+
+class WorkloadRecord(tp.NamedTuple):
+    kind: WorkloadKind
+    model: str
+    # Filter shapes sorted by keys or order fields in their order
+    shape: tp.Tuple[tp.Any, ...]
+    # Seconds spent building expressions
+    duration: float
+
+
+Recorder = tp.Callable[[WorkloadRecord], None]
+
+_recorders = HookRegistry("recorders")
+
+
+def add_recorder(recorder: Recorder):
+    _recorders.add(recorder)
+
+
+def remove_recorder(recorder: Recorder):
+    _recorders.remove(recorder)
+
+
+def recording(*recorders: Recorder) -> tp.ContextManager[None]:
+    # Recorders receive records of the current thread or task only
+    return _recorders.context(*recorders)
+
+
+def get_recorders() -> tp.Tuple[Recorder, ...]:
+    return _recorders.get()
+
+
+def get_filters_shape(
+    filters: tp.Dict[str, tp.Any],
+    ops: tp.Container[str],
+) -> tp.Tuple[FilterShape, ...]:
+    # Values are dropped and only their number is kept
+    shape = []
+
+    for key, value in filters.items():
+        key_params = key.rsplit("__", 1)
+        op = key_params[-1] if len(key_params) > 1 and key_params[-1] in ops else "eq"
+
+        size = None
+        if isinstance(value, (list, tuple, set, frozenset)):
+            size = len(value)
+
+        shape.append(FilterShape(key=key, op=op, size=size))
+
+    return tuple(sorted(shape))
+
+
+def record(
+    recorders: tp.Tuple[Recorder, ...],
+    kind: WorkloadKind,
+    model: tp.Any,
+    shape: tp.Tuple[tp.Any, ...],
+    started: float,
+):
+    workload_record = WorkloadRecord(
+        kind=kind,
+        model=model.__name__,
+        shape=shape,
+        duration=time.perf_counter() - started,
+    )
+
+    for recorder in recorders:
+        recorder(workload_record)
+
+
+def _dump_record(workload_record: WorkloadRecord) -> str:
+    return json.dumps(
+        {
+            "kind": workload_record.kind.value,
+            "model": workload_record.model,
+            "shape": workload_record.shape,
+            "us": round(workload_record.duration * 10**6, 1),
+        },
+        separators=(",", ":"),
+    )
+
+
+def _load_record(line: str) -> WorkloadRecord:
+    dict_record = json.loads(line)
+    kind = WorkloadKind(dict_record["kind"])
+
+    if kind == WorkloadKind.FILTERS:
+        shape = tuple(
+            FilterShape(*filter_shape) for filter_shape in dict_record["shape"]
+        )
+    else:
+        shape = tuple(dict_record["shape"])
+
+    return WorkloadRecord(
+        kind=kind,
+        model=dict_record["model"],
+        shape=shape,
+        duration=dict_record["us"] / 10**6,
+    )
+
+
+class WorkloadRecorder:
+    # Recorder appending records to a file as json lines
+    def __init__(self, path: str):
+        self.path = path
+        self._file = None
+        self._lock = threading.Lock()
+
+    def __call__(self, workload_record: WorkloadRecord):
+        line = _dump_record(workload_record) + "\n"
+
+        with self._lock:
+            if self._file is None:
+                self._file = open(self.path, "a")
+            self._file.write(line)
+
+    def flush(self):
+        with self._lock:
+            if self._file is not None:
+                self._file.flush()
+
+    def close(self):
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+    def __enter__(self):
+        add_recorder(self)
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        remove_recorder(self)
+        self.close()
+
+
+def load_workload(path: str) -> tp.Iterator[WorkloadRecord]:
+    with open(path) as file:
+        for line in file:
+            if line.strip():
+                yield _load_record(line)
@@ -0,0 +1,219 @@
+import dataclasses
+import time
+import typing as tp
+
+from dataclass_sqlalchemy_mixins.base.counts import CountResult
+from dataclass_sqlalchemy_mixins.base.mixins import (
+    QUERY_SPEC_FIELDS,
+    SqlAlchemyFilterConverterMixin,
+    SqlAlchemyOrderConverterMixin,
+    SqlAlchemyQueryConverterMixin,
+    ToManyStrategy,
+)
+from dataclass_sqlalchemy_mixins.base.parsers import (
+    ListAsStringParsersMixin,
+    OrderByAsStringParsersMixin,
+)
+from dataclass_sqlalchemy_mixins.base.tracing import Phase, emit, get_shape, get_tracers
+
+
+# Base classes for subclasses decorated with @dataclasses.dataclass
+# (slots=True and frozen=True are supported).
+# Values are not validated, so they should be already parsed
+# or be strings of fields listed in LIST_AS_STRING extra param
+
+
+class ConverterBaseDataclass(ListAsStringParsersMixin):
+    __slots__ = ()
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._get_list_as_string_parsers()
+
+    def __post_init__(self):
+        if self._get_converter_config().model is None:
+            raise ValueError("ConverterConfig param 'model' can't be None")
+
+    @classmethod
+    def _get_field_names(cls) -> tp.Tuple[str, ...]:
+        # Fields are known only after a class is decorated
+        field_names = cls.__dict__.get("_field_names")
+
+        if field_names is None:
+            field_names = tuple(field.name for field in dataclasses.fields(cls))
+            cls._field_names = field_names
+
+        return field_names
+
+
+class SqlAlchemyFilterBaseDataclass(
+    ConverterBaseDataclass,
+    SqlAlchemyFilterConverterMixin,
+):
+    __slots__ = ()
+
+    def _to_dict(self, exclude_none: bool = True) -> tp.Dict[str, tp.Any]:
+        tracers = get_tracers()
+        if tracers:
+            started = time.perf_counter()
+
+        dict_values = {}
+
+        for field_name in self._get_field_names():
+            value = getattr(self, field_name)
+
+            if value is None and exclude_none:
+                continue
+            dict_values[field_name] = value
+
+        for field_name, parser in self._get_list_as_string_parsers().items():
+            dict_value = dict_values.get(field_name)
+
+            if isinstance(dict_value, str):
+                dict_values[field_name] = parser(dict_value)
+
+        if tracers:
+            emit(
+                tracers,
+                Phase.PARSE,
+                started,
+                model=self._get_converter_config().model,
+                shape=get_shape(dict_values),
+            )
+        return dict_values
+
+    def to_binary_expressions(
+        self,
+        to_many_strategy: tp.Optional[ToManyStrategy] = None,
+    ):
+        return self.get_binary_expressions(
+            filters=self._to_dict(),
+            to_many_strategy=to_many_strategy,
+        )
+
+    def apply_filters(
+        self,
+        query,
+        to_many_strategy: tp.Optional[ToManyStrategy] = None,
+    ):
+        filters_binary_expressions = self.get_models_binary_expressions(
+            filters=self._to_dict(),
+            to_many_strategy=to_many_strategy,
+        )
+
+        return self.apply_models_expressions(
+            query=query,
+            models_binary_expressions=filters_binary_expressions,
+        )
+
+    def get_count_query(self):
+        return super().get_count_query(filters=self._to_dict())
+
+    def get_count(
+        self,
+        session,
+        estimate_threshold: tp.Optional[int] = None,
+    ) -> CountResult:
+        return super().get_count(
+            session=session,
+            filters=self._to_dict(),
+            estimate_threshold=estimate_threshold,
+        )
+
+
+class SqlAlchemyOrderBaseDataclass(
+    ConverterBaseDataclass,
+    OrderByAsStringParsersMixin,
+    SqlAlchemyOrderConverterMixin,
+):
+    # Subclasses declare a field
+    # order_by: tp.Optional[tp.Union[str, tp.List[str]]] = None
+    __slots__ = ()
+
+    def _get_order_by(self) -> tp.Optional[tp.Union[str, tp.List[str]]]:
+        # A field is not changed, so frozen dataclasses are supported
+        order_by = self.order_by
+        parser = self._get_list_as_string_parsers().get("order_by")
+
+        if parser is not None and isinstance(order_by, str):
+            return parser(order_by)
+        return order_by
+
+    def to_unary_expressions(self):
+        return self.get_unary_expressions(
+            order_by=self._get_order_by(),
+        )
+
+    def apply_order_by(
+        self,
+        query,
+    ):
+        order_by_unary_expressions = self.get_models_unary_expressions(
+            order_by=self._get_order_by(),
+        )
+
+        return self.apply_models_expressions(
+            query=query,
+            models_unary_expressions=order_by_unary_expressions,
+        )
+
+    def apply_keyset_pagination(
+        self,
+        query,
+        cursor: tp.Optional[str] = None,
+        limit: tp.Optional[int] = None,
+    ):
+        return super().apply_keyset_pagination(
+            query=query,
+            order_by=self._get_order_by(),
+            cursor=cursor,
+            limit=limit,
+        )
+
+    def get_next_cursor(
+        self,
+        row: tp.Any,
+    ) -> str:
+        return super().get_next_cursor(
+            row=row,
+            order_by=self._get_order_by(),
+        )
+
+
+class SqlAlchemyQueryBaseDataclass(
+    SqlAlchemyFilterBaseDataclass,
+    SqlAlchemyQueryConverterMixin,
+):
+    # Filters, ordering and pagination in one dataclass.
+    # Subclasses may declare fields order_by, limit and offset
+    __slots__ = ()
+
+    def _to_dict(self, exclude_none: bool = True) -> tp.Dict[str, tp.Any]:
+        dict_values = super()._to_dict(exclude_none=exclude_none)
+
+        for field_name in QUERY_SPEC_FIELDS:
+            dict_values.pop(field_name, None)
+        return dict_values
+
+    def _to_query_spec(self) -> tp.Dict[str, tp.Any]:
+        filters = super()._to_dict()
+
+        query_spec = {
+            field_name: filters.pop(field_name, None)
+            for field_name in QUERY_SPEC_FIELDS
+        }
+        query_spec["filters"] = filters
+        return query_spec
+
+    def apply_query_spec(
+        self,
+        query,
+        to_many_strategy: tp.Optional[ToManyStrategy] = None,
+        with_total_count: bool = False,
+    ):
+        return super().apply_query_spec(
+            query=query,
+            to_many_strategy=to_many_strategy,
+            with_total_count=with_total_count,
+            **self._to_query_spec(),
+        )
@@ -1,13 +1,24 @@
-import datetime
 import enum
+import time
 import typing as tp
 
-from pydantic import BaseModel, Extra
+import pydantic
+from pydantic import BaseModel
 
+from dataclass_sqlalchemy_mixins.base.counts import CountResult
 from dataclass_sqlalchemy_mixins.base.mixins import (
+    QUERY_SPEC_FIELDS,
     SqlAlchemyFilterConverterMixin,
     SqlAlchemyOrderConverterMixin,
+    SqlAlchemyQueryConverterMixin,
+    ToManyStrategy,
 )
+from dataclass_sqlalchemy_mixins.base.parsers import (
+    LIST_AS_STRING,
+    ListAsStringParsersMixin,
+    OrderByAsStringParsersMixin,
+)
+from dataclass_sqlalchemy_mixins.base.tracing import Phase, emit, get_shape, get_tracers
 
 
 # We might need to use a custom logic for
@@ -17,48 +28,75 @@ from dataclass_sqlalchemy_mixins.base.mixins import (
 # so we can set this fields in extra param in ConverterConfig
 class BaseModelConverterExtraParams(str, enum.Enum):
     LIST_AS_STRING = (
-        "list_as_string"  # Deal with like a string with delimeter ',' when using dict()
+        LIST_AS_STRING  # Deal with like a string with delimeter ',' when using dict()
     )
 
 
+PYDANTIC_V2 = int(pydantic.VERSION.split(".")[0]) >= 2
+
+if PYDANTIC_V2:
+    from pydantic import ConfigDict
+
+
+class ConverterBaseModel(BaseModel, ListAsStringParsersMixin):
+    # LIST_AS_STRING parsers are compiled when a class is created
+    if PYDANTIC_V2:
+
+        @classmethod
+        def __pydantic_init_subclass__(cls, **kwargs):
+            # Called by pydantic v2 when model fields are complete
+            super().__pydantic_init_subclass__(**kwargs)
+            cls._get_list_as_string_parsers()
+
+        def _dump(self, **kwargs):
+            return self.model_dump(**kwargs)
+
+    else:
+
+        def __init_subclass__(cls, **kwargs):
+            super().__init_subclass__(**kwargs)
+            cls._get_list_as_string_parsers()
+
+        def _dump(self, **kwargs):
+            return self.dict(**kwargs)
+
+
 class SqlAlchemyFilterBaseModel(
-    BaseModel,
+    ConverterBaseModel,
     SqlAlchemyFilterConverterMixin,
 ):
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
-        if self.ConverterConfig.model is None:
+        if self._get_converter_config().model is None:
             raise ValueError("ConverterConfig param 'model' can't be None")
 
     def _to_dict(self, **kwargs):
-        dict_values = self.dict(**kwargs)
-
-        if hasattr(self.ConverterConfig, "extra"):
-            for key, value in self.ConverterConfig.extra.items():
-                if key == BaseModelConverterExtraParams.LIST_AS_STRING:
-                    fields = value.get("fields")
-                    expected_types = value.get("expected_types")
-
-                    if fields:
-                        for dict_key, dict_value in dict_values.items():
-                            if dict_key in fields:
-                                expected_type = (
-                                    expected_types.get(dict_key)
-                                    if expected_types
-                                    else str
-                                )
-
-                                if expected_type is datetime.datetime:
-                                    expected_type = datetime.datetime.fromisoformat
-
-                                value = list(map(str.strip, dict_value.split(",")))
-
-                                dict_values[dict_key] = list(map(expected_type, value))
+        tracers = get_tracers()
+        if tracers:
+            started = time.perf_counter()
+
+        dict_values = self._dump(**kwargs)
+
+        for field_name, parser in self._get_list_as_string_parsers().items():
+            dict_value = dict_values.get(field_name)
+
+            if isinstance(dict_value, str):
+                dict_values[field_name] = parser(dict_value)
+
+        if tracers:
+            emit(
+                tracers,
+                Phase.PARSE,
+                started,
+                model=self._get_converter_config().model,
+                shape=get_shape(dict_values),
+            )
         return dict_values
 
     def to_binary_expressions(
         self,
         export_params=None,
+        to_many_strategy: tp.Optional[ToManyStrategy] = None,
     ):
         if export_params is None:
             export_params = dict()
@@ -67,12 +105,14 @@ class SqlAlchemyFilterBaseModel(
 
         return self.get_binary_expressions(
             filters=filters,
+            to_many_strategy=to_many_strategy,
         )
 
     def apply_filters(
         self,
         query,
         export_params=None,
+        to_many_strategy: tp.Optional[ToManyStrategy] = None,
     ):
         if export_params is None:
             export_params = dict()
@@ -81,44 +121,66 @@ class SqlAlchemyFilterBaseModel(
 
         filters_binary_expressions = self.get_models_binary_expressions(
             filters=filters,
+            to_many_strategy=to_many_strategy,
+        )
+
+        return self.apply_models_expressions(
+            query=query,
+            models_binary_expressions=filters_binary_expressions,
         )
 
-        models_to_join = []
-        binary_expressions = []
+    def get_count_query(self, export_params=None):
+        if export_params is None:
+            export_params = dict()
 
-        for binary_expression in filters_binary_expressions:
-            models_to_join += binary_expression["models"]
-            binary_expressions.append(binary_expression["binary_expression"])
+        filters = self._to_dict(exclude_none=True, **export_params)
 
-        # Checking if there are other models required to be joined
-        if models_to_join != [
-            self.ConverterConfig.model,
-        ]:
-            query = self.join_models(query=query, models=models_to_join)
+        return super().get_count_query(filters=filters)
 
-        query = query.filter(*binary_expressions)
-        return query
+    def get_count(
+        self,
+        session,
+        export_params=None,
+        estimate_threshold: tp.Optional[int] = None,
+    ) -> CountResult:
+        if export_params is None:
+            export_params = dict()
+
+        filters = self._to_dict(exclude_none=True, **export_params)
+
+        return super().get_count(
+            session=session,
+            filters=filters,
+            estimate_threshold=estimate_threshold,
+        )
 
 
-class SqlAlchemyOrderBaseModel(BaseModel, SqlAlchemyOrderConverterMixin):
+class SqlAlchemyOrderBaseModel(
+    ConverterBaseModel,
+    OrderByAsStringParsersMixin,
+    SqlAlchemyOrderConverterMixin,
+):
     order_by: tp.Optional[tp.Union[str, tp.List[str]]] = None
 
-    class Config:
-        extra = Extra.forbid
+    if PYDANTIC_V2:
+        model_config = ConfigDict(extra="forbid")
+    else:
+
+        class Config:
+            extra = "forbid"
 
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
-        if self.ConverterConfig.model is None:
+        if self._get_converter_config().model is None:
             raise ValueError("ConverterConfig param 'model' can't be None")
 
         self._split_list_to_str()
 
     def _split_list_to_str(self):
-        order_by = self.order_by
-        if hasattr(self.ConverterConfig, "extra"):
-            for key, value in self.ConverterConfig.extra.items():
-                if key == BaseModelConverterExtraParams.LIST_AS_STRING:
-                    self.order_by = list(map(str.strip, order_by.split(",")))
+        parser = self._get_list_as_string_parsers().get("order_by")
+
+        if parser is not None and isinstance(self.order_by, str):
+            self.order_by = parser(self.order_by)
 
     def to_unary_expressions(self):
         order_by = self.order_by
@@ -137,18 +199,74 @@ class SqlAlchemyOrderBaseModel(BaseModel, SqlAlchemyOrderConverterMixin):
             order_by=order_by,
         )
 
-        models_to_join = []
-        unary_expressions = []
+        return self.apply_models_expressions(
+            query=query,
+            models_unary_expressions=order_by_unary_expressions,
+        )
+
+    def apply_keyset_pagination(
+        self,
+        query,
+        cursor: tp.Optional[str] = None,
+        limit: tp.Optional[int] = None,
+    ):
+        return super().apply_keyset_pagination(
+            query=query,
+            order_by=self.order_by,
+            cursor=cursor,
+            limit=limit,
+        )
+
+    def get_next_cursor(
+        self,
+        row: tp.Any,
+    ) -> str:
+        return super().get_next_cursor(
+            row=row,
+            order_by=self.order_by,
+        )
+
 
-        for binary_expression in order_by_unary_expressions:
-            models_to_join += binary_expression["models"]
-            unary_expressions.append(binary_expression["unary_expression"])
+class SqlAlchemyQueryBaseModel(
+    SqlAlchemyFilterBaseModel,
+    SqlAlchemyQueryConverterMixin,
+):
+    # Filters, ordering and pagination in one model
+    # are applied to a query using a single pass
+    order_by: tp.Optional[tp.Union[str, tp.List[str]]] = None
+    limit: tp.Optional[int] = None
+    offset: tp.Optional[int] = None
+
+    def _to_dict(self, **kwargs):
+        dict_values = super()._to_dict(**kwargs)
 
-        # Checking if there are other models required to be joined
-        if models_to_join != [
-            self.ConverterConfig.model,
-        ]:
-            query = self.join_models(query=query, models=models_to_join)
+        for field_name in QUERY_SPEC_FIELDS:
+            dict_values.pop(field_name, None)
+        return dict_values
+
+    def _to_query_spec(self, export_params=None) -> tp.Dict[str, tp.Any]:
+        if export_params is None:
+            export_params = dict()
 
-        query = query.order_by(*unary_expressions)
-        return query
+        filters = super()._to_dict(exclude_none=True, **export_params)
+
+        query_spec = {
+            field_name: filters.pop(field_name, None)
+            for field_name in QUERY_SPEC_FIELDS
+        }
+        query_spec["filters"] = filters
+        return query_spec
+
+    def apply_query_spec(
+        self,
+        query,
+        export_params=None,
+        to_many_strategy: tp.Optional[ToManyStrategy] = None,
+        with_total_count: bool = False,
+    ):
+        return super().apply_query_spec(
+            query=query,
+            to_many_strategy=to_many_strategy,
+            with_total_count=with_total_count,
+            **self._to_query_spec(export_params=export_params),
+        )
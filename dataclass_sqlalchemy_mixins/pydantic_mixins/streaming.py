@@ -0,0 +1,59 @@
+import typing as tp
+
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from dataclass_sqlalchemy_mixins.base import async_utils, utils
+from dataclass_sqlalchemy_mixins.base.utils import DEFAULT_YIELD_PER
+from dataclass_sqlalchemy_mixins.pydantic_mixins.sqlalchemy_base_models import (
+    SqlAlchemyFilterBaseModel,
+    SqlAlchemyOrderBaseModel,
+)
+
+
+def _apply_models(
+    query,
+    filter_model: tp.Optional[SqlAlchemyFilterBaseModel] = None,
+    order_model: tp.Optional[SqlAlchemyOrderBaseModel] = None,
+):
+    if filter_model is not None:
+        query = filter_model.apply_filters(query=query)
+    if order_model is not None:
+        query = order_model.apply_order_by(query=query)
+    return query
+
+
+def stream(
+    session: Session,
+    query,
+    filter_model: tp.Optional[SqlAlchemyFilterBaseModel] = None,
+    order_model: tp.Optional[SqlAlchemyOrderBaseModel] = None,
+    yield_per: int = DEFAULT_YIELD_PER,
+) -> tp.Iterator[tp.Any]:
+    return utils.stream_query(
+        session=session,
+        query=_apply_models(
+            query=query,
+            filter_model=filter_model,
+            order_model=order_model,
+        ),
+        yield_per=yield_per,
+    )
+
+
+def async_stream(
+    session: AsyncSession,
+    query,
+    filter_model: tp.Optional[SqlAlchemyFilterBaseModel] = None,
+    order_model: tp.Optional[SqlAlchemyOrderBaseModel] = None,
+    yield_per: int = DEFAULT_YIELD_PER,
+) -> tp.AsyncIterator[tp.Any]:
+    return async_utils.stream_query(
+        session=session,
+        query=_apply_models(
+            query=query,
+            filter_model=filter_model,
+            order_model=order_model,
+        ),
+        yield_per=yield_per,
+    )
@@ -0,0 +1,250 @@
+import asyncio
+
+import pytest
+from sqlalchemy import select
+
+from dataclass_sqlalchemy_mixins.base import async_utils
+from dataclass_sqlalchemy_mixins.base.tracing import Phase, tracing
+from dataclass_sqlalchemy_mixins.pydantic_mixins.sqlalchemy_base_models import (
+    SqlAlchemyFilterBaseModel,
+    SqlAlchemyOrderBaseModel,
+)
+from dataclass_sqlalchemy_mixins.pydantic_mixins.streaming import async_stream
+from tests.sqlite_models import Base, Group, Item
+
+
+pytest.importorskip("aiosqlite")
+
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine  # noqa: E402
+
+
+class ItemFilterModel(SqlAlchemyFilterBaseModel):
+    group__name: str = None
+
+    class ConverterConfig:
+        model = Item
+
+
+class ItemOrderModel(SqlAlchemyOrderBaseModel):
+    order_by: str = None
+
+    class ConverterConfig:
+        model = Item
+
+
+async def create_session():
+    engine = create_async_engine("sqlite+aiosqlite://")
+
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    session = AsyncSession(engine, expire_on_commit=False)
+    session.add_all(
+        [
+            Group(id=1, name="first"),
+            Group(id=2, name="second"),
+            *[
+                Item(id=i, name=f"item_{i}", number=i, group_id=i % 2 + 1)
+                for i in range(1, 11)
+            ],
+        ]
+    )
+    await session.commit()
+
+    return engine, session
+
+
+@pytest.fixture
+def run_with_session():
+    def run(coroutine_function):
+        async def run_coroutine():
+            engine, session = await create_session()
+            try:
+                return await coroutine_function(session)
+            finally:
+                await session.close()
+                await engine.dispose()
+
+        return asyncio.run(run_coroutine())
+
+    return run
+
+
+def test_fetch_all__ok(run_with_session):
+    async def fetch_all(session):
+        return await async_utils.fetch_all(
+            session=session,
+            query=select(Item),
+            filters={"group__name": "first", "number__gte": 4},
+            order_by="-number",
+            limit=2,
+            offset=1,
+            model=Item,
+        )
+
+    items = run_with_session(fetch_all)
+
+    assert [item.id for item in items] == [8, 6]
+
+
+def test_fetch_all__columns__rows(run_with_session):
+    async def fetch_all(session):
+        return await async_utils.fetch_all(
+            session=session,
+            query=select(Item.id, Item.name),
+            filters={"id__in": [1, 2]},
+            order_by="id",
+            model=Item,
+        )
+
+    assert run_with_session(fetch_all) == [(1, "item_1"), (2, "item_2")]
+
+
+def test_fetch_first__ok(run_with_session):
+    async def fetch_first(session):
+        return (
+            await async_utils.fetch_first(
+                session=session,
+                query=select(Item),
+                filters={"group__name": "second"},
+                order_by="-id",
+                model=Item,
+            ),
+            await async_utils.fetch_first(
+                session=session,
+                query=select(Item),
+                filters={"name": "wrong"},
+                model=Item,
+            ),
+        )
+
+    item, no_item = run_with_session(fetch_first)
+
+    assert item.id == 9
+    assert no_item is None
+
+
+def test_fetch_count__ok(run_with_session):
+    async def fetch_count(session):
+        return (
+            await async_utils.fetch_count(
+                session=session,
+                query=select(Item).order_by(Item.name),
+                filters={"group__name": "first"},
+                model=Item,
+            ),
+            await async_utils.fetch_count(
+                session=session,
+                query=select(Item),
+                model=Item,
+            ),
+        )
+
+    assert run_with_session(fetch_count) == (5, 10)
+
+
+def test_fetch_count__to_many__ok(run_with_session):
+    async def fetch_count(session):
+        return (
+            await async_utils.fetch_count(
+                session=session,
+                query=select(Group),
+                filters={"items__number__gte": 1},
+                model=Group,
+            ),
+            await async_utils.fetch_count(
+                session=session,
+                filters={"items__number__gte": 1},
+                model=Group,
+            ),
+        )
+
+    # Groups are counted once however many items match
+    assert run_with_session(fetch_count) == (2, 2)
+
+
+def test_stream__ok(run_with_session):
+    async def stream(session):
+        items_ids = []
+
+        async for item in async_utils.stream(
+            session=session,
+            query=select(Item),
+            filters={"number__lte": 5},
+            order_by="id",
+            model=Item,
+        ):
+            items_ids.append(item.id)
+
+        return items_ids
+
+    assert run_with_session(stream) == [1, 2, 3, 4, 5]
+
+
+def test_stream__traced__ok(run_with_session):
+    events = []
+
+    async def stream(session):
+        with tracing(events.append):
+            return [
+                item.id
+                async for item in async_utils.stream(
+                    session=session,
+                    query=select(Item),
+                    filters={"number__lte": 2},
+                    order_by="id",
+                    model=Item,
+                )
+            ]
+
+    assert run_with_session(stream) == [1, 2]
+    assert [
+        (event.phase, event.model) for event in events if event.phase == Phase.EXECUTE
+    ] == [(Phase.EXECUTE, Item)]
+
+
+def test_stream__models__ok(run_with_session):
+    async def stream(session):
+        return [
+            item.id
+            async for item in async_stream(
+                session=session,
+                query=select(Item),
+                filter_model=ItemFilterModel(group__name="second"),
+                order_model=ItemOrderModel(order_by="-id"),
+                yield_per=2,
+            )
+        ]
+
+    assert run_with_session(stream) == [9, 7, 5, 3, 1]
+
+
+def test_stream__stopped_early__ok(run_with_session):
+    async def stream(session):
+        items = async_utils.stream(
+            session=session,
+            query=select(Item.id),
+            order_by="id",
+            model=Item,
+        )
+
+        async for row in items:
+            break
+        await items.aclose()
+
+        # Session can be used after a stream is closed
+        return row, await async_utils.fetch_count(
+            session=session,
+            query=select(Item),
+            model=Item,
+        )
+
+    assert run_with_session(stream) == (1, 10)
+
+
+def test_fetch_all__no_model__error(run_with_session):
+    async def fetch_all(session):
+        return await async_utils.fetch_all(session=session, query=select(Item))
+
+    with pytest.raises(ValueError):
+        run_with_session(fetch_all)
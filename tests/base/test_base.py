@@ -1,12 +1,16 @@
+import warnings
+
 import pytest
 from pydantic import ValidationError
+from sqlalchemy import select
 
+from dataclass_sqlalchemy_mixins.base.mixins import ToManyStrategy
 from dataclass_sqlalchemy_mixins.pydantic_mixins.sqlalchemy_base_models import (
     BaseModelConverterExtraParams,
     SqlAlchemyFilterBaseModel,
     SqlAlchemyOrderBaseModel,
 )
-from tests.models import Item
+from tests.models import Group, Item
 
 
 def test_filter_model__init__ok():
@@ -43,6 +47,66 @@ def test_filter_model__with_extra_config_params():
     assert dict_values == {"field__in": ["value_1", "value_2", "value_3"]}
 
 
+def test_filter_model__extra_config_params_replaced():
+    class SomeSqlAlchemyFilterModel(SqlAlchemyFilterBaseModel):
+        field__in: str = None
+
+        class ConverterConfig:
+            model = Item
+
+    filter_model = SomeSqlAlchemyFilterModel(field__in="1, 2")
+    assert filter_model._to_dict() == {"field__in": "1, 2"}
+
+    SomeSqlAlchemyFilterModel.ConverterConfig.extra = {
+        BaseModelConverterExtraParams.LIST_AS_STRING: {
+            "fields": ["field__in"],
+            "expected_types": {"field__in": int},
+        }
+    }
+    assert filter_model._to_dict() == {"field__in": [1, 2]}
+
+
+def test_filter_model__converter_config_params_replaced():
+    class SomeSqlAlchemyFilterModel(SqlAlchemyFilterBaseModel):
+        name: str = None
+        items__name: str = None
+
+        class ConverterConfig:
+            model = Item
+
+    query = SomeSqlAlchemyFilterModel(name="name").apply_filters(query=select(Item))
+    assert str(query.whereclause) == "item.name = :name_1"
+
+    SomeSqlAlchemyFilterModel.ConverterConfig.model = Group
+    SomeSqlAlchemyFilterModel.ConverterConfig.to_many_strategy = ToManyStrategy.EXISTS
+
+    query = SomeSqlAlchemyFilterModel(items__name="name").apply_filters(
+        query=select(Group)
+    )
+    assert "EXISTS" in str(query.whereclause)
+    assert "JOIN" not in str(query)
+
+
+def test_filter_model__to_dict__no_deprecation_warnings():
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+
+        class SomeSqlAlchemyFilterModel(SqlAlchemyFilterBaseModel):
+            field: str = None
+
+            class ConverterConfig:
+                model = Item
+
+        class SomeSqlAlchemyOrderModel(SqlAlchemyOrderBaseModel):
+            class ConverterConfig:
+                model = Item
+
+        assert SomeSqlAlchemyFilterModel(field="value")._to_dict(exclude_none=True) == {
+            "field": "value"
+        }
+        SomeSqlAlchemyOrderModel(order_by="id")
+
+
 def test_filter_model__without_extra_config_params():
     class SomeSqlAlchemyFilterModel(SqlAlchemyFilterBaseModel):
         field__in: str = None
@@ -0,0 +1,166 @@
+import pytest
+from sqlalchemy.orm import configure_mappers
+
+from dataclass_sqlalchemy_mixins.base.cache import LRUCache
+from dataclass_sqlalchemy_mixins.base.mixins import (
+    FilterPlanOptions,
+    SqlAlchemyFilterConverterMixin,
+)
+from tests import models
+
+
+@pytest.fixture
+def filter_plan_cache():
+    # Configuring mappers invalidates cached plans
+    configure_mappers()
+
+    SqlAlchemyFilterConverterMixin.clear_filter_plan_cache()
+    yield SqlAlchemyFilterConverterMixin._filter_plan_cache
+    SqlAlchemyFilterConverterMixin.clear_filter_plan_cache()
+
+
+def test_lru_cache__get_set__ok():
+    cache = LRUCache(maxsize=2)
+
+    assert cache.get("first") is None
+
+    cache.set("first", 1)
+    cache.set("second", 2)
+
+    assert cache.get("first") == 1
+    assert cache.get("second") == 2
+
+    cache_info = cache.info()
+    assert cache_info.hits == 2
+    assert cache_info.misses == 1
+    assert cache_info.evictions == 0
+    assert cache_info.currsize == 2
+
+
+def test_lru_cache__eviction__ok():
+    cache = LRUCache(maxsize=2)
+
+    cache.set("first", 1)
+    cache.set("second", 2)
+
+    # Marking the first key as recently used
+    cache.get("first")
+
+    cache.set("third", 3)
+
+    assert "first" in cache
+    assert "second" not in cache
+    assert "third" in cache
+    assert cache.info().evictions == 1
+
+
+def test_lru_cache__clear__ok():
+    cache = LRUCache(maxsize=2)
+
+    cache.set("first", 1)
+    cache.get("first")
+    cache.get("second")
+
+    cache.clear()
+
+    assert len(cache) == 0
+    assert cache.info() == (0, 0, 0, 2, 0)
+
+
+def test_lru_cache__wrong_maxsize__error():
+    with pytest.raises(ValueError):
+        LRUCache(maxsize=0)
+
+
+def test_filter_plan_cache__shared_between_instances__ok(filter_plan_cache):
+    filters = {
+        "id__gte": 1,
+        "group__name__in": ["first", "second"],
+    }
+
+    SqlAlchemyFilterConverterMixin().get_binary_expressions(
+        filters=filters,
+        model=models.Item,
+    )
+    cache_info = SqlAlchemyFilterConverterMixin.get_filter_plan_cache_info()
+    assert cache_info.misses == 2
+    assert cache_info.hits == 0
+    assert cache_info.currsize == 2
+
+    binary_expressions = SqlAlchemyFilterConverterMixin().get_binary_expressions(
+        filters=filters,
+        model=models.Item,
+    )
+    cache_info = SqlAlchemyFilterConverterMixin.get_filter_plan_cache_info()
+    assert cache_info.misses == 2
+    assert cache_info.hits == 2
+
+    # Values are not part of a plan and are bound on every call
+    assert str(binary_expressions[0].right.value) == "1"
+    assert binary_expressions[1].right.value == ["first", "second"]
+
+
+def test_filter_plan_cache__models_are_not_shared__ok(filter_plan_cache):
+    converter = SqlAlchemyFilterConverterMixin()
+
+    models_binary_expressions = converter.get_models_binary_expressions(
+        filters={"group__name": "name"},
+        model=models.Item,
+    )
+    models_binary_expressions[0]["models"].append(models.Owner)
+
+    models_binary_expressions = converter.get_models_binary_expressions(
+        filters={"group__name": "name"},
+        model=models.Item,
+    )
+    assert models_binary_expressions[0]["models"] == [models.Group]
+
+
+def test_filter_plan_cache__isnull__ok(filter_plan_cache):
+    converter = SqlAlchemyFilterConverterMixin()
+
+    for value, expected_sql in (
+        (True, "item.name IS NULL"),
+        (False, "item.name IS NOT NULL"),
+    ):
+        binary_expression = converter.get_binary_expressions(
+            filters={"name__isnull": value},
+            model=models.Item,
+        )[0]
+        assert str(binary_expression) == expected_sql
+
+    assert SqlAlchemyFilterConverterMixin.get_filter_plan_cache_info().hits == 1
+
+
+def test_filter_plan_cache__wrong_field__not_cached(filter_plan_cache):
+    converter = SqlAlchemyFilterConverterMixin()
+
+    with pytest.raises(AttributeError):
+        converter.get_binary_expressions(
+            filters={"wrong_field": 1},
+            model=models.Item,
+        )
+
+    assert SqlAlchemyFilterConverterMixin.get_filter_plan_cache_info().currsize == 0
+
+
+def test_filter_plan_cache__subclasses_are_not_shared__ok(filter_plan_cache):
+    class OwnerNameConverter(SqlAlchemyFilterConverterMixin):
+        def _get_filter_plan(self, field, model, options=FilterPlanOptions()):
+            return super()._get_filter_plan(
+                field="group__owner__first_name",
+                model=model,
+                options=options,
+            )
+
+    SqlAlchemyFilterConverterMixin().get_binary_expressions(
+        filters={"group__name": "name"},
+        model=models.Item,
+    )
+    binary_expression = OwnerNameConverter().get_binary_expressions(
+        filters={"group__name": "name"},
+        model=models.Item,
+    )[0]
+
+    assert str(binary_expression) == '"Owner".first_name = :first_name_1'
+    assert SqlAlchemyFilterConverterMixin.get_filter_plan_cache_info().hits == 0
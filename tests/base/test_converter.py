@@ -0,0 +1,176 @@
+import random
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.sql.util import find_tables
+
+from dataclass_sqlalchemy_mixins.base import converter as converter_module
+from dataclass_sqlalchemy_mixins.base import utils
+from dataclass_sqlalchemy_mixins.base.cache import LRUCache
+from dataclass_sqlalchemy_mixins.base.converter import (
+    SqlAlchemyConverter,
+    get_converter,
+)
+from dataclass_sqlalchemy_mixins.base.in_lists import InStrategy
+from dataclass_sqlalchemy_mixins.base.mixins import (
+    FrozenConverterConfig,
+    SqlAlchemyFilterConverterMixin,
+    ToManyStrategy,
+)
+from tests import models
+
+
+MODELS_FILTERS = {
+    models.Item: (
+        {"name": "item_name", "group__name__in": ["first", "second"]},
+        "-group__owner__first_name",
+        {"item", "group", "Owner"},
+    ),
+    models.Group: (
+        {"name__like": "%group%", "owner__email__isnull": False},
+        "owner__last_name",
+        {"group", "Owner"},
+    ),
+    models.Owner: (
+        {"first_name__ilike": "owner", "id__gte": 1},
+        "-id",
+        {"Owner"},
+    ),
+}
+
+
+def get_query_tables(query):
+    return {table.name for table in find_tables(query.whereclause)} | {
+        table.name for table in find_tables(query.get_final_froms()[0])
+    }
+
+
+def test_get_converter__cached__ok():
+    assert get_converter(models.Item) is get_converter(models.Item)
+    assert get_converter(models.Item) is not get_converter(models.Group)
+
+
+def test_get_converter__bounded__ok(monkeypatch):
+    monkeypatch.setattr(converter_module, "_converters", LRUCache(maxsize=1))
+
+    item_converter = get_converter(models.Item)
+    get_converter(models.Group)
+
+    # Converters of the least recently used models are dropped
+    assert models.Item not in converter_module._converters
+    assert get_converter(models.Item) is not item_converter
+
+
+def test_converter__immutable__error():
+    converter = SqlAlchemyConverter(model=models.Item)
+
+    with pytest.raises(AttributeError):
+        converter.ConverterConfig = None
+
+    with pytest.raises(AttributeError):
+        converter.ConverterConfig.model = models.Group
+
+    with pytest.raises(AttributeError):
+        del converter.ConverterConfig
+
+    assert converter.model is models.Item
+
+
+def test_converter__no_model__error():
+    with pytest.raises(ValueError) as e:
+        SqlAlchemyConverter(model=None)
+    assert str(e.value) == "SqlAlchemyConverter param 'model' can't be None"
+
+
+def test_converter_mixin__model_param_is_not_stored__ok():
+    converter = SqlAlchemyFilterConverterMixin()
+
+    converter.get_binary_expressions(filters={"name": "name"}, model=models.Item)
+
+    assert converter.ConverterConfig.model is None
+
+    with pytest.raises(ValueError):
+        converter.get_binary_expressions(filters={"name": "name"})
+
+
+def test_converter__thread_pool__no_model_leakage__ok():
+    shared_mixin = SqlAlchemyFilterConverterMixin()
+
+    def build_query(model):
+        filters, order_by, expected_tables = MODELS_FILTERS[model]
+
+        query = select(model)
+        query = utils.apply_filters(query=query, filters=filters, model=model)
+        query = utils.apply_order_by(query=query, order_by=order_by, model=model)
+
+        binary_expressions = shared_mixin.get_binary_expressions(
+            filters=filters,
+            model=model,
+        )
+        return model, query, binary_expressions
+
+    tasks = [random.choice(list(MODELS_FILTERS)) for _ in range(2000)]
+
+    with ThreadPoolExecutor(max_workers=16) as executor:
+        results = list(executor.map(build_query, tasks))
+
+    for model, query, binary_expressions in results:
+        _, _, expected_tables = MODELS_FILTERS[model]
+
+        assert query.column_descriptions[0]["entity"] is model
+        assert get_query_tables(query) == expected_tables
+
+        # The first filter always belongs to the queried model
+        assert binary_expressions[0].left.table is model.__table__
+
+
+class ItemConverter(SqlAlchemyFilterConverterMixin):
+    class ConverterConfig:
+        model = models.Item
+        in_strategy = "values"
+
+
+def test_converter_mixin__config_resolved_once_per_class__ok():
+    converter_config = ItemConverter()._get_converter_config()
+
+    assert converter_config == FrozenConverterConfig(
+        model=models.Item,
+        to_many_strategy=ToManyStrategy.JOIN,
+        in_strategy=InStrategy.VALUES,
+    )
+    # Instances share a config of a class
+    assert ItemConverter()._get_converter_config() is converter_config
+    assert "ConverterConfig" not in vars(ItemConverter())
+    assert not hasattr(SqlAlchemyFilterConverterMixin(), "__dict__")
+
+    with pytest.raises(AttributeError):
+        converter_config.model = models.Group
+
+
+def test_converter_mixin__extra_replaced__config_resolved_again__ok():
+    class SomeConverter(SqlAlchemyFilterConverterMixin):
+        class ConverterConfig:
+            model = models.Item
+
+    assert SomeConverter()._get_converter_config().extra is None
+
+    SomeConverter.ConverterConfig.extra = {"key": {}}
+
+    assert SomeConverter()._get_converter_config().extra == {"key": {}}
+
+
+def test_converter_mixin__model_passed__ok():
+    converter = ItemConverter(model=models.Group)
+
+    assert converter._get_converter_config().model is models.Group
+    assert converter._get_converter_config().in_strategy == InStrategy.VALUES
+    assert ItemConverter()._get_converter_config().model is models.Item
+
+    binary_expressions = converter.get_binary_expressions(filters={"name": "name"})
+    assert binary_expressions[0].left.table is models.Group.__table__
+
+
+def test_converter_mixin__slots__model_passed__error():
+    with pytest.raises(TypeError):
+        SqlAlchemyFilterConverterMixin(model=models.Item)
@@ -0,0 +1,239 @@
+import typing as tp
+
+import pytest
+from sqlalchemy import insert, select, text
+
+from dataclass_sqlalchemy_mixins.base import utils
+from dataclass_sqlalchemy_mixins.base.explain import get_used_indexes
+from dataclass_sqlalchemy_mixins.base.index_advisor import (
+    IndexIssue,
+    IndexSuggestion,
+    advise_filter_model_indexes,
+    advise_indexes,
+    advise_workload_indexes,
+)
+from dataclass_sqlalchemy_mixins.base.workload import (
+    FilterShape,
+    WorkloadKind,
+    WorkloadRecord,
+)
+from dataclass_sqlalchemy_mixins.pydantic_mixins.sqlalchemy_base_models import (
+    SqlAlchemyFilterBaseModel,
+)
+from tests.sqlite_models import Group, Item, Owner
+
+
+class ItemFilterModel(SqlAlchemyFilterBaseModel):
+    code: tp.Optional[str] = None
+    number__gte: tp.Optional[int] = None
+    group__owner__name: tp.Optional[str] = None
+
+    class ConverterConfig:
+        model = Item
+
+
+@pytest.fixture
+def sqlite_session(sqlite_session):
+    sqlite_session.execute(
+        insert(Owner), [{"id": i, "name": f"owner_{i}"} for i in range(10)]
+    )
+    sqlite_session.execute(
+        insert(Group),
+        [{"id": i, "name": f"group_{i}", "owner_id": i % 10} for i in range(100)],
+    )
+    sqlite_session.execute(
+        insert(Item),
+        [
+            {
+                "id": i,
+                "name": f"item_{i}",
+                "number": i,
+                "code": f"code_{i}",
+                "group_id": i % 100,
+            }
+            for i in range(1000)
+        ],
+    )
+    sqlite_session.commit()
+    return sqlite_session
+
+
+def test_advise_indexes__sqlite__ok():
+    suggestions = advise_indexes(
+        model=Item,
+        filters=["number__gte", "code", "name__like", "group__name", "group__id"],
+        order_by=["-number"],
+        dialect="sqlite",
+    )
+
+    assert suggestions == [
+        IndexSuggestion(
+            table="group",
+            column="name",
+            issue=IndexIssue.MISSING,
+            keys=("group__name",),
+            ddl='CREATE INDEX ix_group_name ON "group" (name)',
+        ),
+        IndexSuggestion(
+            table="item",
+            column="group_id",
+            issue=IndexIssue.MISSING,
+            keys=("group__name", "group__id"),
+            ddl="CREATE INDEX ix_item_group_id ON item (group_id)",
+        ),
+        IndexSuggestion(
+            table="item",
+            column="name",
+            issue=IndexIssue.MISSING,
+            keys=("name__like",),
+            ddl='CREATE INDEX ix_item_name_nocase ON item (name COLLATE "NOCASE")',
+        ),
+        IndexSuggestion(
+            table="item",
+            column="number",
+            issue=IndexIssue.MISSING,
+            keys=("number__gte", "-number"),
+            ddl="CREATE INDEX ix_item_number ON item (number)",
+        ),
+    ]
+
+
+def test_advise_indexes__unindexed_join__ok():
+    suggestions = advise_indexes(
+        model=Item,
+        filters=["group__owner__name"],
+        dialect="sqlite",
+    )
+
+    assert [
+        (suggestion.table, suggestion.column, suggestion.issue)
+        for suggestion in suggestions
+    ] == [
+        ("group", "owner_id", IndexIssue.UNINDEXED_JOIN),
+        ("item", "group_id", IndexIssue.UNINDEXED_JOIN),
+    ]
+
+
+def test_advise_indexes__eliminated_join__ok():
+    suggestions = advise_indexes(
+        model=Item,
+        filters=["group__owner__id"],
+        dialect="sqlite",
+    )
+
+    # The converter filters by "group".owner_id without joining owners
+    assert [
+        (suggestion.table, suggestion.column, suggestion.issue)
+        for suggestion in suggestions
+    ] == [
+        ("group", "owner_id", IndexIssue.MISSING),
+        ("item", "group_id", IndexIssue.UNINDEXED_JOIN),
+    ]
+
+
+@pytest.mark.parametrize(
+    ("dialect", "expected_issue", "expected_ddl"),
+    [
+        (
+            "postgresql",
+            IndexIssue.UNUSABLE,
+            "CREATE INDEX ix_owner_name_trgm ON owner USING gin (name gin_trgm_ops)",
+        ),
+        ("sqlite", IndexIssue.UNUSABLE, None),
+    ],
+)
+def test_advise_indexes__ilike__ok(dialect, expected_issue, expected_ddl):
+    suggestions = advise_indexes(model=Owner, filters=["name__ilike"], dialect=dialect)
+
+    assert suggestions == [
+        IndexSuggestion(
+            table="owner",
+            column="name",
+            issue=expected_issue,
+            keys=("name__ilike",),
+            ddl=expected_ddl,
+        ),
+    ]
+
+
+def test_advise_indexes__indexed__ok():
+    suggestions = advise_indexes(
+        model=Item,
+        filters=["id__in", "code", "number__not"],
+        order_by=["id"],
+        dialect="postgresql",
+    )
+
+    assert suggestions == []
+
+
+def test_advise_filter_model_indexes__ok():
+    suggestions = advise_filter_model_indexes(ItemFilterModel, dialect="sqlite")
+
+    assert [(suggestion.column, suggestion.keys) for suggestion in suggestions] == [
+        ("owner_id", ("group__owner__name",)),
+        ("group_id", ("group__owner__name",)),
+        ("number", ("number__gte",)),
+    ]
+
+
+def test_advise_workload_indexes__ok():
+    workload = [
+        WorkloadRecord(
+            kind=WorkloadKind.FILTERS,
+            model="Item",
+            shape=(FilterShape(key="number__lt", op="lt"),),
+            duration=0.0,
+        ),
+        WorkloadRecord(
+            kind=WorkloadKind.ORDER_BY,
+            model="Item",
+            shape=("group__name",),
+            duration=0.0,
+        ),
+    ]
+
+    suggestions = advise_workload_indexes(
+        workload,
+        models={"Item": Item},
+        dialect="sqlite",
+    )
+
+    assert [(suggestion.column, suggestion.keys) for suggestion in suggestions] == [
+        ("name", ("group__name",)),
+        ("group_id", ("group__name",)),
+        ("number", ("number__lt",)),
+    ]
+
+
+@pytest.mark.parametrize(
+    ("filters", "order_by"),
+    [
+        ({"number__gte": 990}, None),
+        ({"name__like": "item_99%"}, None),
+        ({"group__name": "group_1"}, None),
+        (None, ["-number"]),
+    ],
+)
+def test_advise_indexes__sqlite__explain__ok(sqlite_session, filters, order_by):
+    query = utils.apply_query_spec(
+        query=select(Item),
+        filters=filters,
+        order_by=order_by,
+        model=Item,
+    )
+    assert get_used_indexes(sqlite_session, query) == set()
+
+    suggestions = advise_indexes(
+        model=Item,
+        filters=filters or (),
+        order_by=order_by or (),
+        dialect="sqlite",
+    )
+    for suggestion in suggestions:
+        sqlite_session.execute(text(suggestion.ddl))
+
+    # Suggested indexes are used once they are created
+    assert get_used_indexes(sqlite_session, query) & {
+        suggestion.ddl.split()[2] for suggestion in suggestions
+    }
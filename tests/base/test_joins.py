@@ -0,0 +1,129 @@
+import pytest
+from sqlalchemy import select
+from sqlalchemy.orm import Query
+
+from dataclass_sqlalchemy_mixins.base import utils
+from dataclass_sqlalchemy_mixins.base.mixins import (
+    JOINED_TABLES_ATTR,
+    SqlAlchemyBaseConverterMixin,
+)
+from tests import models
+
+
+@pytest.fixture(params=["select", "query"])
+def get_query(request):
+    def query(model):
+        if request.param == "select":
+            return select(model)
+        return Query(model)
+
+    return query
+
+
+def get_compiled_query(query):
+    if isinstance(query, Query):
+        query = query.statement
+    return str(query)
+
+
+def test_join_models__registry__ok(get_query):
+    query = utils.apply_filters(
+        query=get_query(models.Item),
+        filters={"group__owner__first_name": "first_name"},
+        model=models.Item,
+    )
+
+    assert getattr(query, JOINED_TABLES_ATTR).tables == {
+        models.Item.__table__,
+        models.Group.__table__,
+        models.Owner.__table__,
+    }
+
+    # Registry is kept by statements generated from the joined one
+    query = query.filter(models.Item.id > 1).limit(10)
+
+    assert getattr(query, JOINED_TABLES_ATTR).tables == {
+        models.Item.__table__,
+        models.Group.__table__,
+        models.Owner.__table__,
+    }
+
+
+def test_join_models__registry__no_internals_lookup__ok(get_query, monkeypatch):
+    query = utils.apply_filters(
+        query=get_query(models.Item),
+        filters={"group__name": "name"},
+        model=models.Item,
+    )
+
+    def find_joined_tables(*args, **kwargs):
+        raise AssertionError("Joins should be taken from the registry")
+
+    monkeypatch.setattr(
+        SqlAlchemyBaseConverterMixin,
+        "_find_joined_tables",
+        find_joined_tables,
+    )
+
+    query = utils.apply_order_by(
+        query=query,
+        order_by=["group__owner__first_name", "-group__name"],
+        model=models.Item,
+    )
+
+    compiled_query = get_compiled_query(query)
+    assert compiled_query.count("JOIN") == 2
+    assert compiled_query.count('JOIN "group"') == 1
+    assert compiled_query.count('JOIN "Owner"') == 1
+
+
+@pytest.mark.parametrize(
+    "join_target",
+    [
+        models.Group,
+        models.Item.group,
+        models.Group.__table__,
+    ],
+)
+def test_join_models__joined_by_caller__ok(get_query, join_target):
+    query = get_query(models.Item).join(join_target)
+
+    query = utils.apply_filters(
+        query=query,
+        filters={"group__name": "name", "group__owner__email": "email"},
+        model=models.Item,
+    )
+
+    compiled_query = get_compiled_query(query)
+    assert compiled_query.count('JOIN "group"') == 1
+    assert compiled_query.count('JOIN "Owner"') == 1
+
+
+def test_join_models__same_model_several_times__ok(get_query):
+    query = SqlAlchemyBaseConverterMixin().join_models(
+        query=get_query(models.Item),
+        models=[models.Group, models.Group, models.Owner, models.Item, models.Owner],
+        model=models.Item,
+    )
+
+    compiled_query = get_compiled_query(query)
+    assert compiled_query.count("JOIN") == 2
+
+
+def test_join_models__joined_by_caller_after_registry__ok(get_query):
+    query = utils.apply_filters(
+        query=get_query(models.Item),
+        filters={"group__name": "x"},
+        model=models.Item,
+    )
+    query = query.join(models.Owner, models.Group.owner_id == models.Owner.id)
+
+    query = utils.apply_order_by(
+        query=query,
+        order_by="group__owner__first_name",
+        model=models.Item,
+    )
+
+    compiled_query = get_compiled_query(query)
+    assert compiled_query.count('JOIN "group"') == 1
+    assert compiled_query.count('JOIN "Owner"') == 1
@@ -0,0 +1,107 @@
+import datetime as dt
+import decimal
+import enum
+import uuid
+
+import pytest
+
+from dataclass_sqlalchemy_mixins.base.parsers import (
+    get_list_as_string_parsers,
+    get_list_parser,
+)
+from dataclass_sqlalchemy_mixins.pydantic_mixins.sqlalchemy_base_models import (
+    BaseModelConverterExtraParams,
+    SqlAlchemyFilterBaseModel,
+)
+from tests.models import Item
+
+
+class Color(str, enum.Enum):
+    RED = "red"
+    GREEN = "green"
+
+
+class Size(enum.Enum):
+    SMALL = 1
+    LARGE = 2
+
+
+@pytest.mark.parametrize(
+    ("expected_type", "value", "expected_result"),
+    [
+        (str, "a, b ,c", ["a", "b", "c"]),
+        (int, "1, 2", [1, 2]),
+        (float, "1.5, 2", [1.5, 2.0]),
+        (decimal.Decimal, "1.10, 2", [decimal.Decimal("1.10"), decimal.Decimal("2")]),
+        (
+            uuid.UUID,
+            "12345678-1234-5678-1234-567812345678",
+            [uuid.UUID("12345678-1234-5678-1234-567812345678")],
+        ),
+        (dt.date, "2024-01-02, 2024-02-03", [dt.date(2024, 1, 2), dt.date(2024, 2, 3)]),
+        (dt.datetime, "2024-01-02T10:11:12", [dt.datetime(2024, 1, 2, 10, 11, 12)]),
+        (Color, "red, GREEN", [Color.RED, Color.GREEN]),
+        (Size, "1, LARGE", [Size.SMALL, Size.LARGE]),
+        (lambda value: value.upper(), "a, b", ["A", "B"]),
+    ],
+)
+def test_get_list_parser__ok(expected_type, value, expected_result):
+    assert get_list_parser(expected_type)(value) == expected_result
+
+
+def test_get_list_parser__wrong_enum_value__error():
+    with pytest.raises(ValueError) as e:
+        get_list_parser(Color)("red, blue")
+    assert str(e.value) == "'blue' is not a valid Color"
+
+
+def test_get_list_as_string_parsers__ok():
+    parsers = get_list_as_string_parsers(
+        {
+            BaseModelConverterExtraParams.LIST_AS_STRING: {
+                "fields": ["id__in", "name__in"],
+                "expected_types": {"id__in": int},
+            }
+        }
+    )
+
+    assert set(parsers) == {"id__in", "name__in"}
+    assert parsers["id__in"]("1, 2") == [1, 2]
+    assert parsers["name__in"]("1, 2") == ["1", "2"]
+
+    assert get_list_as_string_parsers(None) == {}
+    assert get_list_as_string_parsers({}) == {}
+
+
+def test_filter_model__list_as_string__compiled_once():
+    class SomeSqlAlchemyFilterModel(SqlAlchemyFilterBaseModel):
+        created_at__in: str = None
+        number__in: str = None
+        name: str = None
+
+        class ConverterConfig:
+            model = Item
+            extra = {
+                BaseModelConverterExtraParams.LIST_AS_STRING: {
+                    "fields": ["created_at__in", "number__in"],
+                    "expected_types": {
+                        "created_at__in": dt.date,
+                        "number__in": decimal.Decimal,
+                    },
+                }
+            }
+
+    parsers = SomeSqlAlchemyFilterModel._get_list_as_string_parsers()
+
+    filter_model = SomeSqlAlchemyFilterModel(
+        created_at__in="2024-01-01, 2024-01-02",
+        number__in="1, 2.5",
+        name="1, 2",
+    )
+
+    assert filter_model._to_dict(exclude_none=True) == {
+        "created_at__in": [dt.date(2024, 1, 1), dt.date(2024, 1, 2)],
+        "number__in": [decimal.Decimal("1"), decimal.Decimal("2.5")],
+        "name": "1, 2",
+    }
+    assert SomeSqlAlchemyFilterModel._get_list_as_string_parsers() is parsers
@@ -0,0 +1,172 @@
+import typing as tp
+
+import pytest
+from sqlalchemy import insert, select, text
+
+from dataclass_sqlalchemy_mixins.base.explain import get_query_plan
+from dataclass_sqlalchemy_mixins.base.mixins import ToManyStrategy
+from dataclass_sqlalchemy_mixins.base.plan_assertions import (
+    assert_query_plan,
+    build_query,
+    count_joins,
+)
+from dataclass_sqlalchemy_mixins.pydantic_mixins.sqlalchemy_base_models import (
+    SqlAlchemyFilterBaseModel,
+    SqlAlchemyOrderBaseModel,
+    SqlAlchemyQueryBaseModel,
+)
+from tests import models
+from tests.sqlite_models import Group, Item
+
+
+class ItemFilterModel(SqlAlchemyFilterBaseModel):
+    number__gte: tp.Optional[int] = None
+    name: tp.Optional[str] = None
+    group__name: tp.Optional[str] = None
+
+    class ConverterConfig:
+        model = Item
+
+
+class ItemOrderModel(SqlAlchemyOrderBaseModel):
+    order_by: tp.Optional[tp.Union[str, tp.List[str]]] = None
+
+    class ConverterConfig:
+        model = Item
+
+
+class ItemQueryModel(SqlAlchemyQueryBaseModel):
+    group__name: tp.Optional[str] = None
+
+    class ConverterConfig:
+        model = Item
+
+
+@pytest.fixture
+def sqlite_session(sqlite_session):
+    sqlite_session.execute(
+        insert(Group), [{"id": i, "name": f"group_{i}"} for i in range(100)]
+    )
+    sqlite_session.execute(
+        insert(Item),
+        [
+            {"id": i, "name": f"item_{i}", "number": i, "group_id": i % 100}
+            for i in range(1000)
+        ],
+    )
+    # Indexes are not declared by the models,
+    # so the index advisor tests find them missing
+    for ddl in (
+        'CREATE INDEX ix_group_name ON "group" (name)',
+        "CREATE INDEX ix_item_number ON item (number)",
+        "CREATE INDEX ix_item_group_id ON item (group_id)",
+    ):
+        sqlite_session.execute(text(ddl))
+    sqlite_session.commit()
+    return sqlite_session
+
+
+def test_build_query__ok():
+    query = build_query(
+        ItemFilterModel(number__gte=10),
+        ItemOrderModel(order_by="-number"),
+    )
+
+    assert str(query) == str(
+        select(Item).where(Item.number >= 10).order_by(Item.number.desc())
+    )
+
+
+def test_assert_query_plan__sqlite__ok(sqlite_session):
+    query_plan = assert_query_plan(
+        sqlite_session,
+        ItemFilterModel(number__gte=990),
+        uses_indexes=["ix_item_number"],
+        no_full_scans=[Item],
+        max_joins=0,
+    )
+
+    assert query_plan.full_scans == frozenset()
+
+
+def test_assert_query_plan__sqlite__join__ok(sqlite_session):
+    assert_query_plan(
+        sqlite_session,
+        ItemFilterModel(group__name="group_1"),
+        uses_indexes=["ix_group_name", "ix_item_group_id"],
+        no_full_scans=[Item, "group"],
+        max_joins=1,
+    )
+
+
+def test_assert_query_plan__sqlite__order_by__ok(sqlite_session):
+    assert_query_plan(
+        sqlite_session,
+        ItemOrderModel(order_by="-number"),
+        query=select(Item).limit(10),
+        uses_indexes=["ix_item_number"],
+        max_joins=0,
+    )
+
+
+def test_assert_query_plan__sqlite__query_model__ok(sqlite_session):
+    assert_query_plan(
+        sqlite_session,
+        ItemQueryModel(group__name="group_1", order_by="id", limit=10),
+        uses_indexes=["ix_group_name", "ix_item_group_id"],
+        max_joins=1,
+    )
+
+
+@pytest.mark.parametrize(
+    ("kwargs", "expected_error"),
+    [
+        ({"uses_indexes": ["ix_item_number"]}, "Index ix_item_number is not used"),
+        ({"no_full_scans": [Item]}, "Table item is fully scanned"),
+        ({"max_joins": 0}, "Query has 1 joins, expected at most 0"),
+    ],
+)
+def test_assert_query_plan__sqlite__fail(sqlite_session, kwargs, expected_error):
+    query = select(Item).join(Item.group)
+
+    with pytest.raises(AssertionError) as exc_info:
+        assert_query_plan(
+            sqlite_session,
+            ItemFilterModel(name="item_1"),
+            query=query,
+            **kwargs,
+        )
+
+    assert str(exc_info.value).startswith(expected_error + "\nQuery plan:\n")
+
+
+def test_get_query_plan__postgresql__ok(db_session):
+    query_plan = get_query_plan(
+        db_session,
+        select(models.Item).where(models.Item.id == 1),
+    )
+
+    assert query_plan.used_indexes == frozenset({"item_pkey"})
+    assert query_plan.full_scans == frozenset()
+
+
+@pytest.mark.parametrize(
+    ("to_many_strategy", "expected_joins"),
+    [
+        (ToManyStrategy.JOIN, 1),
+        (ToManyStrategy.EXISTS, 0),
+    ],
+)
+def test_count_joins__to_many_strategy__ok(to_many_strategy, expected_joins):
+    class GroupFilterModel(SqlAlchemyFilterBaseModel):
+        items__name: tp.Optional[str] = None
+
+        class ConverterConfig:
+            model = models.Group
+
+    query = GroupFilterModel(items__name="item").apply_filters(
+        query=select(models.Group),
+        to_many_strategy=to_many_strategy,
+    )
+
+    assert count_joins(query) == expected_joins
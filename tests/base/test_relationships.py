@@ -0,0 +1,111 @@
+import pytest
+import sqlalchemy as sa
+from sqlalchemy.orm import configure_mappers, declarative_base, relationship
+from sqlalchemy.orm.interfaces import MANYTOONE, ONETOMANY
+
+from dataclass_sqlalchemy_mixins.base import relationships
+from dataclass_sqlalchemy_mixins.base.mixins import SqlAlchemyFilterConverterMixin
+from tests import models
+
+
+def test_get_relationships__ok():
+    group_relationships = relationships.get_relationships(models.Group)
+
+    assert set(group_relationships.keys()) == {"owner", "items"}
+
+    owner_relationship = group_relationships["owner"]
+    assert owner_relationship.target is models.Owner
+    assert owner_relationship.direction is MANYTOONE
+    assert owner_relationship.uselist is False
+
+    items_relationship = group_relationships["items"]
+    assert items_relationship.target is models.Item
+    assert items_relationship.direction is ONETOMANY
+    assert items_relationship.uselist is True
+
+    assert relationships.get_relationships(models.Owner) == {}
+    assert relationships.get_relationship(models.Item, "name") is None
+
+
+def test_get_foreign_key_path__no_inspect_calls__ok(monkeypatch):
+    # Warming up the index
+    relationships.get_relationships(models.Item)
+    relationships.get_relationships(models.Group)
+
+    def inspect(*args, **kwargs):
+        raise AssertionError("inspect should not be called")
+
+    monkeypatch.setattr(relationships, "inspect", inspect)
+
+    class Converter(SqlAlchemyFilterConverterMixin):
+        class ConverterConfig:
+            model = models.Item
+
+    related_models, db_field = Converter().get_foreign_key_path(
+        models_path_to_look=["group", "owner", "email"],
+    )
+
+    assert related_models == [models.Group, models.Owner]
+    assert db_field is models.Owner.email
+
+
+def test_get_foreign_key_path__relationship_named_as_mapping_method__ok():
+    class Converter(SqlAlchemyFilterConverterMixin):
+        class ConverterConfig:
+            model = models.Group
+
+    related_models, db_field = Converter().get_foreign_key_path(
+        models_path_to_look=["items", "name"],
+    )
+
+    assert related_models == [models.Item]
+    assert db_field is models.Item.name
+
+
+def test_relationships_index__mapper_configured__ok():
+    Base = declarative_base()
+
+    class Parent(Base):
+        __tablename__ = "parent"
+
+        id = sa.Column(sa.Integer, primary_key=True)
+
+    class Child(Base):
+        __tablename__ = "child"
+
+        id = sa.Column(sa.Integer, primary_key=True)
+        parent_id = sa.Column(sa.Integer, sa.ForeignKey(Parent.id))
+
+        parent = relationship(Parent, backref="children")
+
+    configure_mappers()
+
+    # The index is filled by the event without inspecting models lazily
+    assert Parent in relationships._relationships_index
+    assert Child in relationships._relationships_index
+
+    assert relationships.get_relationship(Parent, "children").target is Child
+    assert relationships.get_relationship(Child, "parent").target is Parent
+
+
+@pytest.mark.parametrize(
+    "path",
+    [
+        ["group", "owner", "email"],
+        ["group", "name"],
+        ["name"],
+    ],
+)
+def test_relationships_index__cleared__ok(path):
+    relationships.clear_relationships_index()
+
+    class Converter(SqlAlchemyFilterConverterMixin):
+        class ConverterConfig:
+            model = models.Item
+
+    related_models, db_field = Converter().get_foreign_key_path(
+        models_path_to_look=path,
+    )
+
+    assert db_field is not None
+    assert len(related_models) == len(path) - 1
@@ -0,0 +1,331 @@
+import asyncio
+import datetime
+import decimal
+
+import pytest
+from sqlalchemy import insert, select
+from sqlalchemy.orm import Session
+
+from dataclass_sqlalchemy_mixins.base.result_cache import (
+    MemoryResultCacheBackend,
+    ResultCache,
+    ResultCacheBackend,
+    ResultCacheEntry,
+    ResultCacheKey,
+    SQLiteResultCacheBackend,
+    get_result_cache_key,
+)
+from dataclass_sqlalchemy_mixins.base.tracing import Phase, tracing
+from tests.sqlite_models import Base, Group, Item
+
+
+@pytest.fixture
+def sqlite_session(sqlite_session):
+    sqlite_session.execute(insert(Group), [{"id": 1, "name": "first"}])
+    sqlite_session.execute(
+        insert(Item),
+        [{"id": i, "name": f"item_{i}", "number": i, "group_id": 1} for i in range(10)],
+    )
+    sqlite_session.commit()
+    return sqlite_session
+
+
+def fetch_numbers(cache, session, **kwargs):
+    return cache.fetch_all(
+        session=session,
+        query=select(Item.number),
+        model=Item,
+        **kwargs,
+    )
+
+
+@pytest.mark.parametrize(
+    ("first_spec", "second_spec"),
+    [
+        (
+            {"filters": {"name": "item_1", "number__gte": 1}},
+            {"filters": {"number__gte": 1, "name__eq": "item_1"}},
+        ),
+        (
+            {"filters": {"id__in": [3, 1, 2]}},
+            {"filters": {"id__in": {1, 2, 3}}},
+        ),
+        ({"order_by": "-number"}, {"order_by": ["-number"]}),
+    ],
+)
+def test_get_result_cache_key__same__ok(first_spec, second_spec):
+    assert get_result_cache_key(Item, **first_spec) == get_result_cache_key(
+        Item, **second_spec
+    )
+
+
+@pytest.mark.parametrize(
+    ("first_spec", "second_spec"),
+    [
+        ({"filters": {"number": 1}}, {"filters": {"number": "1"}}),
+        (
+            {"filters": {"number": decimal.Decimal("1")}},
+            {"filters": {"number": "1"}},
+        ),
+        (
+            {"filters": {"name": datetime.date(2024, 1, 1)}},
+            {"filters": {"name": "2024-01-01"}},
+        ),
+        ({"order_by": ["number", "id"]}, {"order_by": ["id", "number"]}),
+        ({"limit": 10}, {"limit": 10, "offset": 10}),
+    ],
+)
+def test_get_result_cache_key__different__ok(first_spec, second_spec):
+    assert get_result_cache_key(Item, **first_spec) != get_result_cache_key(
+        Item, **second_spec
+    )
+
+
+def test_result_cache__fetch_all__ok(sqlite_session):
+    cache = ResultCache()
+    events = []
+
+    with tracing(events.append):
+        first_results = fetch_numbers(
+            cache,
+            sqlite_session,
+            filters={"number__gte": 5, "group__name": "first"},
+            order_by="-number",
+            limit=3,
+        )
+        second_results = fetch_numbers(
+            cache,
+            sqlite_session,
+            filters={"group__name": "first", "number__gte": 5},
+            order_by="-number",
+            limit=3,
+        )
+
+    assert first_results == second_results == [9, 8, 7]
+    assert [event.phase for event in events].count(Phase.EXECUTE) == 1
+
+    cache_info = cache.info()
+    assert cache_info.hits == 1
+    assert cache_info.misses == 1
+    assert cache_info.currsize == 1
+
+
+def test_result_cache__different_queries__ok(sqlite_session):
+    cache = ResultCache()
+
+    numbers = fetch_numbers(cache, sqlite_session, filters={"number__lt": 2})
+    items = cache.fetch_all(
+        session=sqlite_session,
+        query=select(Item).where(Item.id > 0),
+        filters={"number__lt": 2},
+        model=Item,
+    )
+
+    assert numbers == [0, 1]
+    assert [item.id for item in items] == [1]
+    assert cache.info().misses == 2
+
+
+def test_result_cache__ttl__ok(sqlite_session):
+    cache = ResultCache(ttl=0)
+
+    fetch_numbers(cache, sqlite_session, filters={"number": 1})
+    fetch_numbers(cache, sqlite_session, filters={"number": 1})
+
+    cache_info = cache.info()
+    assert cache_info.hits == 0
+    assert cache_info.misses == 2
+    assert cache_info.expirations == 1
+
+
+def test_result_cache__eviction__ok(sqlite_session):
+    cache = ResultCache(backend=MemoryResultCacheBackend(maxsize=2))
+
+    for number in range(3):
+        fetch_numbers(cache, sqlite_session, filters={"number": number})
+
+    cache_info = cache.info()
+    assert cache_info.evictions == 1
+    assert cache_info.currsize == 2
+
+
+def test_result_cache__invalidate__ok(sqlite_session):
+    cache = ResultCache()
+
+    fetch_numbers(cache, sqlite_session, filters={"number": 1})
+    cache.set(get_result_cache_key(Group), ["group"])
+
+    cache.invalidate(Item)
+
+    cache_info = cache.info()
+    assert cache_info.invalidations == 1
+    assert cache_info.currsize == 1
+    assert cache.get(get_result_cache_key(Group)) == ["group"]
+
+
+def test_result_cache__invalidate_on_commit__ok(sqlite_session):
+    cache = ResultCache()
+    cache.invalidate_on_commit(sqlite_session)
+
+    assert fetch_numbers(cache, sqlite_session, filters={"number__gte": 9}) == [9]
+
+    sqlite_session.add(Item(id=10, name="item_10", number=10, group_id=1))
+    sqlite_session.flush()
+    assert cache.info().currsize == 1
+
+    sqlite_session.commit()
+    assert cache.info().currsize == 0
+    assert fetch_numbers(cache, sqlite_session, filters={"number__gte": 9}) == [9, 10]
+
+
+def test_result_cache__other_session_after_commit__ok(sqlite_session):
+    cache = ResultCache()
+    engine = sqlite_session.get_bind()
+
+    with Session(engine) as session:
+        items = cache.fetch_all(
+            session=session,
+            query=select(Item),
+            filters={"number__lt": 2},
+            model=Item,
+        )
+        # Instances of the session are expired by a commit
+        session.commit()
+
+    with Session(engine) as session:
+        cached_items = cache.fetch_all(
+            session=session,
+            query=select(Item),
+            filters={"number__lt": 2},
+            model=Item,
+        )
+
+        assert cache.info().hits == 1
+        assert [item.name for item in cached_items] == ["item_0", "item_1"]
+        assert all(item in session for item in cached_items)
+        assert cached_items[0] is not items[0]
+
+
+@pytest.mark.parametrize("order_by", [None, "group__name"])
+def test_result_cache__invalidate_on_commit__related_model__ok(
+    sqlite_session, tmp_path, order_by
+):
+    filters = {"group__name": "first"} if order_by is None else {}
+
+    for backend in (
+        MemoryResultCacheBackend(),
+        SQLiteResultCacheBackend(str(tmp_path / f"cache_{order_by}")),
+    ):
+        cache = ResultCache(backend=backend)
+        cache.invalidate_on_commit(sqlite_session)
+
+        assert fetch_numbers(cache, sqlite_session, filters=filters, order_by=order_by)
+
+        group = sqlite_session.get(Group, 1)
+        group.name = "second"
+        sqlite_session.commit()
+
+        assert cache.info().invalidations == 1
+        assert cache.info().currsize == 0
+
+        group.name = "first"
+        sqlite_session.commit()
+
+
+def test_result_cache_backend__abstract__error():
+    class Backend(ResultCacheBackend):
+        def get(self, key):
+            return None
+
+    with pytest.raises(TypeError):
+        Backend()
+
+
+def test_sqlite_result_cache_backend__shared__ok(tmp_path):
+    path = str(tmp_path / "cache.sqlite")
+    key = ResultCacheKey(model="Item", digest="digest")
+
+    first_backend = SQLiteResultCacheBackend(path)
+    second_backend = SQLiteResultCacheBackend(path)
+
+    first_backend.set(key, ResultCacheEntry(value=[1, 2], expires_at=None))
+
+    assert second_backend.get(key) == ResultCacheEntry(value=[1, 2], expires_at=None)
+    assert second_backend.invalidate("Item") == 1
+    assert first_backend.get(key) is None
+
+    first_backend.close()
+    second_backend.close()
+
+
+def test_sqlite_result_cache_backend__eviction__ok(tmp_path):
+    backend = SQLiteResultCacheBackend(str(tmp_path / "cache.sqlite"), maxsize=2)
+    keys = [ResultCacheKey(model="Item", digest=str(number)) for number in range(3)]
+
+    backend.set(keys[0], ResultCacheEntry(value=0))
+    backend.set(keys[1], ResultCacheEntry(value=1))
+    # The first entry becomes the most recently used one
+    backend.get(keys[0])
+    backend.set(keys[2], ResultCacheEntry(value=2))
+
+    assert backend.get(keys[1]) is None
+    assert backend.get(keys[0]).value == 0
+
+    backend_info = backend.info()
+    assert backend_info.evictions == 1
+    assert backend_info.currsize == 2
+    backend.close()
+
+
+def test_result_cache__sqlite_backend__ok(sqlite_session, tmp_path):
+    cache = ResultCache(backend=SQLiteResultCacheBackend(str(tmp_path / "cache")))
+
+    fetch_numbers(cache, sqlite_session, filters={"id__in": [2, 1]})
+    items = cache.fetch_all(
+        session=sqlite_session,
+        query=select(Item),
+        filters={"id__in": [1, 2]},
+        model=Item,
+    )
+    cached_items = cache.fetch_all(
+        session=sqlite_session,
+        query=select(Item),
+        filters={"id__in": [2, 1]},
+        model=Item,
+    )
+
+    assert [item.name for item in cached_items] == [item.name for item in items]
+    assert cache.info().hits == 1
+    cache.backend.close()
+
+
+def test_result_cache__async_fetch_all__ok():
+    pytest.importorskip("aiosqlite")
+
+    from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+    async def fetch():
+        engine = create_async_engine("sqlite+aiosqlite://")
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+            await conn.execute(insert(Item), [{"id": 1, "name": "item", "number": 1}])
+
+        cache = ResultCache()
+        async with AsyncSession(engine) as session:
+            results = [
+                await cache.async_fetch_all(
+                    session=session,
+                    query=select(Item.name),
+                    filters={"number": 1},
+                    model=Item,
+                )
+                for _ in range(2)
+            ]
+
+        await engine.dispose()
+        return results, cache.info()
+
+    results, cache_info = asyncio.run(fetch())
+
+    assert results == [["item"], ["item"]]
+    assert cache_info.hits == 1
@@ -0,0 +1,200 @@
+import threading
+
+import pytest
+from sqlalchemy import select
+
+from dataclass_sqlalchemy_mixins.base import utils
+from dataclass_sqlalchemy_mixins.base.tracing import (
+    Phase,
+    TraceCollector,
+    TraceEvent,
+    add_tracer,
+    get_tracers,
+    remove_tracer,
+    tracing,
+)
+from dataclass_sqlalchemy_mixins.pydantic_mixins.sqlalchemy_base_models import (
+    SqlAlchemyFilterBaseModel,
+)
+from tests import models, models_factory
+
+
+@pytest.fixture
+def events():
+    events = []
+    with tracing(events.append):
+        yield events
+
+
+def test_tracing__disabled__ok():
+    assert get_tracers() == ()
+
+    with tracing(print):
+        assert get_tracers() == (print,)
+
+    assert get_tracers() == ()
+
+
+def test_tracing__filters__ok(events):
+    utils.apply_filters(
+        query=select(models.Item),
+        filters={"name": "item", "group__name": "group"},
+        model=models.Item,
+    )
+
+    shape = ("group__name", "name")
+
+    assert [
+        (event.phase, event.model, event.key, event.shape)
+        for event in events
+        if event.phase != Phase.JOIN
+    ] == [
+        (Phase.RESOLVE, models.Item, "name", shape),
+        (Phase.BUILD, models.Item, "name", shape),
+        (Phase.RESOLVE, models.Item, "group__name", shape),
+        (Phase.BUILD, models.Item, "group__name", shape),
+    ]
+    assert all(event.duration >= 0 for event in events)
+
+    join_events = [event for event in events if event.phase == Phase.JOIN]
+    assert join_events[-1].model is models.Item
+    assert join_events[-1].metadata == {
+        "models": ["Group"],
+        "joined_models": ["Group"],
+    }
+
+
+def test_tracing__order_by__ok(events):
+    utils.apply_order_by(
+        query=select(models.Item),
+        order_by=["-number", "group__name"],
+        model=models.Item,
+    )
+
+    assert [
+        (event.phase, event.key, event.shape)
+        for event in events
+        if event.phase != Phase.JOIN
+    ] == [
+        (Phase.RESOLVE, "-number", ("-number", "group__name")),
+        (Phase.BUILD, "-number", ("-number", "group__name")),
+        (Phase.RESOLVE, "group__name", ("-number", "group__name")),
+        (Phase.BUILD, "group__name", ("-number", "group__name")),
+    ]
+
+
+def test_tracing__parse__ok(events):
+    class ItemFilterModel(SqlAlchemyFilterBaseModel):
+        name: str = None
+        number__gte: int = None
+
+        class ConverterConfig:
+            model = models.Item
+
+    ItemFilterModel(number__gte=1)._to_dict(exclude_none=True)
+
+    assert [(event.phase, event.model, event.shape) for event in events] == [
+        (Phase.PARSE, models.Item, ("number__gte",)),
+    ]
+
+
+def test_tracing__execute__ok(db_session, events):
+    models_factory.ItemFactory.create(number=1)
+
+    count = utils.get_count(
+        session=db_session,
+        filters={"number": 1},
+        model=models.Item,
+    )
+
+    assert count.count == 1
+    assert [
+        (event.phase, event.model) for event in events if event.phase == Phase.EXECUTE
+    ] == [(Phase.EXECUTE, models.Item)]
+
+
+def test_tracing__stream__ok(db_session, events):
+    item = models_factory.ItemFactory.create(number=1)
+
+    results = utils.stream(
+        session=db_session,
+        query=select(models.Item),
+        filters={"number": 1},
+        model=models.Item,
+    )
+
+    assert [result.id for result in results] == [item.id]
+    assert [
+        (event.phase, event.model) for event in events if event.phase == Phase.EXECUTE
+    ] == [(Phase.EXECUTE, models.Item)]
+
+
+def test_tracing__other_thread__not_traced__ok(events):
+    thread = threading.Thread(
+        target=utils.get_binary_expressions,
+        kwargs={"filters": {"name": "item"}, "model": models.Item},
+    )
+    thread.start()
+    thread.join()
+
+    assert events == []
+
+
+def test_tracing__add_tracer__ok():
+    events = []
+    add_tracer(events.append)
+
+    try:
+        thread = threading.Thread(
+            target=utils.get_binary_expressions,
+            kwargs={"filters": {"name": "item"}, "model": models.Item},
+        )
+        thread.start()
+        thread.join()
+    finally:
+        remove_tracer(events.append)
+
+    assert [event.phase for event in events] == [Phase.RESOLVE, Phase.BUILD]
+    assert get_tracers() == ()
+
+
+def test_trace_collector__percentiles__ok():
+    collector = TraceCollector()
+
+    for duration in range(1, 101):
+        collector(
+            TraceEvent(
+                phase=Phase.BUILD,
+                duration=duration,
+                model=models.Item,
+                key="name",
+                shape=("name", "number"),
+            )
+        )
+    collector(TraceEvent(phase=Phase.JOIN, duration=5, model=models.Item))
+
+    stats = collector.get_stats()
+
+    assert stats[("Item", Phase.BUILD, "name")] == (100, 5050, 50, 95, 99)
+    assert stats[("Item", Phase.JOIN, None)] == (1, 5, 5, 5, 5)
+
+    assert collector.get_stats(by=TraceCollector.BY_SHAPE) == {
+        ("Item", Phase.BUILD, ("name", "number")): (100, 5050, 50, 95, 99),
+    }
+
+    collector.clear()
+    assert collector.get_stats() == {}
+
+
+def test_trace_collector__max_samples__ok():
+    collector = TraceCollector(max_samples=10)
+
+    for duration in range(100):
+        collector(TraceEvent(phase=Phase.EXECUTE, duration=duration))
+
+    stats = collector.get_stats()[(None, Phase.EXECUTE, None)]
+
+    # Count and total include all samples, percentiles only the latest ones
+    assert stats.count == 100
+    assert stats.total == sum(range(100))
+    assert stats.p50 == 94
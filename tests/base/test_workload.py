@@ -0,0 +1,101 @@
+import threading
+
+from sqlalchemy import select
+
+from dataclass_sqlalchemy_mixins.base import utils
+from dataclass_sqlalchemy_mixins.base.mixins import SQLALCHEMY_OP_MATCHER
+from dataclass_sqlalchemy_mixins.base.workload import (
+    FilterShape,
+    WorkloadKind,
+    WorkloadRecorder,
+    get_filters_shape,
+    get_recorders,
+    load_workload,
+    recording,
+)
+from tests import models
+
+
+def test_get_filters_shape__ok():
+    shape = get_filters_shape(
+        {
+            "name__in": ["first", "second"],
+            "group__name": "group",
+            "number__gte": 1,
+            "is_valid__isnull": False,
+        },
+        ops=SQLALCHEMY_OP_MATCHER,
+    )
+
+    assert shape == (
+        FilterShape(key="group__name", op="eq", size=None),
+        FilterShape(key="is_valid__isnull", op="isnull", size=None),
+        FilterShape(key="name__in", op="in", size=2),
+        FilterShape(key="number__gte", op="gte", size=None),
+    )
+
+
+def test_recording__ok():
+    records = []
+
+    with recording(records.append):
+        utils.apply_query_spec(
+            query=select(models.Item),
+            filters={"id__in": [1, 2, 3], "group__name": "group"},
+            order_by=["-number", "group__name"],
+            model=models.Item,
+        )
+
+    assert get_recorders() == ()
+    assert [(record.kind, record.model, record.shape) for record in records] == [
+        (
+            WorkloadKind.FILTERS,
+            "Item",
+            (
+                FilterShape(key="group__name", op="eq", size=None),
+                FilterShape(key="id__in", op="in", size=3),
+            ),
+        ),
+        (WorkloadKind.ORDER_BY, "Item", ("-number", "group__name")),
+    ]
+    assert all(record.duration >= 0 for record in records)
+
+
+def test_recording__other_thread__not_recorded__ok():
+    records = []
+
+    with recording(records.append):
+        thread = threading.Thread(
+            target=utils.get_binary_expressions,
+            kwargs={"filters": {"name": "item"}, "model": models.Item},
+        )
+        thread.start()
+        thread.join()
+
+    assert records == []
+
+
+def test_workload_recorder__load_workload__ok(tmp_path):
+    path = tmp_path / "workload.jsonl"
+
+    with WorkloadRecorder(path) as recorder:
+        assert get_recorders() == (recorder,)
+
+        utils.get_binary_expressions(
+            filters={"name__in": ["first", "second"]},
+            model=models.Item,
+        )
+        utils.get_unary_expressions(order_by="-id", model=models.Group)
+
+    assert get_recorders() == ()
+
+    records = list(load_workload(path))
+
+    assert [(record.kind, record.model, record.shape) for record in records] == [
+        (
+            WorkloadKind.FILTERS,
+            "Item",
+            (FilterShape(key="name__in", op="in", size=2),),
+        ),
+        (WorkloadKind.ORDER_BY, "Group", ("-id",)),
+    ]
@@ -3,9 +3,10 @@ from contextlib import contextmanager
 
 import pytest
 from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.orm import Session, sessionmaker
 from sqlalchemy_utils import create_database, database_exists, drop_database
 
+from tests import sqlite_models
 from tests.models import BaseModel
 
 
@@ -57,6 +58,19 @@ def db_session(create_tables, session_testing):
     session.close()
 
 
+@pytest.fixture(scope="function")
+def sqlite_session():
+    # Tables of tests.sqlite_models are empty,
+    # test modules insert their rows by overriding the fixture
+    engine = create_engine("sqlite://")
+    sqlite_models.Base.metadata.create_all(engine)
+
+    with Session(engine, expire_on_commit=False) as session:
+        yield session
+
+    engine.dispose()
+
+
 def get_test_session():
     test_engine = create_engine(TEST_DB_URL)
     test_session = sessionmaker(
@@ -0,0 +1,180 @@
+import dataclasses
+import sys
+import typing as tp
+
+import pytest
+from sqlalchemy import select
+
+from dataclass_sqlalchemy_mixins.base.parsers import LIST_AS_STRING
+from dataclass_sqlalchemy_mixins.dataclass_mixins.sqlalchemy_base_dataclasses import (
+    SqlAlchemyFilterBaseDataclass,
+    SqlAlchemyOrderBaseDataclass,
+    SqlAlchemyQueryBaseDataclass,
+)
+from tests import models, models_factory
+
+
+@pytest.fixture(
+    params=[
+        pytest.param({}, id="default"),
+        pytest.param({"frozen": True}, id="frozen"),
+        pytest.param(
+            {"slots": True},
+            id="slots",
+            marks=pytest.mark.skipif(
+                sys.version_info < (3, 10),
+                reason="slots param requires python 3.10",
+            ),
+        ),
+    ]
+)
+def dataclass_params(request):
+    return request.param
+
+
+@pytest.fixture
+def item_filter_class(dataclass_params):
+    @dataclasses.dataclass(**dataclass_params)
+    class ItemFilter(SqlAlchemyFilterBaseDataclass):
+        name: tp.Optional[str] = None
+        number__in: tp.Optional[tp.Union[str, tp.List[int]]] = None
+        group__name: tp.Optional[str] = None
+
+        class ConverterConfig:
+            model = models.Item
+            extra = {
+                LIST_AS_STRING: {
+                    "fields": ["number__in"],
+                    "expected_types": {"number__in": int},
+                }
+            }
+
+    return ItemFilter
+
+
+@pytest.fixture
+def item_order_class(dataclass_params):
+    @dataclasses.dataclass(**dataclass_params)
+    class ItemOrder(SqlAlchemyOrderBaseDataclass):
+        order_by: tp.Optional[tp.Union[str, tp.List[str]]] = None
+
+        class ConverterConfig:
+            model = models.Item
+            extra = {LIST_AS_STRING: None}
+
+    return ItemOrder
+
+
+@pytest.fixture
+def item_query_class(dataclass_params):
+    @dataclasses.dataclass(**dataclass_params)
+    class ItemQuery(SqlAlchemyQueryBaseDataclass):
+        group__name: tp.Optional[str] = None
+        order_by: tp.Optional[tp.Union[str, tp.List[str]]] = None
+        limit: tp.Optional[int] = None
+        offset: tp.Optional[int] = None
+
+        class ConverterConfig:
+            model = models.Item
+
+    return ItemQuery
+
+
+def test_filter_dataclass__to_dict__ok(item_filter_class):
+    assert item_filter_class(name="item", number__in="1, 2")._to_dict() == {
+        "name": "item",
+        "number__in": [1, 2],
+    }
+    # Values are not validated or converted
+    assert item_filter_class(number__in=[3, 4])._to_dict() == {"number__in": [3, 4]}
+    assert item_filter_class()._to_dict(exclude_none=False) == {
+        "name": None,
+        "number__in": None,
+        "group__name": None,
+    }
+
+
+def test_filter_dataclass__apply_filters__ok(db_session, item_filter_class):
+    group = models_factory.GroupFactory.create(name="group_a")
+    expected_item = models_factory.ItemFactory.create(number=1, group=group)
+    models_factory.ItemFactory.create(number=2, group=group)
+    models_factory.ItemFactory.create(number=1)
+
+    filter_dataclass = item_filter_class(number__in="1, 3", group__name="group_a")
+
+    query = filter_dataclass.apply_filters(query=select(models.Item))
+    results = db_session.execute(query).scalars().all()
+
+    assert [result.id for result in results] == [expected_item.id]
+    assert len(filter_dataclass.to_binary_expressions()) == 2
+    assert filter_dataclass.get_count(session=db_session).count == 1
+
+
+def test_order_dataclass__apply_order_by__ok(db_session, item_order_class):
+    items = [
+        models_factory.ItemFactory.create(name=name, number=number)
+        for name, number in (("b", 1), ("a", 1), ("c", 2))
+    ]
+
+    order_dataclass = item_order_class(order_by="-number, name")
+
+    query = order_dataclass.apply_order_by(query=select(models.Item))
+    results = db_session.execute(query).scalars().all()
+
+    assert [result.id for result in results] == [items[2].id, items[1].id, items[0].id]
+    # A field value is kept as it was passed
+    assert order_dataclass.order_by == "-number, name"
+    assert len(order_dataclass.to_unary_expressions()) == 2
+
+
+def test_query_dataclass__apply_query_spec__ok(db_session, item_query_class):
+    group = models_factory.GroupFactory.create(name="group_a")
+    items = [
+        models_factory.ItemFactory.create(number=number, group=group)
+        for number in (3, 1, 2)
+    ]
+    models_factory.ItemFactory.create(number=0)
+
+    query_dataclass = item_query_class(
+        group__name="group_a",
+        order_by="number",
+        limit=2,
+        offset=1,
+    )
+
+    assert query_dataclass._to_dict() == {"group__name": "group_a"}
+
+    query = query_dataclass.apply_query_spec(query=select(models.Item))
+    results = db_session.execute(query).scalars().all()
+
+    assert [result.id for result in results] == [items[2].id, items[0].id]
+
+
+@pytest.mark.skipif(
+    sys.version_info < (3, 10),
+    reason="slots param requires python 3.10",
+)
+def test_filter_dataclass__slots__ok():
+    @dataclasses.dataclass(slots=True)
+    class ItemFilter(SqlAlchemyFilterBaseDataclass):
+        name: tp.Optional[str] = None
+
+        class ConverterConfig:
+            model = models.Item
+
+    filter_dataclass = ItemFilter(name="item")
+
+    assert ItemFilter.__slots__ == ("name",)
+    assert not hasattr(filter_dataclass, "__dict__")
+    assert filter_dataclass._to_dict() == {"name": "item"}
+
+
+def test_filter_dataclass__model_is_none__error():
+    @dataclasses.dataclass
+    class ItemFilter(SqlAlchemyFilterBaseDataclass):
+        name: tp.Optional[str] = None
+
+    with pytest.raises(ValueError) as e:
+        ItemFilter(name="item")
+
+    assert str(e.value) == "ConverterConfig param 'model' can't be None"
@@ -0,0 +1,105 @@
+import pytest
+import sqlalchemy as sa
+from sqlalchemy import select
+from sqlalchemy.orm import declarative_base, relationship
+
+from dataclass_sqlalchemy_mixins.base import utils
+from dataclass_sqlalchemy_mixins.base.mixins import SqlAlchemyFilterConverterMixin
+from dataclass_sqlalchemy_mixins.base.relationships import get_relationship
+from tests import models, models_factory
+
+
+@pytest.mark.parametrize(
+    ("filters", "expected_where", "expected_joins"),
+    [
+        ({"group__id": 1}, "item.group_id = :group_id_1", 0),
+        ({"group__id__in": [1, 2]}, "item.group_id IN (__[POSTCOMPILE_group_id_1])", 0),
+        ({"group__id__not": 1}, "item.group_id != :group_id_1", 0),
+        ({"group__owner__id__gte": 1}, '"group".owner_id >= :owner_id_1', 1),
+        ({"group__name": "name"}, '"group".name = :name_1', 1),
+        # Items without groups have NULL group_id
+        # so a join is kept to return only items with groups
+        ({"group__id__isnull": True}, '"group".id IS NULL', 1),
+        ({"group__id__isnull": False}, '"group".id IS NOT NULL', 1),
+        ({"group__id__is": None}, '"group".id IS NULL', 1),
+        ({"group__id__is_not": None}, '"group".id IS NOT NULL', 1),
+        ({"group__id": None}, '"group".id IS NULL', 1),
+        ({"group__id__not": None}, '"group".id IS NOT NULL', 1),
+    ],
+)
+def test_filter__foreign_key__join_eliminated(filters, expected_where, expected_joins):
+    query = utils.apply_filters(
+        query=select(models.Item),
+        filters=filters,
+        model=models.Item,
+    )
+
+    assert str(query.whereclause) == expected_where
+    assert str(query).count("JOIN") == expected_joins
+
+
+def test_filter__foreign_key__eliminate_joins_disabled():
+    class Converter(SqlAlchemyFilterConverterMixin):
+        ELIMINATE_FOREIGN_KEY_JOINS = False
+
+    models_binary_expressions = Converter().get_models_binary_expressions(
+        filters={"group__id": 1},
+        model=models.Item,
+    )
+
+    assert models_binary_expressions[0]["models"] == [models.Group]
+    assert str(models_binary_expressions[0]["binary_expression"]) == (
+        '"group".id = :id_1'
+    )
+
+
+def test_filter__foreign_key__ok(db_session):
+    groups = models_factory.GroupFactory.create_batch(with_item=True, size=3)
+    models_factory.ItemFactory.create()
+
+    for filters, expected_items_number in (
+        ({"group__id": groups[0].id}, 1),
+        ({"group__id__in": [groups[0].id, groups[1].id]}, 2),
+        ({"group__id__not": groups[0].id}, 2),
+        ({"group__id__isnull": False}, 3),
+        ({"group__id__isnull": True}, 0),
+        ({"group__id": None}, 0),
+        ({"group__owner__id": groups[2].owner_id}, 1),
+    ):
+        query = utils.apply_filters(
+            query=select(models.Item),
+            filters=filters,
+            model=models.Item,
+        )
+        results = db_session.execute(query).scalars().all()
+
+        assert len(results) == expected_items_number
+
+
+def test_relationship__local_columns__custom_primaryjoin():
+    Base = declarative_base()
+
+    class Parent(Base):
+        __tablename__ = "parent"
+
+        id = sa.Column(sa.Integer, primary_key=True)
+        is_active = sa.Column(sa.Boolean)
+
+    class Child(Base):
+        __tablename__ = "child"
+
+        id = sa.Column(sa.Integer, primary_key=True)
+        parent_id = sa.Column(sa.Integer, sa.ForeignKey(Parent.id))
+
+        parent = relationship(Parent)
+        active_parent = relationship(
+            Parent,
+            primaryjoin=sa.and_(parent_id == Parent.id, Parent.is_active.is_(True)),
+            viewonly=True,
+        )
+
+    assert get_relationship(Child, "parent").local_columns == {
+        "id": Child.parent_id,
+    }
+    assert get_relationship(Child, "active_parent").local_columns == {}
+    assert get_relationship(models.Group, "items").local_columns == {}
@@ -0,0 +1,299 @@
+import datetime as dt
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.dialects import postgresql
+
+from dataclass_sqlalchemy_mixins.base.converter import SqlAlchemyConverter
+from dataclass_sqlalchemy_mixins.base.in_lists import InOverflow, InStrategy
+from dataclass_sqlalchemy_mixins.base.mixins import SqlAlchemyFilterConverterMixin
+from tests import models, models_factory, sqlite_models
+
+
+def compile_postgresql(query):
+    return str(
+        query.compile(
+            dialect=postgresql.dialect(),
+            compile_kwargs={"render_postcompile": True},
+        )
+    )
+
+
+@pytest.mark.parametrize(
+    ("filters", "expected_where"),
+    [
+        ({"id__in": [1, 2, 3]}, "item.id = ANY (%(param_1)s::INTEGER[])"),
+        ({"id__not_in": [1, 2, 3]}, "item.id != ALL (%(param_1)s::INTEGER[])"),
+    ],
+)
+def test_filter__in__any_array__ok(filters, expected_where):
+    converter = SqlAlchemyConverter(
+        model=models.Item,
+        in_strategy=InStrategy.ANY_ARRAY,
+    )
+
+    query = converter.apply_filters(query=select(models.Item), filters=filters)
+
+    assert compile_postgresql(query.whereclause) == expected_where
+
+
+def test_filter__in__any_array__same_sql_for_any_length():
+    converter = SqlAlchemyConverter(
+        model=models.Item,
+        in_strategy=InStrategy.ANY_ARRAY,
+    )
+
+    statements = {
+        compile_postgresql(
+            converter.apply_filters(
+                query=select(models.Item),
+                filters={"id__in": list(range(values_number))},
+            )
+        )
+        for values_number in (1, 10, 1000)
+    }
+
+    assert len(statements) == 1
+
+
+def test_filter__in__in_max_size__error():
+    class Converter(SqlAlchemyFilterConverterMixin):
+        class ConverterConfig:
+            model = models.Item
+            in_max_size = 2
+
+    converter = Converter()
+
+    assert len(converter.get_binary_expressions(filters={"id__in": [1, 2]})) == 1
+
+    with pytest.raises(ValueError) as e:
+        converter.get_binary_expressions(filters={"id__in": [1, 2, 3]})
+    assert str(e.value) == "Number of values (3) is greater than in_max_size (2)"
+
+
+@pytest.mark.parametrize(
+    ("filters", "expected_where"),
+    [
+        (
+            {"id__in": [1, 2, 3]},
+            "item.id IN (__[POSTCOMPILE_id_1]) OR item.id IN (__[POSTCOMPILE_id_2])",
+        ),
+        (
+            {"id__not_in": (1, 2, 3)},
+            "(item.id NOT IN (__[POSTCOMPILE_id_1])) "
+            "AND (item.id NOT IN (__[POSTCOMPILE_id_2]))",
+        ),
+    ],
+)
+def test_filter__in__in_max_size__chunk(filters, expected_where):
+    converter = SqlAlchemyConverter(
+        model=models.Item,
+        in_max_size=2,
+        in_overflow=InOverflow.CHUNK,
+    )
+
+    binary_expression = converter.get_binary_expressions(filters=filters)[0]
+
+    assert str(binary_expression) == expected_where
+
+
+@pytest.mark.parametrize(
+    ("in_strategy", "in_max_size"),
+    [
+        (InStrategy.EXPANDING, None),
+        (InStrategy.EXPANDING, 2),
+        (InStrategy.ANY_ARRAY, None),
+        (InStrategy.ANY_ARRAY, 2),
+    ],
+)
+def test_filter__in__strategies__ok(db_session, in_strategy, in_max_size):
+    items = models_factory.ItemFactory.create_batch(size=5)
+    items_ids = [item.id for item in items]
+
+    converter = SqlAlchemyConverter(
+        model=models.Item,
+        in_strategy=in_strategy,
+        in_max_size=in_max_size,
+        in_overflow=InOverflow.CHUNK,
+    )
+
+    for filters, expected_ids in (
+        ({"id__in": items_ids[:3]}, items_ids[:3]),
+        ({"id__not_in": items_ids[:3]}, items_ids[3:]),
+    ):
+        query = converter.apply_filters(query=select(models.Item), filters=filters)
+        results = db_session.execute(query).scalars().all()
+
+        assert sorted(item.id for item in results) == sorted(expected_ids)
+
+
+@pytest.mark.parametrize(
+    ("filters", "expected_where"),
+    [
+        ({"id__in": [1, 2]}, "item.id IN (__[POSTCOMPILE_id_1])"),
+        (
+            {"id__in": [1, 2, 3]},
+            "item.id IN (SELECT value FROM json_each(:param_1))",
+        ),
+        (
+            {"id__not_in": [1, 2, 3]},
+            "item.id NOT IN (SELECT value FROM json_each(:param_1))",
+        ),
+    ],
+)
+def test_filter__in__values_threshold__ok(filters, expected_where):
+    converter = SqlAlchemyConverter(model=models.Item, in_values_threshold=2)
+
+    binary_expression = converter.get_binary_expressions(filters=filters)[0]
+
+    assert str(binary_expression) == expected_where
+
+
+def test_filter__in__values_threshold__in_max_size__error():
+    converter = SqlAlchemyConverter(
+        model=models.Item,
+        in_max_size=10,
+        in_values_threshold=5,
+    )
+
+    assert len(converter.get_binary_expressions(filters={"id__in": range(10)})) == 1
+
+    with pytest.raises(ValueError) as e:
+        converter.get_binary_expressions(filters={"id__in": list(range(500))})
+    assert str(e.value) == "Number of values (500) is greater than in_max_size (10)"
+
+
+def test_filter__in__values_threshold__in_max_size__chunk():
+    converter = SqlAlchemyConverter(
+        model=models.Item,
+        in_max_size=3,
+        in_overflow=InOverflow.CHUNK,
+        in_values_threshold=2,
+    )
+
+    binary_expression = converter.get_binary_expressions(
+        filters={"id__in": [1, 2, 3, 4]}
+    )[0]
+
+    assert str(binary_expression) == (
+        "item.id IN (SELECT value FROM json_each(:param_1)) "
+        "OR item.id IN (__[POSTCOMPILE_id_1])"
+    )
+
+
+def test_filter__in__values_threshold__greater_than_in_max_size__error():
+    with pytest.raises(ValueError) as e:
+        SqlAlchemyConverter(
+            model=models.Item,
+            in_max_size=10,
+            in_values_threshold=100,
+        )
+    assert str(e.value) == (
+        "ConverterConfig in_values_threshold (100) is greater than in_max_size (10)"
+    )
+
+
+def test_filter__in__values__postgresql():
+    converter = SqlAlchemyConverter(
+        model=models.Item,
+        in_strategy=InStrategy.VALUES,
+    )
+
+    query = converter.apply_filters(
+        query=select(models.Item),
+        filters={"id__in": [1, 2, 3]},
+    )
+
+    assert compile_postgresql(query.whereclause) == (
+        "item.id IN (SELECT unnest(CAST(%(param_1)s AS INTEGER[])))"
+    )
+
+
+@pytest.mark.parametrize(
+    ("in_strategy", "in_values_threshold"),
+    [
+        (InStrategy.VALUES, None),
+        (InStrategy.EXPANDING, 2),
+    ],
+)
+def test_filter__in__values__ok(db_session, in_strategy, in_values_threshold):
+    items = models_factory.ItemFactory.create_batch(size=5)
+    items_ids = [item.id for item in items]
+    items_names = [item.name for item in items]
+
+    converter = SqlAlchemyConverter(
+        model=models.Item,
+        in_strategy=in_strategy,
+        in_values_threshold=in_values_threshold,
+    )
+
+    for filters, expected_ids in (
+        ({"id__in": items_ids[:3]}, items_ids[:3]),
+        ({"id__not_in": items_ids[:3]}, items_ids[3:]),
+        ({"name__in": items_names[1:4]}, items_ids[1:4]),
+    ):
+        query = converter.apply_filters(query=select(models.Item.id), filters=filters)
+        results = db_session.execute(query).scalars().all()
+
+        assert sorted(results) == sorted(expected_ids)
+
+
+def test_filter__in__values__sqlite(sqlite_session):
+    converter = SqlAlchemyConverter(
+        model=sqlite_models.Item,
+        in_strategy=InStrategy.VALUES,
+    )
+    created_at = [dt.datetime(2024, 1, day, 12) for day in range(1, 6)]
+
+    sqlite_session.add_all(
+        [
+            sqlite_models.Item(id=i, created_at=value)
+            for i, value in enumerate(created_at)
+        ]
+    )
+    sqlite_session.commit()
+
+    for filters, expected_ids in (
+        ({"id__in": [0, 2, 10]}, [0, 2]),
+        ({"id__not_in": [0, 2]}, [1, 3, 4]),
+        # Values are converted the same way as column values
+        ({"created_at__in": created_at[3:]}, [3, 4]),
+    ):
+        query = converter.apply_filters(
+            query=select(sqlite_models.Item.id), filters=filters
+        )
+        results = sqlite_session.execute(query).scalars().all()
+
+        assert sorted(results) == expected_ids
+
+
+def test_filter__in__any_array__sqlite(sqlite_session):
+    converter = SqlAlchemyConverter(
+        model=sqlite_models.Item,
+        in_strategy=InStrategy.ANY_ARRAY,
+    )
+
+    assert (
+        str(
+            converter.apply_filters(
+                query=select(sqlite_models.Item), filters={"id__in": [1, 2]}
+            ).whereclause.compile(dialect=sqlite_session.get_bind().dialect)
+        )
+        == "item.id IN (__[POSTCOMPILE_param_1])"
+    )
+
+    sqlite_session.add_all([sqlite_models.Item(id=i) for i in range(5)])
+    sqlite_session.commit()
+
+    for filters, expected_ids in (
+        ({"id__in": [0, 2, 10]}, [0, 2]),
+        # Statement compiled for the previous filter is reused
+        ({"id__in": [1, 3]}, [1, 3]),
+        ({"id__not_in": [0, 2]}, [1, 3, 4]),
+    ):
+        query = converter.apply_filters(
+            query=select(sqlite_models.Item.id), filters=filters
+        )
+        results = sqlite_session.execute(query).scalars().all()
+
+        assert sorted(results) == expected_ids
@@ -0,0 +1,154 @@
+import pytest
+from sqlalchemy import select
+
+from dataclass_sqlalchemy_mixins.base import utils
+from dataclass_sqlalchemy_mixins.base.mixins import ToManyStrategy
+from dataclass_sqlalchemy_mixins.pydantic_mixins.sqlalchemy_base_models import (
+    SqlAlchemyFilterBaseModel,
+)
+from tests import models, models_factory
+
+
+def create_groups():
+    groups = []
+    for group_name, item_names in (
+        ("first_group", ["expected_item_1", "expected_item_2", "item"]),
+        ("second_group", ["expected_item_3"]),
+        ("third_group", ["item"]),
+    ):
+        group = models_factory.GroupFactory.create(name=group_name)
+        for item_name in item_names:
+            models_factory.ItemFactory.create(name=item_name, group=group)
+        groups.append(group)
+    return groups
+
+
+@pytest.mark.parametrize("query_type", ["select", "query"])
+@pytest.mark.parametrize(
+    ("to_many_strategy", "expected_groups_number"),
+    [
+        (None, 3),
+        (ToManyStrategy.JOIN, 3),
+        (ToManyStrategy.EXISTS, 2),
+        ("exists", 2),
+    ],
+)
+def test_filter__to_many__ok(
+    db_session,
+    query_type,
+    to_many_strategy,
+    expected_groups_number,
+):
+    groups = create_groups()
+
+    filters = {"items__name__like": "expected_%"}
+
+    if query_type == "select":
+        query = utils.apply_filters(
+            query=select(models.Group),
+            filters=filters,
+            model=models.Group,
+            to_many_strategy=to_many_strategy,
+        )
+        compiled_query = str(query)
+        results = db_session.execute(query).scalars().all()
+    else:
+        query = utils.apply_filters(
+            query=db_session.query(models.Group),
+            filters=filters,
+            model=models.Group,
+            to_many_strategy=to_many_strategy,
+        )
+        compiled_query = str(query.statement)
+
+        # Legacy query returns unique entities
+        # so rows are counted to check their number
+        assert query.count() == expected_groups_number
+        results = query.all()
+
+    # Joins multiply rows of the first group
+    if query_type == "select":
+        assert len(results) == expected_groups_number
+    assert {result.id for result in results} == {groups[0].id, groups[1].id}
+
+    if to_many_strategy in (ToManyStrategy.EXISTS, "exists"):
+        assert "EXISTS" in compiled_query
+        assert "JOIN" not in compiled_query
+    else:
+        assert "JOIN" in compiled_query
+
+
+def test_filter__to_many__nested__ok(db_session):
+    groups = create_groups()
+
+    query = utils.apply_filters(
+        query=select(models.Owner),
+        filters={
+            "id__in": [group.owner_id for group in groups],
+        },
+        model=models.Owner,
+    )
+    owners = db_session.execute(query).scalars().all()
+    assert len(owners) == 3
+
+    # Item -> group -> items is a to-many path starting from a to-one relationship
+    query = utils.apply_filters(
+        query=select(models.Item),
+        filters={
+            "group__items__name": "expected_item_1",
+            "group__name__in": ["first_group", "third_group"],
+        },
+        model=models.Item,
+        to_many_strategy=ToManyStrategy.EXISTS,
+    )
+    results = db_session.execute(query).scalars().all()
+
+    assert str(query).count("JOIN") == 1
+    assert {result.name for result in results} == {
+        "expected_item_1",
+        "expected_item_2",
+        "item",
+    }
+
+
+def test_filter__to_many__converter_config__ok(db_session):
+    groups = create_groups()
+
+    class GroupFilterModel(SqlAlchemyFilterBaseModel):
+        items__name__in: list = None
+        items__name__isnull: bool = None
+
+        class ConverterConfig:
+            model = models.Group
+            to_many_strategy = ToManyStrategy.EXISTS
+
+    filter_model = GroupFilterModel(
+        items__name__in=["expected_item_1", "expected_item_2"],
+        items__name__isnull=False,
+    )
+
+    query = filter_model.apply_filters(query=select(models.Group))
+    results = db_session.execute(query).scalars().all()
+
+    assert "JOIN" not in str(query)
+    assert [result.id for result in results] == [groups[0].id]
+
+    # Strategy passed to a call is used instead of a config one
+    query = filter_model.apply_filters(
+        query=select(models.Group),
+        to_many_strategy=ToManyStrategy.JOIN,
+    )
+    results = db_session.execute(query).scalars().all()
+
+    assert "JOIN" in str(query)
+    assert [result.id for result in results] == [groups[0].id, groups[0].id]
+
+
+def test_filter__to_many__to_one_path__joined():
+    binary_expressions = utils.get_binary_expressions(
+        filters={"group__owner__email": "email"},
+        model=models.Item,
+        to_many_strategy=ToManyStrategy.EXISTS,
+    )
+
+    assert str(binary_expressions[0]) == '"Owner".email = :email_1'
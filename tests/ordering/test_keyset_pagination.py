@@ -0,0 +1,240 @@
+import datetime as dt
+import decimal
+import uuid
+
+import pytest
+from sqlalchemy import select
+
+from dataclass_sqlalchemy_mixins.base import utils
+from dataclass_sqlalchemy_mixins.base.keyset import decode_cursor, encode_cursor
+from tests import models, models_factory
+
+
+def create_items():
+    items = []
+    for group_name, item_name, number in (
+        ("group_a", "item_b", 3),
+        ("group_b", "item_a", 1),
+        ("group_a", "item_a", 2),
+        ("group_b", "item_b", 3),
+        ("group_a", "item_b", 1),
+        ("group_b", "item_a", 2),
+        ("group_a", "item_a", 3),
+    ):
+        items.append(
+            models_factory.ItemFactory.create(
+                name=item_name,
+                number=number,
+                group=models_factory.GroupFactory.create(name=group_name),
+            )
+        )
+    return items
+
+
+def paginate(db_session, query_type, order_by, limit, apply, get_next_cursor):
+    pages = []
+    cursor = None
+
+    while True:
+        if query_type == "select":
+            query = apply(query=select(models.Item), cursor=cursor, limit=limit)
+            results = db_session.execute(query).scalars().all()
+        else:
+            query = apply(
+                query=db_session.query(models.Item), cursor=cursor, limit=limit
+            )
+            results = query.all()
+
+        if not results:
+            break
+
+        pages.append([result.id for result in results])
+        cursor = get_next_cursor(results[-1])
+    return pages
+
+
+@pytest.mark.parametrize("query_type", ["select", "query"])
+@pytest.mark.parametrize(
+    ("order_by", "sort_key"),
+    [
+        ("name", lambda item: (item.name, item.id)),
+        (["-name"], lambda item: (-ord(item.name[-1]), -item.id)),
+        (["name", "-number"], lambda item: (item.name, -item.number, -item.id)),
+        (
+            ["-group__name", "number"],
+            lambda item: (-ord(item.group.name[-1]), item.number, item.id),
+        ),
+    ],
+)
+def test_keyset_pagination__utils__ok(db_session, query_type, order_by, sort_key):
+    create_items()
+
+    items = db_session.query(models.Item).all()
+    expected_ids = [item.id for item in sorted(items, key=sort_key)]
+
+    def apply(query, cursor, limit):
+        return utils.apply_keyset_pagination(
+            query=query,
+            order_by=order_by,
+            cursor=cursor,
+            limit=limit,
+            model=models.Item,
+        )
+
+    def get_next_cursor(row):
+        return utils.get_next_cursor(row=row, order_by=order_by, model=models.Item)
+
+    pages = paginate(db_session, query_type, order_by, 3, apply, get_next_cursor)
+
+    assert [len(page) for page in pages] == [3, 3, 1]
+    assert sum(pages, []) == expected_ids
+
+
+def test_keyset_pagination__base_model__ok(
+    db_session,
+    get_sqlalchemy_order_base_model,
+):
+    create_items()
+
+    items = db_session.query(models.Item).all()
+    expected_ids = [
+        item.id for item in sorted(items, key=lambda item: (item.group.name, item.id))
+    ]
+
+    order_by_model = get_sqlalchemy_order_base_model(
+        base_model=models.Item,
+        model_kwargs={
+            "order_by": "group__name",
+        },
+    )
+
+    pages = paginate(
+        db_session,
+        "select",
+        None,
+        2,
+        order_by_model.apply_keyset_pagination,
+        order_by_model.get_next_cursor,
+    )
+
+    assert [len(page) for page in pages] == [2, 2, 2, 1]
+    assert sum(pages, []) == expected_ids
+
+
+def test_get_next_cursor__columns__ok(db_session):
+    create_items()
+
+    row = db_session.execute(
+        select(models.Item.id, models.Item.name).order_by(models.Item.id)
+    ).first()
+
+    cursor = utils.get_next_cursor(row=row, order_by="name", model=models.Item)
+
+    assert decode_cursor(cursor) == [row.name, row.id]
+
+
+def test_keyset_pagination__columns__ok(db_session):
+    create_items()
+
+    items = db_session.query(models.Item).all()
+    expected_ids = [
+        item.id
+        for item in sorted(
+            items, key=lambda item: (-ord(item.group.name[-1]), -item.id)
+        )
+    ]
+
+    query = select(
+        models.Item.id,
+        models.Group.name.label("group__name"),
+    ).join(models.Item.group)
+    order_by = "-group__name"
+
+    pages = []
+    cursor = None
+    while True:
+        rows = db_session.execute(
+            utils.apply_keyset_pagination(
+                query=query,
+                order_by=order_by,
+                cursor=cursor,
+                limit=3,
+                model=models.Item,
+            )
+        ).all()
+        if not rows:
+            break
+
+        pages.append([row.id for row in rows])
+        cursor = utils.get_next_cursor(
+            row=rows[-1], order_by=order_by, model=models.Item
+        )
+
+    assert [len(page) for page in pages] == [3, 3, 1]
+    assert sum(pages, []) == expected_ids
+
+
+def test_keyset_pagination__expressions__ok():
+    cursor = encode_cursor(["name", 1])
+
+    binary_expressions, unary_expressions = utils.get_converter(
+        models.Item
+    ).get_models_keyset_expressions(order_by="-name", cursor=cursor)
+
+    assert [
+        str(unary_expression["unary_expression"])
+        for unary_expression in unary_expressions
+    ] == [
+        "item.name DESC",
+        "item.id DESC",
+    ]
+    assert str(binary_expressions[0]["binary_expression"]) == (
+        "(item.name, item.id) < (:param_1, :param_2)"
+    )
+
+    cursor = encode_cursor(["name", 1, 1])
+
+    binary_expressions, _ = utils.get_converter(
+        models.Item
+    ).get_models_keyset_expressions(order_by=["name", "-number"], cursor=cursor)
+
+    assert str(binary_expressions[0]["binary_expression"]) == (
+        "item.name > :param_1 "
+        "OR item.name = :param_1 AND item.number < :param_2 "
+        "OR item.name = :param_1 AND item.number = :param_2 AND item.id < :param_3"
+    )
+
+
+def test_keyset_pagination__cursor_does_not_match__error():
+    with pytest.raises(ValueError) as e:
+        utils.apply_keyset_pagination(
+            query=select(models.Item),
+            order_by=["name", "number"],
+            cursor=encode_cursor(["name", 1]),
+            model=models.Item,
+        )
+    assert str(e.value) == "Cursor doesn't match order_by"
+
+
+@pytest.mark.parametrize("cursor", ["not a cursor", encode_cursor([])[:-1] + "{"])
+def test_decode_cursor__not_valid__error(cursor):
+    with pytest.raises(ValueError) as e:
+        decode_cursor(cursor)
+    assert str(e.value) == "Cursor is not valid"
+
+
+def test_encode_decode_cursor__ok():
+    values = [
+        None,
+        True,
+        1,
+        1.5,
+        "string",
+        dt.datetime(2024, 1, 2, 3, 4, 5, 6),
+        dt.date(2024, 1, 2),
+        dt.time(3, 4, 5),
+        decimal.Decimal("1.50"),
+        uuid.uuid4(),
+    ]
+
+    assert decode_cursor(encode_cursor(values)) == values
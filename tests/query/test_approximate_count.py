@@ -0,0 +1,124 @@
+import pytest
+from sqlalchemy import insert, text
+
+from dataclass_sqlalchemy_mixins.base import utils
+from dataclass_sqlalchemy_mixins.base.counts import (
+    COUNT_ESTIMATORS,
+    CountResult,
+    register_count_estimator,
+)
+from dataclass_sqlalchemy_mixins.base.mixins import SqlAlchemyFilterConverterMixin
+from dataclass_sqlalchemy_mixins.pydantic_mixins.sqlalchemy_base_models import (
+    SqlAlchemyFilterBaseModel,
+)
+from tests import models, sqlite_models
+
+
+@pytest.fixture
+def sqlite_session(sqlite_session):
+    sqlite_session.execute(
+        insert(sqlite_models.Item),
+        [{"id": i, "name": f"item_{i}", "number": i % 10} for i in range(1000)],
+    )
+    sqlite_session.execute(text("CREATE INDEX ix_item_number ON item (number)"))
+    sqlite_session.commit()
+    return sqlite_session
+
+
+def test_get_count__sqlite__no_statistics__exact(sqlite_session):
+    count = utils.get_count(
+        session=sqlite_session,
+        filters={"number": 1},
+        model=sqlite_models.Item,
+        estimate_threshold=10,
+    )
+
+    assert count == CountResult(count=100, is_approximate=False)
+
+
+@pytest.mark.parametrize(
+    ("filters", "estimate_threshold", "expected_count"),
+    [
+        (None, 500, CountResult(count=1000, is_approximate=True)),
+        ({"number": 1}, 50, CountResult(count=100, is_approximate=True)),
+        # Filters which can't be estimated are counted exactly
+        ({"name__like": "item_1%"}, 500, CountResult(count=111, is_approximate=False)),
+        ({"number__gt": 1}, 500, CountResult(count=800, is_approximate=False)),
+        ({"number": 1}, 500, CountResult(count=100, is_approximate=False)),
+        ({"id": 1}, 0, CountResult(count=1, is_approximate=False)),
+        ({"number": 1}, None, CountResult(count=100, is_approximate=False)),
+    ],
+)
+def test_get_count__sqlite__ok(
+    sqlite_session,
+    filters,
+    estimate_threshold,
+    expected_count,
+):
+    sqlite_session.execute(text("ANALYZE"))
+
+    count = utils.get_count(
+        session=sqlite_session,
+        filters=filters,
+        model=sqlite_models.Item,
+        estimate_threshold=estimate_threshold,
+    )
+
+    assert count == expected_count
+
+
+def test_get_count__converter_config__ok(sqlite_session):
+    sqlite_session.execute(text("ANALYZE"))
+
+    class ItemFilterModel(SqlAlchemyFilterBaseModel):
+        number: int = None
+
+        class ConverterConfig:
+            model = sqlite_models.Item
+            count_estimate_threshold = 50
+
+    assert ItemFilterModel(number=2).get_count(session=sqlite_session) == (100, True)
+    assert ItemFilterModel(number=2).get_count(
+        session=sqlite_session,
+        estimate_threshold=500,
+    ) == (100, False)
+
+
+def test_get_count__custom_estimator__ok(sqlite_session):
+    sqlite_estimator = COUNT_ESTIMATORS["sqlite"]
+
+    @register_count_estimator("sqlite")
+    def estimate(session, query, model):
+        return 10**6
+
+    try:
+        count = SqlAlchemyFilterConverterMixin().get_count(
+            session=sqlite_session,
+            filters={"number": 1},
+            model=sqlite_models.Item,
+            estimate_threshold=1000,
+        )
+    finally:
+        register_count_estimator("sqlite")(sqlite_estimator)
+
+    assert count == CountResult(count=10**6, is_approximate=True)
+
+
+def test_get_count__postgresql__ok(db_session):
+    db_session.execute(
+        insert(models.Item),
+        [{"name": f"item_{i}", "number": i % 4} for i in range(400)],
+    )
+    db_session.commit()
+    db_session.execute(text("ANALYZE item"))
+
+    for estimate_threshold, expected_is_approximate in ((50, True), (1000, False)):
+        count = utils.get_count(
+            session=db_session,
+            filters={"number": 1},
+            model=models.Item,
+            estimate_threshold=estimate_threshold,
+        )
+
+        assert count.count == 100
+        assert count.is_approximate is expected_is_approximate
@@ -0,0 +1,123 @@
+from sqlalchemy import select
+
+from dataclass_sqlalchemy_mixins.base import utils
+from dataclass_sqlalchemy_mixins.pydantic_mixins.sqlalchemy_base_models import (
+    SqlAlchemyFilterBaseModel,
+    SqlAlchemyQueryBaseModel,
+)
+from tests import models, models_factory
+
+
+def create_groups():
+    groups = []
+    for group_name, items_number in (
+        ("group_a", 3),
+        ("group_b", 2),
+        ("group_a", 0),
+    ):
+        group = models_factory.GroupFactory.create(name=group_name)
+        models_factory.ItemFactory.create_batch(
+            size=items_number,
+            group=group,
+            name="item",
+        )
+        groups.append(group)
+    return groups
+
+
+def test_get_count_query__no_ordering_and_subquery():
+    query = utils.get_count_query(
+        filters={"group__name": "group_a", "id__gte": 1},
+        model=models.Item,
+    )
+
+    assert str(query) == (
+        "SELECT count(*) AS count_1 \n"
+        'FROM item JOIN "group" ON "group".id = item.group_id \n'
+        'WHERE "group".name = :name_1 AND item.id >= :id_1'
+    )
+
+
+def test_get_count_query__foreign_key__no_join():
+    query = utils.get_count_query(filters={"group__id": 1}, model=models.Item)
+
+    assert "JOIN" not in str(query)
+
+
+def test_get_count_query__to_many__exists():
+    query = utils.get_count_query(
+        filters={"items__name": "item"},
+        model=models.Group,
+    )
+
+    assert "JOIN" not in str(query)
+    assert "EXISTS" in str(query)
+
+
+def test_get_count_query__ok(db_session):
+    create_groups()
+
+    for filters, model, expected_count in (
+        (None, models.Group, 3),
+        ({"name": "group_a"}, models.Group, 2),
+        # Groups are counted once regardless of the number of their items
+        ({"items__name": "item"}, models.Group, 2),
+        ({"group__name": "group_a"}, models.Item, 3),
+    ):
+        query = utils.get_count_query(filters=filters, model=model)
+
+        assert db_session.execute(query).scalar_one() == expected_count
+
+
+def test_add_total_count__ok(db_session):
+    create_groups()
+
+    query = utils.apply_query_spec(
+        query=select(models.Item),
+        filters={"group__name": "group_a"},
+        order_by="id",
+        limit=2,
+        model=models.Item,
+        with_total_count=True,
+    )
+    rows = db_session.execute(query).all()
+
+    assert len(rows) == 2
+    assert [row.total_count for row in rows] == [3, 3]
+
+    query = utils.add_total_count(select(models.Group.id), label="groups_number")
+    rows = db_session.execute(query).all()
+
+    assert {row.groups_number for row in rows} == {3}
+
+
+def test_get_count_query__base_model__ok(db_session):
+    create_groups()
+
+    class GroupFilterModel(SqlAlchemyFilterBaseModel):
+        name: str = None
+        items__name: str = None
+
+        class ConverterConfig:
+            model = models.Group
+
+    class ItemQueryModel(SqlAlchemyQueryBaseModel):
+        group__name: str = None
+
+        class ConverterConfig:
+            model = models.Item
+
+    filter_model = GroupFilterModel(name="group_a", items__name="item")
+    query_model = ItemQueryModel(group__name="group_b", order_by="-id", limit=1)
+
+    assert db_session.execute(filter_model.get_count_query()).scalar_one() == 1
+    assert db_session.execute(query_model.get_count_query()).scalar_one() == 2
+
+    query = query_model.apply_query_spec(
+        query=select(models.Item),
+        with_total_count=True,
+    )
+    rows = db_session.execute(query).all()
+
+    assert len(rows) == 1
+    assert rows[0].total_count == 2
@@ -0,0 +1,142 @@
+import pytest
+from sqlalchemy import select
+
+from dataclass_sqlalchemy_mixins.base import utils
+from dataclass_sqlalchemy_mixins.pydantic_mixins.sqlalchemy_base_models import (
+    BaseModelConverterExtraParams,
+    SqlAlchemyQueryBaseModel,
+)
+from tests import models, models_factory
+
+
+def create_items():
+    items = []
+    for group_name, owner_name in (
+        ("group_b", "owner_e"),
+        ("group_a", "owner_d"),
+        ("group_b", "owner_c"),
+        ("group_a", "owner_b"),
+        ("group_b", "owner_a"),
+    ):
+        items.append(
+            models_factory.ItemFactory.create(
+                group=models_factory.GroupFactory.create(
+                    name=group_name,
+                    owner=models_factory.OwnerFactory.create(first_name=owner_name),
+                )
+            )
+        )
+    return items
+
+
+@pytest.mark.parametrize(
+    ("query_type", "joined"),
+    [
+        ("select", True),
+        ("select", False),
+        ("query", True),
+        ("query", False),
+    ],
+)
+def test_apply_query_spec__utils__ok(
+    db_session,
+    query_type,
+    joined,
+):
+    items = create_items()
+
+    expected_items = [items[4], items[2], items[0]]
+
+    if query_type == "select":
+        query = select(models.Item)
+    else:
+        query = db_session.query(models.Item)
+
+    if joined:
+        query = query.join(models.Group)
+
+    query = utils.apply_query_spec(
+        query=query,
+        filters={"group__name": "group_b"},
+        order_by=["group__owner__first_name"],
+        model=models.Item,
+    )
+
+    if query_type == "select":
+        compiled_query = str(query)
+        results = db_session.execute(query).scalars().all()
+    else:
+        compiled_query = str(query.statement)
+        results = query.all()
+
+    assert compiled_query.count('JOIN "group"') == 1
+    assert compiled_query.count('JOIN "Owner"') == 1
+
+    assert [result.as_dict() for result in results] == [
+        expected_item.as_dict() for expected_item in expected_items
+    ]
+
+
+def test_apply_query_spec__utils__pagination__ok(db_session):
+    items = create_items()
+
+    query = utils.apply_query_spec(
+        query=select(models.Item),
+        order_by="-group__owner__first_name",
+        limit=2,
+        offset=1,
+        model=models.Item,
+    )
+    results = db_session.execute(query).scalars().all()
+
+    assert [result.as_dict() for result in results] == [
+        items[1].as_dict(),
+        items[2].as_dict(),
+    ]
+
+
+def test_apply_query_spec__utils__empty__ok():
+    query = select(models.Item)
+
+    assert utils.apply_query_spec(query=query, model=models.Item) is query
+
+
+def test_apply_query_spec__base_model__ok(db_session):
+    items = create_items()
+
+    class ItemsQueryModel(SqlAlchemyQueryBaseModel):
+        group__name__in: str = None
+
+        class ConverterConfig:
+            model = models.Item
+            extra = {
+                BaseModelConverterExtraParams.LIST_AS_STRING: {
+                    "fields": ["group__name__in", "order_by"],
+                }
+            }
+
+    query_model = ItemsQueryModel(
+        group__name__in="group_a, group_b",
+        order_by="-group__name, group__owner__first_name",
+        limit=3,
+    )
+
+    assert query_model.to_binary_expressions()[0].right.value == [
+        "group_a",
+        "group_b",
+    ]
+
+    query = query_model.apply_query_spec(query=select(models.Item))
+    results = db_session.execute(query).scalars().all()
+
+    assert str(query).count("JOIN") == 2
+    assert [result.as_dict() for result in results] == [
+        items[4].as_dict(),
+        items[2].as_dict(),
+        items[0].as_dict(),
+    ]
+
+    query = query_model.apply_filters(query=select(models.Item))
+    results = db_session.execute(query).scalars().all()
+
+    assert len(results) == 5
@@ -0,0 +1,101 @@
+import typing as tp
+
+import pytest
+from sqlalchemy import event, insert, select
+
+from dataclass_sqlalchemy_mixins.base import utils
+from dataclass_sqlalchemy_mixins.pydantic_mixins.sqlalchemy_base_models import (
+    SqlAlchemyFilterBaseModel,
+    SqlAlchemyOrderBaseModel,
+)
+from dataclass_sqlalchemy_mixins.pydantic_mixins.streaming import stream
+from tests import models
+
+
+ITEMS_NUMBER = 2500
+
+
+class ItemFilterModel(SqlAlchemyFilterBaseModel):
+    number__gte: int = None
+    name__like: str = None
+
+    class ConverterConfig:
+        model = models.Item
+
+
+class ItemOrderModel(SqlAlchemyOrderBaseModel):
+    order_by: tp.Optional[tp.Union[str, tp.List[str]]] = None
+
+    class ConverterConfig:
+        model = models.Item
+
+
+@pytest.fixture
+def items(db_session):
+    db_session.execute(
+        insert(models.Item),
+        [{"name": f"item_{i}", "number": i} for i in range(ITEMS_NUMBER)],
+    )
+    db_session.commit()
+
+
+@pytest.fixture
+def cursor_names(engine):
+    # psycopg2 uses named cursors for server-side cursors
+    names = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, many):
+        names.append(cursor.name)
+
+    event.listen(engine, "before_cursor_execute", before_cursor_execute)
+    yield names
+    event.remove(engine, "before_cursor_execute", before_cursor_execute)
+
+
+def test_stream__utils__ok(db_session, items, cursor_names):
+    results = utils.stream(
+        session=db_session,
+        query=select(models.Item),
+        filters={"number__gte": 100},
+        order_by="-number",
+        model=models.Item,
+        yield_per=100,
+    )
+
+    numbers = [item.number for item in results]
+
+    assert numbers == list(range(ITEMS_NUMBER - 1, 99, -1))
+    assert cursor_names[-1] is not None
+
+
+def test_stream__models__ok(db_session, items, cursor_names):
+    results = stream(
+        session=db_session,
+        query=select(models.Item.number, models.Item.name),
+        filter_model=ItemFilterModel(number__gte=10, name__like="item_1%"),
+        order_model=ItemOrderModel(order_by="number"),
+        yield_per=10,
+    )
+
+    rows = list(results)
+
+    assert rows[:3] == [(10, "item_10"), (11, "item_11"), (12, "item_12")]
+    assert len(rows) == 1110
+    assert cursor_names[-1] is not None
+
+
+def test_stream__stopped_early__ok(db_session, items):
+    results = utils.stream(
+        session=db_session,
+        query=select(models.Item.id),
+        order_by="id",
+        model=models.Item,
+        yield_per=10,
+    )
+
+    first_id = next(results)
+    results.close()
+
+    # Session can be used after a stream is closed
+    query = select(models.Item.id).order_by(models.Item.id)
+    assert db_session.execute(query).scalars().first() == first_id
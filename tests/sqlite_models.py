@@ -0,0 +1,37 @@
+import sqlalchemy as sa
+from sqlalchemy.orm import declarative_base, relationship
+
+
+# Models of tests using an in-memory SQLite database,
+# which doesn't support sequences of tests.models
+Base = declarative_base()
+
+
+class Owner(Base):
+    __tablename__ = "owner"
+
+    id = sa.Column(sa.Integer, primary_key=True)
+    name = sa.Column(sa.String, index=True)
+
+
+class Group(Base):
+    __tablename__ = "group"
+
+    id = sa.Column(sa.Integer, primary_key=True)
+    name = sa.Column(sa.String)
+    owner_id = sa.Column(sa.Integer, sa.ForeignKey(Owner.id))
+
+    owner = relationship(Owner)
+
+
+class Item(Base):
+    __tablename__ = "item"
+
+    id = sa.Column(sa.Integer, primary_key=True)
+    name = sa.Column(sa.String)
+    number = sa.Column(sa.Integer)
+    created_at = sa.Column(sa.DateTime)
+    code = sa.Column(sa.String, unique=True)
+    group_id = sa.Column(sa.Integer, sa.ForeignKey(Group.id))
+
+    group = relationship(Group, backref="items")